@@ -9,7 +9,7 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
-from agent_bridge.utils import Colors
+from agent_bridge.utils import Colors, is_nonempty_dir
 
 
 def main():
@@ -228,7 +228,7 @@ def _preflight_validation(args, project_path: Path, registry) -> Optional[str]:
         conv = registry.get(ide)
         if conv:
             output_dir = project_path / conv.format_info.output_dir
-            if output_dir.exists() and any(output_dir.iterdir()) and not getattr(args, 'force', False):
+            if is_nonempty_dir(output_dir) and not getattr(args, 'force', False):
                 existing_ides.append(ide)
     
     if existing_ides:
@@ -426,13 +426,15 @@ def _handle_clean(args, registry):
             print(f"  🗑  {f.relative_to(project)}")
         if len(files_to_delete) > 8:
             print(f"  ... and {len(files_to_delete) - 8} more files")
+        # Every ancestor of a file to delete, so the empty-dir check is a set lookup
+        dirs_with_files = {parent for f in files_to_delete for parent in f.parents}
         for d in dirs_to_delete:
-            if not any(d in f.parents for f in files_to_delete):
+            if d not in dirs_with_files:
                 print(f"  🗑  {d.relative_to(project)}/ (empty dir)")
         for f in extra_files:
             print(f"  🗑  {f.relative_to(project)}")
 
-        total = len(files_to_delete) + len(extra_files) + sum(1 for d in dirs_to_delete if not list(d.rglob("*")))
+        total = len(files_to_delete) + len(extra_files) + sum(1 for d in dirs_to_delete if not is_nonempty_dir(d))
         confirm = questionary.confirm(
             f"\nDelete from {len(formats)} IDE(s)?",
             default=False,
@@ -566,8 +568,9 @@ def _handle_direct_convert(args, registry):
     name = args.format
     conv = registry.get(name)
     if conv:
-        result = conv.convert(source, Path.cwd(), verbose=True)
-        conv.install_mcp(source, Path.cwd())
+        project = Path.cwd()
+        result = conv.convert(source, project, verbose=True)
+        conv.install_mcp(source, project)
         if result.ok:
             print(f"{Colors.GREEN}{name} conversion complete!{Colors.ENDC}")
 
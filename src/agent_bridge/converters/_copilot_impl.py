@@ -4,16 +4,21 @@ Implementation logic cho GitHub Copilot converter.
 Separated so that converters/copilot.py chi chua BaseConverter wrapper.
 """
 
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
 
 from agent_bridge.core.agent_registry import get_agent_role as _get_role
-from agent_bridge.core.frontmatter import FrontmatterParser
+from agent_bridge.core.frontmatter import RE_FRONTMATTER_BLOCK, FrontmatterParser, YamlDumper, YamlLoader
 from agent_bridge.core.types import CapturedFile, CaptureStatus
+from agent_bridge.utils.content_cache import UNCHANGED, ContentHashCache, convert_changed, index_path_for
+from agent_bridge.utils.filesystem import CONVERT_POOL_SIZE, scan_dir, scan_md_files
+
 
 # Map agent slug → subagents list (derived from registry for backward compat)
 def _build_subagents_map() -> Dict[str, List[str]]:
@@ -56,6 +61,7 @@ _RE_SKILL_PATTERNS = [
     re.compile(r"`([a-z][a-z0-9\-]+)`\s*skill", re.IGNORECASE),
     re.compile(r"uses?\s+(?:the\s+)?`([a-z][a-z0-9\-]+)`", re.IGNORECASE),
 ]
+_RE_SKILL_SPLIT = re.compile(r"[,\s]+")
 
 
 def extract_agent_metadata(content: str, filename: str) -> Dict[str, Any]:
@@ -80,13 +86,16 @@ def extract_agent_metadata(content: str, filename: str) -> Dict[str, Any]:
         if role_match and not metadata.get("role"):
             metadata["role"] = role_match.group(1).strip()[:300]
             break
+    # Set-backed dedupe: skill mentions repeat across patterns and sections
+    skills = metadata["skills"]
+    seen = {s for s in skills if isinstance(s, str)}
     for pattern in _RE_SKILL_PATTERNS:
         for match in pattern.finditer(content):
-            skills_str = match.group(1)
-            for skill in re.split(r"[,\s]+", skills_str):
+            for skill in _RE_SKILL_SPLIT.split(match.group(1)):
                 skill = skill.strip().strip("`\"'")
-                if skill and skill not in metadata["skills"]:
-                    metadata["skills"].append(skill)
+                if skill and skill not in seen:
+                    seen.add(skill)
+                    skills.append(skill)
     return metadata
 
 
@@ -125,7 +134,7 @@ def generate_copilot_frontmatter(agent_slug: str, metadata: Dict[str, Any]) -> s
     
     if agent_slug in ["code-archaeologist"]:
         frontmatter["user-invokable"] = False
-    return yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
+    return yaml.dump(frontmatter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
 
 
 def convert_agent_to_copilot(source_path: Path, dest_path: Path) -> bool:
@@ -135,7 +144,7 @@ def convert_agent_to_copilot(source_path: Path, dest_path: Path) -> bool:
         agent_slug = source_path.stem.lower()
         metadata = extract_agent_metadata(content, source_path.name)
         frontmatter = generate_copilot_frontmatter(agent_slug, metadata)
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
+        content_clean = FrontmatterParser.split(content)[1]
         COPILOT_PROMPT_MAX_CHARS = 30000
         body = content_clean.strip()
         if len(body) > COPILOT_PROMPT_MAX_CHARS:
@@ -143,7 +152,8 @@ def convert_agent_to_copilot(source_path: Path, dest_path: Path) -> bool:
             body = body[: COPILOT_PROMPT_MAX_CHARS - len(truncate_suffix)] + truncate_suffix
         output = f"---\n{frontmatter}---\n\n{body}\n"
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        # Bytes write: LF endings on every OS, no text-layer newline pass
+        dest_path.write_bytes(output.encode("utf-8"))
         return True
     except Exception as e:
         print(f"  Error converting agent {source_path.name}: {e}")
@@ -156,17 +166,18 @@ def convert_skill_to_copilot(source_dir: Path, dest_dir: Path) -> bool:
         skill_name = source_dir.name
         dest_skill_dir = dest_dir / skill_name
         dest_skill_dir.mkdir(parents=True, exist_ok=True)
-        skill_file = source_dir / "SKILL.md"
-        if not skill_file.exists():
-            md_files = list(source_dir.glob("*.md"))
-            skill_file = md_files[0] if md_files else None
-        if skill_file and skill_file.exists():
+        # One scandir answers the SKILL.md lookup and drives the copy loop below
+        entries = scan_dir(source_dir)
+        skill_file = next((Path(e.path) for e in entries if e.name == "SKILL.md"), None)
+        if skill_file is None:
+            skill_file = next((Path(e.path) for e in entries if e.name.endswith(".md")), None)
+        if skill_file:
             content = skill_file.read_text(encoding="utf-8")
             existing_meta = {}
-            frontmatter_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+            frontmatter_match = RE_FRONTMATTER_BLOCK.match(content)
             if frontmatter_match:
                 try:
-                    existing_meta = yaml.safe_load(frontmatter_match.group(1)) or {}
+                    existing_meta = yaml.load(frontmatter_match.group(1), Loader=YamlLoader) or {}
                     content = content[frontmatter_match.end():]
                 except yaml.YAMLError:
                     pass
@@ -189,16 +200,18 @@ def convert_skill_to_copilot(source_dir: Path, dest_dir: Path) -> bool:
             for key, value in existing_meta.items():
                 if key not in ("name", "description") and key not in SKIP_FIELDS:
                     frontmatter[key] = value
-            yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, width=1000, sort_keys=False)
+            yaml_str = yaml.dump(frontmatter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, width=1000, sort_keys=False)
             output = f"---\n{yaml_str}---\n\n{content.strip()}\n"
-            (dest_skill_dir / "SKILL.md").write_text(output, encoding="utf-8")
+            (dest_skill_dir / "SKILL.md").write_bytes(output.encode("utf-8"))
         SKIP_DIRS = {"node_modules", ".git", "__pycache__", ".venv", "venv", "dist", "build"}
-        for item in source_dir.iterdir():
+        # Plain string paths from here on: no Path object per copied entry
+        dest_skill_str = os.fspath(dest_skill_dir)
+        for item in entries:
             if item.is_dir():
                 if item.name not in SKIP_DIRS and not item.name.startswith("."):
-                    shutil.copytree(item, dest_skill_dir / item.name, dirs_exist_ok=True)
-            elif item.name != "SKILL.md" and item.suffix in (".md", ".txt", ".json", ".yaml", ".yml", ".py", ".sh"):
-                shutil.copy2(item, dest_skill_dir / item.name)
+                    shutil.copytree(item.path, os.path.join(dest_skill_str, item.name), dirs_exist_ok=True)
+            elif item.name != "SKILL.md" and os.path.splitext(item.name)[1] in (".md", ".txt", ".json", ".yaml", ".yml", ".py", ".sh"):
+                shutil.copy2(item.path, os.path.join(dest_skill_str, item.name))
         return True
     except Exception as e:
         print(f"  Error converting skill {source_dir.name}: {e}")
@@ -211,10 +224,10 @@ def convert_workflow_to_prompt(source_path: Path, dest_path: Path) -> bool:
         dest_path.parent.mkdir(parents=True, exist_ok=True)
         content = source_path.read_text(encoding="utf-8")
         existing_meta = {}
-        frontmatter_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+        frontmatter_match = RE_FRONTMATTER_BLOCK.match(content)
         if frontmatter_match:
             try:
-                existing_meta = yaml.safe_load(frontmatter_match.group(1)) or {}
+                existing_meta = yaml.load(frontmatter_match.group(1), Loader=YamlLoader) or {}
                 content = content[frontmatter_match.end():]
             except yaml.YAMLError:
                 pass
@@ -234,11 +247,11 @@ def convert_workflow_to_prompt(source_path: Path, dest_path: Path) -> bool:
         if "argument-hint" in existing_meta:
             frontmatter["argument-hint"] = existing_meta["argument-hint"]
         if frontmatter:
-            yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, width=1000, sort_keys=False)
+            yaml_str = yaml.dump(frontmatter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, width=1000, sort_keys=False)
             output = f"---\n{yaml_str}---\n\n{content.strip()}\n"
         else:
             output = content.strip() + "\n"
-        dest_path.write_text(output, encoding="utf-8")
+        dest_path.write_bytes(output.encode("utf-8"))
         return True
     except Exception as e:
         print(f"  Error converting workflow {source_path.name}: {e}")
@@ -251,10 +264,10 @@ def convert_rule_to_instruction(source_path: Path, dest_path: Path) -> bool:
         dest_path.parent.mkdir(parents=True, exist_ok=True)
         content = source_path.read_text(encoding="utf-8")
         existing_meta = {}
-        frontmatter_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+        frontmatter_match = RE_FRONTMATTER_BLOCK.match(content)
         if frontmatter_match:
             try:
-                existing_meta = yaml.safe_load(frontmatter_match.group(1)) or {}
+                existing_meta = yaml.load(frontmatter_match.group(1), Loader=YamlLoader) or {}
                 content = content[frontmatter_match.end():]
             except yaml.YAMLError:
                 pass
@@ -272,11 +285,11 @@ def convert_rule_to_instruction(source_path: Path, dest_path: Path) -> bool:
             elif isinstance(trigger, str) and "*" in trigger:
                 frontmatter["applyTo"] = trigger
         if frontmatter:
-            yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, width=1000, sort_keys=False)
+            yaml_str = yaml.dump(frontmatter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, width=1000, sort_keys=False)
             output = f"---\n{yaml_str}---\n\n{content.strip()}\n"
         else:
             output = content.strip() + "\n"
-        dest_path.write_text(output, encoding="utf-8")
+        dest_path.write_bytes(output.encode("utf-8"))
         return True
     except Exception as e:
         print(f"  Error converting rule {source_path.name}: {e}")
@@ -295,53 +308,81 @@ def convert_to_copilot(source_root: Path, dest_root: Path, verbose: bool = True)
     rules_src = source_root / ".agent" / "rules"
     rules_dest = dest_root / ".github" / "instructions"
 
-    if agents_src.exists():
-        if verbose:
-            print("Converting agents to Copilot format...")
-        for agent_file in agents_src.glob("*.md"):
-            dest_file = agents_dest / agent_file.name.replace(".md", ".agent.md")
-            if convert_agent_to_copilot(agent_file, dest_file):
-                stats["agents"] += 1
-                if verbose:
-                    print(f"  {agent_file.name}")
-            else:
-                stats["errors"].append(f"agent:{agent_file.name}")
-
-    if skills_src.exists():
-        if verbose:
-            print("Converting skills to Copilot format...")
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
-                if convert_skill_to_copilot(skill_dir, skills_dest):
+    # Each conversion reads one source and writes its own output, so a section's
+    # files convert on a pool; results come back in source order for reporting.
+    with ThreadPoolExecutor(max_workers=CONVERT_POOL_SIZE) as pool:
+        hash_cache = ContentHashCache(index_path_for(dest_root, "copilot"))
+
+        if agents_src.exists():
+            if verbose:
+                print("Converting agents to Copilot format...")
+            agent_files = scan_md_files(agents_src)
+            results = convert_changed(
+                pool, hash_cache, "agents", convert_agent_to_copilot,
+                agent_files, [agents_dest / f.name.replace(".md", ".agent.md") for f in agent_files],
+            )
+            progress: List[str] = []
+            for agent_file, ok in zip(agent_files, results):
+                if ok:
+                    stats["agents"] += 1
+                    progress.append(f"  {agent_file.name}{' (unchanged)' if ok is UNCHANGED else ''}")
+                else:
+                    stats["errors"].append(f"agent:{agent_file.name}")
+            if verbose and progress:
+                print("\n".join(progress))
+
+        if skills_src.exists():
+            if verbose:
+                print("Converting skills to Copilot format...")
+            skill_dirs = [Path(e.path) for e in scan_dir(skills_src) if e.is_dir()]
+            skill_results = pool.map(convert_skill_to_copilot, skill_dirs, [skills_dest] * len(skill_dirs))
+            progress = []
+            for skill_dir, ok in zip(skill_dirs, skill_results):
+                if ok:
                     stats["skills"] += 1
-                    if verbose:
-                        print(f"  {skill_dir.name}")
+                    progress.append(f"  {skill_dir.name}")
                 else:
                     stats["errors"].append(f"skill:{skill_dir.name}")
+            if verbose and progress:
+                print("\n".join(progress))
 
-    if workflows_src.exists():
-        if verbose:
-            print("Converting workflows to Copilot prompt files...")
-        for workflow_file in workflows_src.glob("*.md"):
-            dest_file = workflows_dest / workflow_file.name.replace(".md", ".prompt.md")
-            if convert_workflow_to_prompt(workflow_file, dest_file):
-                stats["workflows"] += 1
-                if verbose:
-                    print(f"  {workflow_file.name}")
-            else:
-                stats["errors"].append(f"workflow:{workflow_file.name}")
-
-    if rules_src.exists():
-        if verbose:
-            print("Converting rules to Copilot instructions...")
-        for rule_file in rules_src.glob("*.md"):
-            dest_file = rules_dest / rule_file.name.replace(".md", ".instructions.md")
-            if convert_rule_to_instruction(rule_file, dest_file):
-                stats["rules"] += 1
-                if verbose:
-                    print(f"  {rule_file.name}")
-            else:
-                stats["errors"].append(f"rule:{rule_file.name}")
+        if workflows_src.exists():
+            if verbose:
+                print("Converting workflows to Copilot prompt files...")
+            workflow_files = scan_md_files(workflows_src)
+            results = convert_changed(
+                pool, hash_cache, "prompts", convert_workflow_to_prompt,
+                workflow_files, [workflows_dest / f.name.replace(".md", ".prompt.md") for f in workflow_files],
+            )
+            progress = []
+            for workflow_file, ok in zip(workflow_files, results):
+                if ok:
+                    stats["workflows"] += 1
+                    progress.append(f"  {workflow_file.name}{' (unchanged)' if ok is UNCHANGED else ''}")
+                else:
+                    stats["errors"].append(f"workflow:{workflow_file.name}")
+            if verbose and progress:
+                print("\n".join(progress))
+
+        if rules_src.exists():
+            if verbose:
+                print("Converting rules to Copilot instructions...")
+            rule_files = scan_md_files(rules_src)
+            results = convert_changed(
+                pool, hash_cache, "instructions", convert_rule_to_instruction,
+                rule_files, [rules_dest / f.name.replace(".md", ".instructions.md") for f in rule_files],
+            )
+            progress = []
+            for rule_file, ok in zip(rule_files, results):
+                if ok:
+                    stats["rules"] += 1
+                    progress.append(f"  {rule_file.name}{' (unchanged)' if ok is UNCHANGED else ''}")
+                else:
+                    stats["errors"].append(f"rule:{rule_file.name}")
+            if verbose and progress:
+                print("\n".join(progress))
+
+        hash_cache.save()
 
     # Run external skill plugins (declarative, config-driven via .agent/plugins.json)
     from agent_bridge.core.plugins import PluginRunner
@@ -458,7 +499,7 @@ def apply_reverse_capture_copilot(
 
     if top_dir == "agents":
         content = ide_path.read_text(encoding="utf-8")
-        body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+        body = FrontmatterParser.split(content)[1].strip()
         agent_path.parent.mkdir(parents=True, exist_ok=True)
         agent_path.write_text(body, encoding="utf-8")
         return True
@@ -466,17 +507,17 @@ def apply_reverse_capture_copilot(
     if top_dir == "skills":
         skill_dir = ide_path.parent
         content = ide_path.read_text(encoding="utf-8")
-        fm_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+        fm_match = RE_FRONTMATTER_BLOCK.match(content)
         if fm_match:
             try:
-                fm = yaml.safe_load(fm_match.group(1)) or {}
+                fm = yaml.load(fm_match.group(1), Loader=YamlLoader) or {}
                 body = content[fm_match.end() :].strip()
                 fm_clean = {k: v for k, v in fm.items() if k in ("name", "description")}
                 if fm_clean:
-                    fm_str = yaml.dump(fm_clean, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                    fm_str = yaml.dump(fm_clean, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
                     body = f"---\n{fm_str}---\n\n{body}\n"
             except yaml.YAMLError:
-                body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+                body = FrontmatterParser.split(content)[1].strip()
         else:
             body = content.strip()
         dest_skill_dir = agent_dir / "skills" / skill_dir.name
@@ -492,29 +533,29 @@ def apply_reverse_capture_copilot(
 
     if top_dir == "prompts":
         content = ide_path.read_text(encoding="utf-8")
-        fm_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+        fm_match = RE_FRONTMATTER_BLOCK.match(content)
         if fm_match:
             try:
-                fm = yaml.safe_load(fm_match.group(1)) or {}
+                fm = yaml.load(fm_match.group(1), Loader=YamlLoader) or {}
                 body = content[fm_match.end() :].strip()
                 fm_clean = {k: v for k, v in fm.items() if k not in ("tools", "argument-hint")}
                 if fm_clean:
-                    fm_str = yaml.dump(fm_clean, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                    fm_str = yaml.dump(fm_clean, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
                     body = f"---\n{fm_str}---\n\n{body}\n"
             except yaml.YAMLError:
-                body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+                body = FrontmatterParser.split(content)[1].strip()
         else:
-            body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+            body = FrontmatterParser.split(content)[1].strip()
         agent_path.parent.mkdir(parents=True, exist_ok=True)
         agent_path.write_text(body, encoding="utf-8")
         return True
 
     if top_dir == "instructions":
         content = ide_path.read_text(encoding="utf-8")
-        fm_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+        fm_match = RE_FRONTMATTER_BLOCK.match(content)
         if fm_match:
             try:
-                fm = yaml.safe_load(fm_match.group(1)) or {}
+                fm = yaml.load(fm_match.group(1), Loader=YamlLoader) or {}
                 body = content[fm_match.end() :].strip()
                 
                 # Strip IDE-specific fields
@@ -530,14 +571,14 @@ def apply_reverse_capture_copilot(
                 
                 # Only write frontmatter if there are remaining fields
                 if fm:
-                    fm_str = yaml.dump(fm, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                    fm_str = yaml.dump(fm, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
                     body = f"---\n{fm_str}---\n\n{body}\n"
                 else:
                     body = f"{body}\n"
             except yaml.YAMLError:
-                body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+                body = FrontmatterParser.split(content)[1].strip()
         else:
-            body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+            body = FrontmatterParser.split(content)[1].strip()
         agent_path.parent.mkdir(parents=True, exist_ok=True)
         agent_path.write_text(body, encoding="utf-8")
         return True
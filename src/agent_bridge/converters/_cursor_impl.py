@@ -15,10 +15,11 @@ MDC Format: description, globs, alwaysApply frontmatter
 import re
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import yaml
 
+from agent_bridge.core.skill_metadata import get_cursor_config
 from agent_bridge.core.types import CapturedFile, CaptureStatus
 
 # Credit line appended to generated files. Set to "" to disable.
@@ -33,7 +34,7 @@ RE_CREDIT_LINE = re.compile(r"\n*---\n\*Generated by \[Agent Bridge\].*?\*\n?",
 # =============================================================================
 
 # MDC RULES: Auto-activation based on file matching (Globs)
-MDC_RULES_CONFIG = {
+MDC_RULES_CONFIG: Dict[str, Dict[str, Any]] = {
     "clean-code": {"alwaysApply": True, "globs": "", "description": "Core coding standards"},
     "behavioral-modes": {"alwaysApply": True, "globs": "", "description": "Agent behavioral guidelines"},
     "nextjs-react-expert": {
@@ -159,7 +160,7 @@ def convert_agent_to_cursor(source_path: Path, dest_path: Path) -> bool:
             "name": agent_name,
             "description": description
         }
-        yaml_text = yaml.dump(fm, sort_keys=False, allow_unicode=True).strip()
+        yaml_text = yaml.dump(fm, sort_keys=False, allow_unicode=True, width=1000).strip()
         header = f"---\n{yaml_text}\n---"
 
         # Remove existing frontmatter from content
@@ -194,16 +195,8 @@ def convert_skill_to_cursor(source_dir: Path, rules_dest: Path, skills_dest: Pat
                 content_clean += f"\n\n---\n\n{additional_clean}"
 
         # OPTION A: Convert to MDC Rule (Auto-attach)
-        # Try centralized registry first, fallback to hardcoded map
-        config = None
-        try:
-            from agent_bridge.core.skill_metadata import get_cursor_config
-            config = get_cursor_config(skill_name)
-        except ImportError:
-            pass
-        
-        if not config and skill_name in MDC_RULES_CONFIG:
-            config = MDC_RULES_CONFIG[skill_name]
+        # Try centralized registry first, fallback to hardcoded map (two dict lookups)
+        config: Optional[Mapping[str, Any]] = get_cursor_config(skill_name) or MDC_RULES_CONFIG.get(skill_name)
         
         if config:
             frontmatter = generate_mdc_frontmatter(
@@ -268,7 +261,7 @@ def convert_workflow_to_cursor_skill(source_path: Path, skills_dest: Path) -> bo
             "name": normalized_name,
             "description": description
         }
-        yaml_text = yaml.dump(fm, sort_keys=False, allow_unicode=True).strip()
+        yaml_text = yaml.dump(fm, sort_keys=False, allow_unicode=True, width=1000).strip()
         header = f"---\n{yaml_text}\n---\n\n"
         (skill_folder / "SKILL.md").write_text(f"{header}{content_clean.strip()}{CREDIT_LINE}", encoding="utf-8")
         return True
@@ -302,10 +295,14 @@ def create_project_instructions(dest_root: Path, source_root: Path) -> bool:
                 always_apply=True,  # Project instructions always apply
             )
 
-            combined = "\n\n---\n\n".join(content_parts)
-            output = f"{frontmatter}\n\n{combined}{CREDIT_LINE}"
-
-            (rules_dir / "project-instructions.mdc").write_text(output, encoding="utf-8")
+            # Stream the parts out rather than building one large joined string
+            with open(rules_dir / "project-instructions.mdc", "wb") as f:
+                f.write(f"{frontmatter}\n\n".encode())
+                for i, part in enumerate(content_parts):
+                    if i:
+                        f.write(b"\n\n---\n\n")
+                    f.write(part.encode("utf-8"))
+                f.write(CREDIT_LINE.encode("utf-8"))
             return True
 
         return False
@@ -385,7 +382,7 @@ def convert_to_cursor(source_root: Path, dest_root: Path, verbose: bool = True)
     if verbose:
         print("\nCursor v2.4 conversion complete!")
         print(f"  - Agents: {stats['agents']}")
-        print(f"  - Rules (MDC): {len(list(rules_dest.glob('*.mdc'))) if rules_dest.exists() else 0}")
+        print(f"  - Rules (MDC): {sum(1 for _ in rules_dest.glob('*.mdc'))}")
         print(f"  - Commands/Skills: {stats['skills'] + stats['workflows']}")
         if stats["errors"]:
             print(f"  Errors: {len(stats['errors'])}")
@@ -15,13 +15,31 @@ import json
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml
 
+from agent_bridge.core.frontmatter import RE_FRONTMATTER_BLOCK, FrontmatterParser, parse_flat_yaml
 from agent_bridge.core.types import CapturedFile, CaptureStatus
 from agent_bridge.utils import Colors
+from agent_bridge.utils.content_cache import (
+    UNCHANGED,
+    ContentHashCache,
+    content_digest,
+    convert_changed,
+    index_path_for,
+)
+from agent_bridge.utils.filesystem import (
+    CONVERT_POOL_SIZE,
+    decode_text,
+    dumps_json,
+    mirror_tree,
+    read_files_parallel,
+    scan_dir,
+    scan_md_files,
+)
 
 # =============================================================================
 # KIRO AGENT CONFIGURATION
@@ -49,6 +67,12 @@ INTERNAL_TO_KIRO_TOOL_MAP = {
     "use_mcp": None,         # Khong can map, MCP tools dung @server pattern
 }
 
+# Knowledge resources dung chung cho moi agent (khong phu thuoc agent/skill)
+KIRO_AGENT_RESOURCES = ("file://.kiro/steering/**/*.md", "file://.kiro/skills/**/SKILL.md")
+
+# Hook chay khi agent khoi dong
+KIRO_AGENT_SPAWN_HOOK = {"command": "git status --short 2>/dev/null || true", "timeout_ms": 3000}
+
 # =============================================================================
 # KIRO CONFIG FROM CENTRAL REGISTRY
 # =============================================================================
@@ -94,22 +118,33 @@ def _role_to_kiro_config(slug: str) -> dict:
     return config
 
 
+def _append_unique(items: List[str], extra: List[str]) -> None:
+    """Append each of extra not already in items, keeping order (set lookups, not list scans)."""
+    seen = set(items)
+    for item in extra:
+        if item not in seen:
+            seen.add(item)
+            items.append(item)
+
+
 # =============================================================================
 # METADATA EXTRACTION
 # =============================================================================
 
 
+_RE_H1_NAME = re.compile(r"^#\s+(.+?)(?:\s*[-–—]\s*(.+))?$", re.MULTILINE)
+_RE_ROLE_DESC = re.compile(r"(?:You are|Role:|Description:)\s*(.+?)(?:\n\n|\n#)", re.IGNORECASE | re.DOTALL)
+
+
 def extract_agent_metadata(content: str, filename: str) -> Dict[str, Any]:
     """Extract metadata from agent markdown content."""
-    from agent_bridge.core.frontmatter import FrontmatterParser
-
     metadata: Dict[str, Any] = {"name": "", "description": "", "instructions": ""}
 
     existing, _ = FrontmatterParser.extract(content)
     if existing:
         metadata.update(existing)
 
-    name_match = re.search(r"^#\s+(.+?)(?:\s*[-–—]\s*(.+))?$", content, re.MULTILINE)
+    name_match = _RE_H1_NAME.search(content)
     if name_match:
         if not metadata.get("name"):
             metadata["name"] = name_match.group(1).strip()
@@ -120,9 +155,7 @@ def extract_agent_metadata(content: str, filename: str) -> Dict[str, Any]:
         metadata["name"] = filename.replace(".md", "").replace("-", " ").title()
 
     if not metadata.get("description"):
-        desc_match = re.search(
-            r"(?:You are|Role:|Description:)\s*(.+?)(?:\n\n|\n#)", content, re.IGNORECASE | re.DOTALL
-        )
+        desc_match = _RE_ROLE_DESC.search(content)
         if desc_match:
             metadata["description"] = desc_match.group(1).strip()[:200]
 
@@ -166,10 +199,7 @@ def generate_kiro_agent_json(
 
     # Them MCP servers vao danh sach tools (Kiro spec: @server_name)
     if mcp_server_names:
-        for mcp in mcp_server_names:
-            mcp_tool_ref = f"@{mcp}"
-            if mcp_tool_ref not in base_tools:
-                base_tools.append(mcp_tool_ref)
+        _append_unique(base_tools, [f"@{mcp}" for mcp in mcp_server_names])
 
     # === ALLOWED TOOLS (Auto-approve) ===
     # Auto-approve TOAN BO tools ma agent duoc cung cap (built-in + MCP)
@@ -178,10 +208,7 @@ def generate_kiro_agent_json(
 
     # Them wildcard pattern cho MCP servers de auto-approve moi tool cua server
     if mcp_server_names:
-        for mcp in mcp_server_names:
-            trust_pattern = f"@{mcp}/*"
-            if trust_pattern not in allowed_tools:
-                allowed_tools.append(trust_pattern)
+        _append_unique(allowed_tools, [f"@{mcp}/*" for mcp in mcp_server_names])
 
     # === XAY DUNG AGENT JSON ===
     agent_json = {
@@ -195,16 +222,9 @@ def generate_kiro_agent_json(
         # Load MCP servers tu .kiro/settings/mcp.json va global config
         "includeMcpJson": True,
         # Knowledge files (Kiro spec: resources voi file:// URIs)
-        "resources": ["file://.kiro/steering/**/*.md", "file://.kiro/skills/**/SKILL.md"],
+        "resources": list(KIRO_AGENT_RESOURCES),
         # Lifecycle hooks - chay lenh khi agent khoi dong
-        "hooks": {
-            "agentSpawn": [
-                {
-                    "command": "git status --short 2>/dev/null || true",
-                    "timeout_ms": 3000,
-                }
-            ]
-        },
+        "hooks": {"agentSpawn": [dict(KIRO_AGENT_SPAWN_HOOK)]},
     }
 
     # === TOOLS SETTINGS (cai dat chi tiet cho tung tool) ===
@@ -248,20 +268,25 @@ def generate_kiro_agent_json(
 # =============================================================================
 
 
-def convert_agent_to_kiro(source_path: Path, dest_path: Path, mcp_server_names: List[str] = None) -> bool:
-    """Convert agent to Kiro JSON format with full configuration."""
+def convert_agent_to_kiro(
+    source_path: Path, dest_path: Path, mcp_server_names: List[str] = None, raw: Optional[bytes] = None
+) -> bool:
+    """Convert agent to Kiro JSON format with full configuration.
+
+    ``raw`` may carry the already-read source bytes to avoid a second read.
+    """
     try:
-        content = source_path.read_text(encoding="utf-8")
+        content = decode_text(raw) if raw is not None else source_path.read_text(encoding="utf-8")
         content = content.replace("\x00", "")  # strip null bytes
         agent_slug = source_path.stem.lower()
 
         metadata = extract_agent_metadata(content, source_path.name)
         agent_json = generate_kiro_agent_json(agent_slug, metadata, mcp_server_names)
 
-        json_str = json.dumps(agent_json, indent=2, ensure_ascii=False)
-        json_str.encode("utf-8")  # validate encodable before writing
+        # Encode once (orjson when installed): fails before anything is written
+        json_bytes = dumps_json(agent_json)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(json_str, encoding="utf-8")
+        dest_path.write_bytes(json_bytes)
         return True
     except (UnicodeEncodeError, UnicodeDecodeError) as e:
         print(f"  Error: Invalid encoding in {source_path.name}: {e}")
@@ -276,14 +301,10 @@ def convert_skill_to_kiro(source_dir: Path, dest_dir: Path) -> bool:
     try:
         skill_name = source_dir.name
         dest_skill_dir = dest_dir / skill_name
-        dest_skill_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy all files
-        for item in source_dir.iterdir():
-            if item.is_dir():
-                shutil.copytree(item, dest_skill_dir / item.name, dirs_exist_ok=True)
-            else:
-                shutil.copy2(item, dest_skill_dir / item.name)
+        # Pass-through copy: files whose size + mtime already match are not
+        # rewritten; extra files in the destination are left alone
+        mirror_tree(source_dir, dest_skill_dir, prune=False)
 
         return True
     except Exception as e:
@@ -298,14 +319,16 @@ def convert_workflow_to_prompt(source_path: Path, dest_path: Path) -> bool:
     """
     try:
         content = source_path.read_text(encoding="utf-8")
-        source_path.stem.lower()
 
         # Extract existing frontmatter for description
         description = "Custom workflow prompt"
-        fm_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+        fm_match = RE_FRONTMATTER_BLOCK.match(content)
         if fm_match:
             try:
-                fm_data = yaml.safe_load(fm_match.group(1))
+                # Plain "description: ..." headers skip the YAML parser
+                fm_data = parse_flat_yaml(fm_match.group(1))
+                if fm_data is None:
+                    fm_data = yaml.safe_load(fm_match.group(1))
                 if isinstance(fm_data, dict) and fm_data.get("description"):
                     description = fm_data["description"]
             except (yaml.YAMLError, ValueError, TypeError):
@@ -323,17 +346,20 @@ def convert_workflow_to_prompt(source_path: Path, dest_path: Path) -> bool:
             prompt_fm["arguments"] = []
 
         # Clean content (remove old frontmatter)
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
+        content_clean = FrontmatterParser.split(content)[1]
 
         # Replace $ARGUMENTS with {{args}} for Kiro template syntax
-        content_final = content_clean.replace("$ARGUMENTS", "{{args}}").strip()
+        if has_args:
+            content_clean = content_clean.replace("$ARGUMENTS", "{{args}}")
+        content_final = content_clean.strip()
 
         # Build final output
-        fm_yaml = yaml.dump(prompt_fm, sort_keys=False).rstrip("\n")
+        fm_yaml = yaml.dump(prompt_fm, sort_keys=False, allow_unicode=True, width=1000).rstrip("\n")
         output = f"---\n{fm_yaml}\n---\n\n{content_final}\n"
 
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        # Bytes write: LF endings on every OS, no text-layer newline pass
+        dest_path.write_bytes(output.encode("utf-8"))
         return True
     except Exception as e:
         print(f"  Error converting prompt {source_path.name}: {e}")
@@ -346,14 +372,14 @@ def convert_workflow_to_steering(source_path: Path, dest_path: Path) -> bool:
         content = source_path.read_text(encoding="utf-8")
 
         # Remove frontmatter if exists
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+        content_clean = FrontmatterParser.split(content)[1].strip()
 
         # Kiro steering files require inclusion frontmatter
         # Default to 'always' for workflow-derived steering
         steering_frontmatter = "---\ninclusion: always\n---\n\n"
 
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(f"{steering_frontmatter}{content_clean}\n", encoding="utf-8")
+        dest_path.write_bytes(f"{steering_frontmatter}{content_clean}\n".encode())
         return True
     except Exception as e:
         print(f"  Error converting workflow {source_path.name}: {e}")
@@ -379,26 +405,25 @@ def copy_rules_to_steering(source_dir: Path, dest_dir: Path) -> bool:
 
         STEERING_FRONTMATTER = "---\ninclusion: always\n---\n\n"
 
-        for item in source_dir.iterdir():
-            if item.is_file() and item.suffix == ".md":
-                dest_item = dest_dir / item.name
-                content = item.read_text(encoding="utf-8")
-
-                # Check if content already has frontmatter
-                has_fm = re.match(r"^---\n", content)
-                if has_fm:
-                    # Check if it already has inclusion field
-                    fm_match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
-                    if fm_match and "inclusion" in fm_match.group(1):
-                        # Already has proper steering frontmatter, copy as-is
-                        dest_item.write_text(content, encoding="utf-8")
-                    else:
-                        # Has frontmatter but no inclusion — strip and add proper one
-                        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
-                        dest_item.write_text(f"{STEERING_FRONTMATTER}{content_clean}", encoding="utf-8")
+        for item in scan_md_files(source_dir):
+            dest_item = dest_dir / item.name
+            content = item.read_text(encoding="utf-8")
+
+            # Check if content already has frontmatter
+            has_fm = re.match(r"^---\n", content)
+            if has_fm:
+                # Check if it already has inclusion field
+                fm_match = RE_FRONTMATTER_BLOCK.match(content)
+                if fm_match and "inclusion" in fm_match.group(1):
+                    # Already has proper steering frontmatter, copy as-is
+                    dest_item.write_bytes(content.encode("utf-8"))
                 else:
-                    # No frontmatter at all — add steering frontmatter
-                    dest_item.write_text(f"{STEERING_FRONTMATTER}{content}", encoding="utf-8")
+                    # Has frontmatter but no inclusion — strip and add proper one
+                    content_clean = FrontmatterParser.split(content)[1]
+                    dest_item.write_bytes(f"{STEERING_FRONTMATTER}{content_clean}".encode())
+            else:
+                # No frontmatter at all — add steering frontmatter
+                dest_item.write_bytes(f"{STEERING_FRONTMATTER}{content}".encode())
 
         return True
     except Exception as e:
@@ -430,7 +455,7 @@ def copy_architecture_to_steering(source_file: Path, dest_dir: Path) -> bool:
         if not re.match(r"^---\n.*?inclusion.*?\n---", content, re.DOTALL):
             content = f"---\ninclusion: always\n---\n\n{content}"
 
-        dest_file.write_text(content, encoding="utf-8")
+        dest_file.write_bytes(content.encode("utf-8"))
         return True
     except Exception as e:
         print(f"  Error copying ARCHITECTURE.md to steering: {e}")
@@ -478,7 +503,7 @@ def convert_to_kiro(source_root: Path, dest_root: Path, verbose: bool = True) ->
     Returns:
         Dict with conversion statistics
     """
-    stats = {"agents": 0, "skills": 0, "prompts": 0, "steering": 0, "mcp": 0, "warnings": [], "errors": []}
+    stats: Dict[str, Any] = {"agents": 0, "skills": 0, "prompts": 0, "steering": 0, "mcp": 0, "warnings": [], "errors": []}
 
     # Define source and destination paths
     agent_root = source_root / ".agent"
@@ -513,73 +538,125 @@ def convert_to_kiro(source_root: Path, dest_root: Path, verbose: bool = True) ->
             if verbose:
                 print(f"  Warning: Could not parse MCP config: {e}")
 
-    # Convert agents to JSON
-    if agents_src.exists():
-        if verbose:
-            print("Converting agents to Kiro JSON format...")
+    # Agents, skills and prompts each write their own files, so every section
+    # converts on a pool and reports in source order afterwards.
+    with ThreadPoolExecutor(max_workers=CONVERT_POOL_SIZE) as pool:
+        hash_cache = ContentHashCache(index_path_for(dest_root, "kiro"))
 
-        for agent_file in agents_src.glob("*.md"):
-            dest_file = agents_dest / f"{agent_file.stem}.json"
-            if convert_agent_to_kiro(agent_file, dest_file, mcp_server_names):
-                stats["agents"] += 1
-                if verbose:
-                    print(f"  ✓ {agent_file.stem}.json")
-            else:
-                stats["errors"].append(f"agent:{agent_file.name}")
+        # Convert agents to JSON (skip agents whose source + MCP servers are unchanged)
+        if agents_src.exists():
+            if verbose:
+                print("Converting agents to Kiro JSON format...")
+
+            mcp_key = ",".join(mcp_server_names).encode("utf-8")
+
+            agent_files = scan_md_files(agents_src)
+            raw_contents = read_files_parallel(agent_files)
+
+            # Freshness checks touch the shared cache, so they stay on this thread
+            digests: Dict[Path, Optional[str]] = {}
+            stale: List[Path] = []
+            for agent_file in agent_files:
+                dest_file = agents_dest / f"{agent_file.stem}.json"
+                raw = raw_contents[agent_file]
+                digest = content_digest(raw, mcp_key) if raw is not None else None
+                digests[agent_file] = digest
+                if not (digest and hash_cache.is_fresh(f"agents/{dest_file.name}", digest, dest_file)):
+                    stale.append(agent_file)
+
+            results = pool.map(
+                convert_agent_to_kiro,
+                stale,
+                [agents_dest / f"{f.stem}.json" for f in stale],
+                [mcp_server_names] * len(stale),
+                [raw_contents[f] for f in stale],
+            )
+            converted = dict(zip(stale, results))
+
+            progress: List[str] = []
+            for agent_file in agent_files:
+                if agent_file not in converted:
+                    stats["agents"] += 1
+                    progress.append(f"  ✓ {agent_file.stem}.json (unchanged)")
+                    continue
+
+                if converted[agent_file]:
+                    stats["agents"] += 1
+                    digest = digests[agent_file]
+                    if digest is not None:
+                        hash_cache.update(
+                            f"agents/{agent_file.stem}.json", digest, agents_dest / f"{agent_file.stem}.json"
+                        )
+                    progress.append(f"  ✓ {agent_file.stem}.json")
+                else:
+                    stats["errors"].append(f"agent:{agent_file.name}")
+            if verbose and progress:
+                print("\n".join(progress))
 
-    # Convert skills
-    if skills_src.exists():
-        if verbose:
-            print("Converting skills to Kiro format...")
+        # Convert skills
+        if skills_src.exists():
+            if verbose:
+                print("Converting skills to Kiro format...")
 
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
-                if convert_skill_to_kiro(skill_dir, skills_dest):
+            skill_dirs = [Path(e.path) for e in scan_dir(skills_src) if e.is_dir()]
+            results = pool.map(convert_skill_to_kiro, skill_dirs, [skills_dest] * len(skill_dirs))
+            progress = []
+            for skill_dir, ok in zip(skill_dirs, results):
+                if ok:
                     stats["skills"] += 1
-                    if verbose:
-                        print(f"  ✓ {skill_dir.name}")
+                    progress.append(f"  ✓ {skill_dir.name}")
                 else:
                     stats["errors"].append(f"skill:{skill_dir.name}")
+            if verbose and progress:
+                print("\n".join(progress))
 
-    # Convert workflows to Prompts (per Kiro spec)
-    prompts_dest = dest_root / ".kiro" / "prompts"
-    if workflows_src.exists():
-        if verbose:
-            print("Converting workflows to prompts...")
+        # Convert workflows to Prompts (per Kiro spec)
+        prompts_dest = dest_root / ".kiro" / "prompts"
+        if workflows_src.exists():
+            if verbose:
+                print("Converting workflows to prompts...")
 
-        for workflow_file in workflows_src.glob("*.md"):
-            dest_file = prompts_dest / workflow_file.name
-            if convert_workflow_to_prompt(workflow_file, dest_file):
-                stats["prompts"] += 1
-                if verbose:
-                    print(f"  ✓ @{workflow_file.stem}")
-            else:
-                stats["errors"].append(f"prompt:{workflow_file.name}")
+            workflow_files = scan_md_files(workflows_src)
+            prompt_results = convert_changed(
+                pool, hash_cache, "prompts", convert_workflow_to_prompt,
+                workflow_files, [prompts_dest / f.name for f in workflow_files],
+            )
+            progress = []
+            for workflow_file, outcome in zip(workflow_files, prompt_results):
+                if outcome:
+                    stats["prompts"] += 1
+                    progress.append(f"  ✓ @{workflow_file.stem}{' (unchanged)' if outcome is UNCHANGED else ''}")
+                else:
+                    stats["errors"].append(f"prompt:{workflow_file.name}")
+            if verbose and progress:
+                print("\n".join(progress))
 
-    # Copy rules to steering (per Kiro spec)
-    if rules_src.exists():
-        if verbose:
-            print("Copying rules to steering...")
+        hash_cache.save()
 
-        if copy_rules_to_steering(rules_src, steering_dest):
-            rule_count = len(list(rules_src.glob("*.md")))
-            stats["steering"] += rule_count
+        # Copy rules to steering (per Kiro spec)
+        if rules_src.exists():
             if verbose:
-                print(f"  ✓ {rule_count} rule file(s) → steering/")
-        else:
-            stats["errors"].append("rules:copy_failed")
+                print("Copying rules to steering...")
 
-    # Copy MCP config
-    if mcp_src.exists():
-        if verbose:
-            print("Copying MCP configuration...")
+            if copy_rules_to_steering(rules_src, steering_dest):
+                rule_count = len(scan_md_files(rules_src))
+                stats["steering"] += rule_count
+                if verbose:
+                    print(f"  ✓ {rule_count} rule file(s) → steering/")
+            else:
+                stats["errors"].append("rules:copy_failed")
 
-        if copy_mcp_config(mcp_src, mcp_dest):
-            stats["mcp"] = 1
+        # Copy MCP config
+        if mcp_src.exists():
             if verbose:
-                print("  ✓ MCP config → settings/mcp.json")
-        else:
-            stats["errors"].append("mcp:copy_failed")
+                print("Copying MCP configuration...")
+
+            if copy_mcp_config(mcp_src, mcp_dest):
+                stats["mcp"] = 1
+                if verbose:
+                    print("  ✓ MCP config → settings/mcp.json")
+            else:
+                stats["errors"].append("mcp:copy_failed")
 
     # Run external skill plugins (declarative, config-driven via .agent/plugins.json)
     from agent_bridge.core.plugins import PluginRunner
@@ -741,7 +818,7 @@ def apply_reverse_capture_kiro(
 
     if kiro_root / "prompts" in ide_path.parents or ide_path.parent == kiro_root / "prompts":
         content = ide_path.read_text(encoding="utf-8")
-        body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
+        body = FrontmatterParser.split(content)[1]
         body = body.replace("{{args}}", "$ARGUMENTS").strip()
         agent_path.parent.mkdir(parents=True, exist_ok=True)
         agent_path.write_text(body, encoding="utf-8")
@@ -749,7 +826,7 @@ def apply_reverse_capture_kiro(
 
     if kiro_root / "steering" in ide_path.parents or ide_path.parent == kiro_root / "steering":
         content = ide_path.read_text(encoding="utf-8")
-        body = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL).strip()
+        body = FrontmatterParser.split(content)[1].strip()
         agent_path.parent.mkdir(parents=True, exist_ok=True)
         agent_path.write_text(body, encoding="utf-8")
         return True
@@ -14,11 +14,10 @@ Reference: https://opencode.ai/docs/config/
            https://opencode.ai/docs/commands/
 """
 
-import json
 import re
 import shutil
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
@@ -27,6 +26,25 @@ import yaml
 # =============================================================================
 
 from agent_bridge.core.agent_registry import get_agent_role
+from agent_bridge.core.frontmatter import FrontmatterParser, YamlDumper
+from agent_bridge.utils import get_master_agent_dir
+from agent_bridge.utils.content_cache import ContentHashCache, content_digest, index_path_for
+from agent_bridge.utils.filesystem import (
+    decode_text,
+    read_files_parallel,
+    read_json,
+    scan_dir,
+    scan_md_files,
+    write_json,
+    write_output,
+)
+from agent_bridge.utils.mcp import load_mcp_config
+
+
+# Static pieces of the per-agent config; callers get fresh copies via dict()
+_UNKNOWN_ROLE_TOOLS = {"write": False, "edit": False, "bash": False}
+_UNKNOWN_ROLE_PERMISSION = {"edit": "ask"}
+_CAPABILITY_TO_PERMISSION = {True: "allow", False: "deny"}
 
 
 def _role_to_opencode_config(slug: str) -> Dict[str, Any]:
@@ -39,8 +57,8 @@ def _role_to_opencode_config(slug: str) -> Dict[str, Any]:
         return {
             "mode": "subagent",
             "description": f"Agent for {slug.replace('-', ' ')} tasks",
-            "tools": {"write": False, "edit": False, "bash": False},
-            "permission": {"edit": "ask"},
+            "tools": dict(_UNKNOWN_ROLE_TOOLS),
+            "permission": dict(_UNKNOWN_ROLE_PERMISSION),
         }
     
     # Derive mode from category
@@ -58,16 +76,10 @@ def _role_to_opencode_config(slug: str) -> Dict[str, Any]:
         permission = role.opencode_permission
     else:
         # Default permission based on capabilities
-        permission = {}
-        if role.can_write:
-            permission["edit"] = "allow"
-        else:
-            permission["edit"] = "deny"
-        
-        if role.can_execute:
-            permission["bash"] = "allow"
-        elif not role.can_execute:
-            permission["bash"] = "deny"
+        permission = {
+            "edit": _CAPABILITY_TO_PERMISSION[bool(role.can_write)],
+            "bash": _CAPABILITY_TO_PERMISSION[bool(role.can_execute)],
+        }
     
     config = {
         "mode": mode,
@@ -158,7 +170,7 @@ def generate_agent_frontmatter(config: Dict[str, Any]) -> str:
     if config.get("temperature"):
         frontmatter["temperature"] = config["temperature"]
 
-    return yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
+    return yaml.dump(frontmatter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
 
 
 def generate_command_frontmatter(config: Dict[str, Any]) -> str:
@@ -176,18 +188,27 @@ def generate_command_frontmatter(config: Dict[str, Any]) -> str:
     if config.get("model"):
         frontmatter["model"] = config["model"]
 
-    return yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
+    return yaml.dump(frontmatter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
 
 
 # =============================================================================
 # CONVERSION FUNCTIONS
 # =============================================================================
 
+# Compiled once at import; both run against every agent/workflow file
+_RE_AGENT_DESC = re.compile(r"(?:You are|Role:)\s*(.+?)(?:\n\n|\n#)", re.IGNORECASE | re.DOTALL)
+_RE_WORKFLOW_DESC = re.compile(
+    r"^>\s*(.+?)$|^(?:Description|Purpose)[:\s]*(.+?)(?:\n|$)", re.MULTILINE | re.IGNORECASE
+)
+
 
-def convert_agent_to_opencode(source_path: Path, dest_path: Path) -> bool:
-    """Convert agent to OpenCode format with full frontmatter."""
+def convert_agent_to_opencode(source_path: Path, dest_path: Path, raw: Optional[bytes] = None) -> bool:
+    """Convert agent to OpenCode format with full frontmatter.
+
+    ``raw`` may carry the already-read source bytes to avoid a second read.
+    """
     try:
-        content = source_path.read_text(encoding="utf-8")
+        content = decode_text(raw) if raw is not None else source_path.read_text(encoding="utf-8")
         agent_slug = source_path.stem.lower()
 
         # Get config from central registry
@@ -195,7 +216,7 @@ def convert_agent_to_opencode(source_path: Path, dest_path: Path) -> bool:
 
         # Extract description from content if not in config
         if not config.get("description"):
-            desc_match = re.search(r"(?:You are|Role:)\s*(.+?)(?:\n\n|\n#)", content, re.IGNORECASE | re.DOTALL)
+            desc_match = _RE_AGENT_DESC.search(content)
             if desc_match:
                 config["description"] = desc_match.group(1).strip()[:150]
             else:
@@ -205,23 +226,25 @@ def convert_agent_to_opencode(source_path: Path, dest_path: Path) -> bool:
         frontmatter = generate_agent_frontmatter(config)
 
         # Remove existing frontmatter
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
+        content_clean = FrontmatterParser.split(content)[1]
 
         # Build output
         output = f"---\n{frontmatter}---\n\n{content_clean.strip()}\n"
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting agent {source_path.name}: {e}")
         return False
 
 
-def convert_workflow_to_command(source_path: Path, dest_path: Path) -> bool:
-    """Convert workflow to OpenCode command."""
+def convert_workflow_to_command(source_path: Path, dest_path: Path, raw: Optional[bytes] = None) -> bool:
+    """Convert workflow to OpenCode command.
+
+    ``raw`` may carry the already-read source bytes to avoid a second read.
+    """
     try:
-        content = source_path.read_text(encoding="utf-8")
+        content = decode_text(raw) if raw is not None else source_path.read_text(encoding="utf-8")
         workflow_slug = source_path.stem.lower()
 
         # Get command config
@@ -234,9 +257,7 @@ def convert_workflow_to_command(source_path: Path, dest_path: Path) -> bool:
         )
 
         # Extract better description from content
-        desc_match = re.search(
-            r"^>\s*(.+?)$|^(?:Description|Purpose)[:\s]*(.+?)(?:\n|$)", content, re.MULTILINE | re.IGNORECASE
-        )
+        desc_match = _RE_WORKFLOW_DESC.search(content)
         if desc_match:
             config["description"] = (desc_match.group(1) or desc_match.group(2) or "").strip()[:150]
 
@@ -244,13 +265,12 @@ def convert_workflow_to_command(source_path: Path, dest_path: Path) -> bool:
         frontmatter = generate_command_frontmatter(config)
 
         # Remove existing frontmatter, use content as template
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
+        content_clean = FrontmatterParser.split(content)[1]
 
         # Build command template
         output = f"---\n{frontmatter}---\n\n{content_clean.strip()}\n"
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting workflow {source_path.name}: {e}")
@@ -300,7 +320,7 @@ def generate_opencode_config(source_root: Path, dest_root: Path) -> bool:
 
         dest_file = dest_root / ".opencode" / "opencode.json"
         dest_file.parent.mkdir(parents=True, exist_ok=True)
-        dest_file.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_json(dest_file, config)
         return True
     except Exception as e:
         print(f"  Error generating opencode.json: {e}")
@@ -319,7 +339,7 @@ def convert_to_opencode(source_root: Path, dest_root: Path, verbose: bool = True
     Returns:
         Dict with conversion statistics
     """
-    stats = {"agents": 0, "commands": 0, "skills": 0, "errors": [], "warnings": []}
+    stats: Dict[str, Any] = {"agents": 0, "commands": 0, "skills": 0, "errors": [], "warnings": []}
 
     agents_src = source_root / ".agent" / "agents"
     agents_dest = dest_root / ".opencode" / "agents"
@@ -335,23 +355,49 @@ def convert_to_opencode(source_root: Path, dest_root: Path, verbose: bool = True
         if verbose:
             print("Converting agents to OpenCode format...")
 
-        for agent_file in agents_src.glob("*.md"):
+        agents_dest.mkdir(parents=True, exist_ok=True)
+
+        hash_cache = ContentHashCache(index_path_for(dest_root, "opencode"))
+
+        agent_files = scan_md_files(agents_src)
+        raw_contents = read_files_parallel(agent_files)
+
+        for agent_file in agent_files:
             dest_file = agents_dest / agent_file.name
-            if convert_agent_to_opencode(agent_file, dest_file):
+            cache_key = f"agents/{agent_file.name}"
+            raw = raw_contents[agent_file]
+            digest = content_digest(raw) if raw is not None else None
+
+            if digest and hash_cache.is_fresh(cache_key, digest, dest_file):
+                stats["agents"] += 1
+                if verbose:
+                    print(f"  ✓ {agent_file.name} (unchanged)")
+                continue
+
+            if convert_agent_to_opencode(agent_file, dest_file, raw=raw):
                 stats["agents"] += 1
+                if digest:
+                    hash_cache.update(cache_key, digest, dest_file)
                 if verbose:
                     print(f"  ✓ {agent_file.name}")
             else:
                 stats["errors"].append(f"agent:{agent_file.name}")
 
+        hash_cache.save()
+
     # Convert workflows to commands
     if workflows_src.exists():
         if verbose:
             print("Converting workflows to OpenCode commands...")
 
-        for workflow_file in workflows_src.glob("*.md"):
+        commands_dest.mkdir(parents=True, exist_ok=True)
+
+        workflow_files = scan_md_files(workflows_src)
+        raw_contents = read_files_parallel(workflow_files)
+
+        for workflow_file in workflow_files:
             dest_file = commands_dest / workflow_file.name
-            if convert_workflow_to_command(workflow_file, dest_file):
+            if convert_workflow_to_command(workflow_file, dest_file, raw=raw_contents[workflow_file]):
                 stats["commands"] += 1
                 if verbose:
                     print(f"  ✓ /{workflow_file.stem}")
@@ -363,8 +409,9 @@ def convert_to_opencode(source_root: Path, dest_root: Path, verbose: bool = True
         if verbose:
             print("Converting skills to OpenCode format...")
 
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
+        for entry in scan_dir(skills_src):
+            if entry.is_dir():
+                skill_dir = Path(entry.path)
                 if convert_skill_to_opencode(skill_dir, skills_dest):
                     stats["skills"] += 1
                     if verbose:
@@ -406,10 +453,7 @@ def copy_mcp_opencode(root_path: Path, force: bool = False) -> bool:
     OpenCode embeds MCP config directly in opencode.json instead of separate file.
     This is OpenCode-specific behavior, different from other IDEs.
     """
-    from agent_bridge.utils import get_master_agent_dir, load_mcp_config
-
-    source_root = root_path if (root_path / ".agent").exists() else get_master_agent_dir().parent
-    mcp_config = load_mcp_config(source_root)
+    mcp_config = load_mcp_config(_resolve_mcp_src(root_path))
 
     if not mcp_config:
         return False
@@ -419,20 +463,24 @@ def copy_mcp_opencode(root_path: Path, force: bool = False) -> bool:
         return False
     
     try:
-        config = json.loads(opencode_json_path.read_text(encoding="utf-8"))
+        config = read_json(opencode_json_path)
         
         # Transform MCP config to OpenCode format
         config["mcp"] = _transform_mcp_for_opencode(mcp_config)
         
-        opencode_json_path.write_text(
-            json.dumps(config, indent=2, ensure_ascii=False), 
-            encoding="utf-8"
-        )
+        write_json(opencode_json_path, config)
         return True
     except Exception:
         return False
 
 
+def _resolve_mcp_src(root_path: Path) -> Path:
+    """Project root if it has a local .agent/, otherwise the master vault root."""
+    if (root_path / ".agent").exists():
+        return root_path
+    return get_master_agent_dir().parent
+
+
 def _transform_mcp_for_opencode(mcp_config: dict) -> dict:
     """
     Transform standard MCP config to OpenCode format.
@@ -12,12 +12,17 @@ Reference: https://docs.windsurf.com/windsurf/cascade/memories
 Activation modes: Manual, Always On, Model Decision, Glob
 """
 
+import functools
+import io
+import os
 import re
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
 
 from agent_bridge.core.frontmatter import FrontmatterParser
+from agent_bridge.core.skill_metadata import get_windsurf_config
+from agent_bridge.utils.filesystem import CONVERT_POOL_SIZE, read_text_prefix, write_output
 
 # =============================================================================
 # WINDSURF RULE CONFIGURATION
@@ -29,112 +34,174 @@ WINDSURF_RULE_MAX_CHARS = 12000
 WINDSURF_TRUNCATE_SUFFIX = "\n\n... (truncated to fit Windsurf rule limit)\n"
 
 
+# Precompiled patterns for the per-file conversion loops (_RE_H1 is the
+# reference/fallback for _strip_leading_h1)
+_RE_H1 = re.compile(r"^#\s+.+\n*")
+_RE_NUMBERED_STEP = re.compile(r"^\d+\.\s+(.+)$", re.MULTILINE)
+_RE_STEP_HEADER = re.compile(r"^##\s+(?:Step\s+\d+[:\s]*)?(.+)$", re.MULTILINE)
+_RE_DESC = re.compile(r"^>\s*(.+?)$|^(?:Description|Purpose)[:\s]*(.+?)(?:\n|$)", re.MULTILINE | re.IGNORECASE)
+
+
 def _truncate_windsurf_output(output: str) -> str:
     """Truncate output to fit Windsurf rule limit."""
     if len(output) > WINDSURF_RULE_MAX_CHARS:
         return output[: WINDSURF_RULE_MAX_CHARS - len(WINDSURF_TRUNCATE_SUFFIX)] + WINDSURF_TRUNCATE_SUFFIX
     return output
 
+
+def _build_windsurf_output(header: str, body: str) -> str:
+    """
+    Same as _truncate_windsurf_output(f"{header}{body}\n"), but an oversized
+    body is sliced first so the full-length string is never built.
+    """
+    if len(header) + len(body) + 1 <= WINDSURF_RULE_MAX_CHARS:
+        return f"{header}{body}\n"
+    keep = WINDSURF_RULE_MAX_CHARS - len(WINDSURF_TRUNCATE_SUFFIX)
+    if keep <= len(header):
+        return header[:keep] + WINDSURF_TRUNCATE_SUFFIX
+    return header + body[: keep - len(header)] + WINDSURF_TRUNCATE_SUFFIX
+
+
+def _strip_leading_h1(text: str) -> str:
+    """
+    Drop a leading "# Title" line plus following blank lines.
+
+    Same result as _RE_H1.sub("", text) but only looks at the first line.
+    """
+    n = len(text)
+    if n < 2 or text[0] != "#" or not text[1].isspace():
+        return text
+    j = 2
+    while j < n and text[j].isspace():
+        j += 1
+    if j == n:
+        # "#" followed only by whitespace: rare, let the regex decide
+        return _RE_H1.sub("", text)
+    end = text.find("\n", j)
+    if end == -1:
+        return ""
+    while end < n and text[end] == "\n":
+        end += 1
+    return text[end:]
+
+
+def _read_body(path: Path) -> str:
+    """
+    File content with frontmatter stripped, cached while (mtime, size) is unchanged.
+
+    convert_to_windsurf clears the cache on entry, so it only shares reads
+    within one run (skill rules and .windsurfrules) and never serves a body
+    from an earlier run in a long-lived process such as the TUI.
+    """
+    st = os.stat(path)
+    return _read_body_cached(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_body_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    return FrontmatterParser.strip(Path(path_str).read_text(encoding="utf-8"))
+
+
 # Activation modes:
 # 1. "always" - Always On: rule always applied
 # 2. "glob" - Glob: auto-apply when files match pattern
 # 3. "model" - Model Decision: AI decides based on description
 # 4. "manual" - Manual: only via @mention
 
-SKILL_ACTIVATION_MAP = {
+SKILL_ACTIVATION_MAP: Dict[str, Dict[str, Any]] = {
     # Always On rules (core guidelines)
     "clean-code": {
         "mode": "always",
         "description": "Clean code principles and best practices",
-        "globs": [],
+        "globs": (),
     },
     "behavioral-modes": {
         "mode": "always",
         "description": "Agent behavioral guidelines",
-        "globs": [],
+        "globs": (),
     },
     # Glob-based rules
     "nextjs-react-expert": {
         "mode": "glob",
         "description": "Next.js and React expert patterns",
-        "globs": ["**/*.tsx", "**/*.jsx", "**/next.config.*", "**/app/**/*"],
+        "globs": ("**/*.tsx", "**/*.jsx", "**/next.config.*", "**/app/**/*"),
     },
     "tailwind-patterns": {
         "mode": "glob",
         "description": "Tailwind CSS patterns and utilities",
-        "globs": ["**/*.tsx", "**/*.jsx", "**/*.css", "**/tailwind.config.*"],
+        "globs": ("**/*.tsx", "**/*.jsx", "**/*.css", "**/tailwind.config.*"),
     },
     "python-patterns": {
         "mode": "glob",
         "description": "Python best practices and patterns",
-        "globs": ["**/*.py", "**/pyproject.toml", "**/requirements.txt"],
+        "globs": ("**/*.py", "**/pyproject.toml", "**/requirements.txt"),
     },
     "rust-pro": {
         "mode": "glob",
         "description": "Rust programming patterns",
-        "globs": ["**/*.rs", "**/Cargo.toml"],
+        "globs": ("**/*.rs", "**/Cargo.toml"),
     },
     "database-design": {
         "mode": "glob",
         "description": "Database design and SQL patterns",
-        "globs": ["**/*.sql", "**/prisma/**/*", "**/migrations/**/*"],
+        "globs": ("**/*.sql", "**/prisma/**/*", "**/migrations/**/*"),
     },
     "testing-patterns": {
         "mode": "glob",
         "description": "Testing frameworks and patterns",
-        "globs": ["**/*.test.*", "**/*.spec.*", "**/__tests__/**/*"],
+        "globs": ("**/*.test.*", "**/*.spec.*", "**/__tests__/**/*"),
     },
     "mobile-design": {
         "mode": "glob",
         "description": "Mobile development patterns",
-        "globs": ["**/App.tsx", "**/app.json", "**/android/**/*", "**/ios/**/*"],
+        "globs": ("**/App.tsx", "**/app.json", "**/android/**/*", "**/ios/**/*"),
     },
     # Model Decision rules (AI decides)
     "architecture": {
         "mode": "model",
         "description": "System architecture and design patterns - use when discussing structure, patterns, or making architectural decisions",
-        "globs": [],
+        "globs": (),
     },
     "brainstorming": {
         "mode": "model",
         "description": "Brainstorming and ideation - use when exploring options or creative problem solving",
-        "globs": [],
+        "globs": (),
     },
     "plan-writing": {
         "mode": "model",
         "description": "Project planning and task breakdown - use when creating plans or roadmaps",
-        "globs": [],
+        "globs": (),
     },
     "systematic-debugging": {
         "mode": "model",
         "description": "Debugging methodology - use when troubleshooting issues or analyzing errors",
-        "globs": [],
+        "globs": (),
     },
     "performance-profiling": {
         "mode": "model",
         "description": "Performance optimization - use when profiling or improving performance",
-        "globs": [],
+        "globs": (),
     },
     "security-scanner": {
         "mode": "model",
         "description": "Security auditing - use when checking for vulnerabilities",
-        "globs": [],
+        "globs": (),
     },
     "seo-fundamentals": {
         "mode": "model",
         "description": "SEO optimization - use when improving search engine optimization",
-        "globs": [],
+        "globs": (),
     },
     # Manual rules (explicit @mention)
     "red-team-tactics": {
         "mode": "manual",
         "description": "Security red team tactics",
-        "globs": [],
+        "globs": (),
     },
     "penetration-testing": {
         "mode": "manual",
         "description": "Penetration testing methodologies",
-        "globs": [],
+        "globs": (),
     },
 }
 
@@ -144,7 +211,7 @@ SKILL_ACTIVATION_MAP = {
 # =============================================================================
 
 
-def generate_windsurf_rule_header(name: str, mode: str, description: str, globs: List[str] = None) -> str:
+def generate_windsurf_rule_header(name: str, mode: str, description: str, globs: Sequence[str] = None) -> str:
     """
     Generate Windsurf rule header with activation mode.
 
@@ -156,6 +223,10 @@ def generate_windsurf_rule_header(name: str, mode: str, description: str, globs:
 
     ---
     """
+    # Fast path: every agent rule is "model" with a description
+    if mode == "model" and description:
+        return f"# {name}\n\n**Activation:** Model Decision\n**Description:** {description}\n\n---\n"
+
     lines = [f"# {name}", ""]
 
     # Activation mode
@@ -180,11 +251,12 @@ def generate_windsurf_rule_header(name: str, mode: str, description: str, globs:
     return "\n".join(lines)
 
 
-def generate_workflow_content(name: str, steps: List[str], description: str = "") -> str:
+def generate_workflow_content(name: str, steps: Iterable[str], description: str = "") -> str:
     """
     Generate Windsurf workflow markdown.
 
-    Workflows are invoked via /workflow-name command.
+    Workflows are invoked via /workflow-name command. ``steps`` is consumed
+    once, so a generator works.
     """
     lines = [
         f"# {name}",
@@ -220,60 +292,58 @@ def convert_skill_to_windsurf_rule(source_dir: Path, dest_path: Path) -> bool:
     try:
         skill_name = source_dir.name
 
-        # Find SKILL.md
-        skill_file = source_dir / "SKILL.md"
-        if not skill_file.exists():
-            md_files = list(source_dir.glob("*.md"))
+        # One scandir serves both the SKILL.md lookup and the merge loop below
+        with os.scandir(source_dir) as it:
+            md_files = sorted(
+                (Path(e.path) for e in it if e.name.endswith(".md") and e.is_file()),
+                key=lambda p: p.name,
+            )
+        skill_file = next((p for p in md_files if p.name == "SKILL.md"), None)
+        if skill_file is None:
             skill_file = md_files[0] if md_files else None
 
         if not skill_file:
             return False
 
-        content = skill_file.read_text(encoding="utf-8")
-
         # Get activation config - try centralized registry first
-        config = None
-        try:
-            from agent_bridge.core.skill_metadata import get_windsurf_config
-            config = get_windsurf_config(skill_name)
-        except ImportError:
-            pass
-        
+        config: Optional[Mapping[str, Any]] = get_windsurf_config(skill_name)
         if not config:
-            config = SKILL_ACTIVATION_MAP.get(
-                skill_name,
-                {
-                    "mode": "model",
-                    "description": f"Rules for {skill_name.replace('-', ' ')}",
-                    "globs": [],
-                },
-            )
-
-        # Remove existing frontmatter/header using FrontmatterParser
-        parser = FrontmatterParser()
-        content_clean = parser.strip(content)
-        content_clean = re.sub(r"^#\s+.+\n*", "", content_clean)  # Remove first H1
+            config = SKILL_ACTIVATION_MAP.get(skill_name)
+        if config is None:
+            # Default only built on a miss
+            config = {
+                "mode": "model",
+                "description": f"Rules for {skill_name.replace('-', ' ')}",
+                "globs": (),
+            }
+
+        # Remove existing frontmatter/header
+        content_clean = _strip_leading_h1(_read_body(skill_file))  # Remove first H1
 
         # Generate header with activation mode
         header = generate_windsurf_rule_header(
             name=skill_name.replace("-", " ").title(),
-            mode=config.get("mode", "model"),
-            description=config.get("description", ""),
-            globs=config.get("globs") or [],
+            mode=config["mode"],
+            description=config["description"],
+            globs=config["globs"],
         )
 
-        # Merge additional .md files
-        for md_file in sorted(source_dir.glob("*.md")):
+        # Merge additional .md files. size is a lower bound on the final
+        # header + stripped body length; once past the limit the kept prefix
+        # is fixed, so remaining files need not be read.
+        parts = [content_clean]
+        size = len(header) + len(content_clean.strip())
+        for md_file in md_files:
+            if size > WINDSURF_RULE_MAX_CHARS:
+                break
             if md_file.name != "SKILL.md":
-                additional = md_file.read_text(encoding="utf-8")
-                additional_clean = parser.strip(additional)
-                content_clean += f"\n\n---\n\n{additional_clean}"
+                part = f"\n\n---\n\n{_read_body(md_file)}"
+                parts.append(part)
+                size += len(part.strip())
 
-        output = f"{header}{content_clean.strip()}\n"
-        output = _truncate_windsurf_output(output)
+        output = _build_windsurf_output(header, "".join(parts).strip())
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting skill {source_dir.name}: {e}")
@@ -283,13 +353,11 @@ def convert_skill_to_windsurf_rule(source_dir: Path, dest_path: Path) -> bool:
 def convert_agent_to_windsurf_rule(source_path: Path, dest_path: Path) -> bool:
     """Convert agent to Windsurf rule."""
     try:
-        content = source_path.read_text(encoding="utf-8")
         agent_slug = source_path.stem.lower()
         agent_name = agent_slug.replace("-", " ").title()
 
-        # Remove existing frontmatter using FrontmatterParser
-        parser = FrontmatterParser()
-        content_clean = parser.strip(content)
+        # Remove existing frontmatter
+        content_clean = _read_body(source_path)
 
         # Generate header
         header = generate_windsurf_rule_header(
@@ -299,11 +367,9 @@ def convert_agent_to_windsurf_rule(source_path: Path, dest_path: Path) -> bool:
             globs=[],
         )
 
-        output = f"{header}{content_clean.strip()}\n"
-        output = _truncate_windsurf_output(output)
+        output = _build_windsurf_output(header, content_clean.strip())
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting agent {source_path.name}: {e}")
@@ -316,20 +382,18 @@ def convert_workflow_to_windsurf(source_path: Path, dest_path: Path) -> bool:
         content = source_path.read_text(encoding="utf-8")
         workflow_name = source_path.stem.replace("-", " ").title()
 
-        # Extract steps from markdown
-        steps = []
-        step_matches = re.findall(r"^\d+\.\s+(.+)$", content, re.MULTILINE)
-        if step_matches:
-            steps = step_matches
-        else:
+        # Extract steps from markdown; matches stream into the writer
+        steps: Iterable[str]
+        if _RE_NUMBERED_STEP.search(content):
+            steps = (m.group(1) for m in _RE_NUMBERED_STEP.finditer(content))
+        elif _RE_STEP_HEADER.search(content):
             # Extract from headers
-            header_matches = re.findall(r"^##\s+(?:Step\s+\d+[:\s]*)?(.+)$", content, re.MULTILINE)
-            steps = header_matches if header_matches else ["Follow the instructions below"]
+            steps = (m.group(1) for m in _RE_STEP_HEADER.finditer(content))
+        else:
+            steps = ["Follow the instructions below"]
 
         # Extract description
-        desc_match = re.search(
-            r"^>\s*(.+?)$|^(?:Description|Purpose)[:\s]*(.+?)(?:\n|$)", content, re.MULTILINE | re.IGNORECASE
-        )
+        desc_match = _RE_DESC.search(content)
         description = ""
         if desc_match:
             description = (desc_match.group(1) or desc_match.group(2) or "").strip()
@@ -339,12 +403,11 @@ def convert_workflow_to_windsurf(source_path: Path, dest_path: Path) -> bool:
         content_clean = parser.strip(content)
 
         # Build workflow output
-        output = generate_workflow_content(workflow_name, steps, description)
-        output += f"\n\n---\n\n## Full Instructions\n\n{content_clean.strip()}\n"
-        output = _truncate_windsurf_output(output)
+        header = generate_workflow_content(workflow_name, steps, description)
+        header += "\n\n---\n\n## Full Instructions\n\n"
+        output = _build_windsurf_output(header, content_clean.strip())
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting workflow {source_path.name}: {e}")
@@ -354,36 +417,34 @@ def convert_workflow_to_windsurf(source_path: Path, dest_path: Path) -> bool:
 def create_windsurfrules(dest_root: Path, source_root: Path) -> bool:
     """Create legacy .windsurfrules file from project's actual agent knowledge."""
     try:
-        parts = ["# Project Rules for Windsurf", ""]
+        buf = io.StringIO()
+        buf.write("# Project Rules for Windsurf\n")
 
-        # Pull from always-on skills first (these are the most relevant)
-        parser = FrontmatterParser()
+        # Pull from always-on skills first (these are the most relevant);
+        # their bodies are usually cached from the skill conversion pass
         skills_src = source_root / ".agent" / "skills"
-        if skills_src.exists():
-            for skill_name in ["clean-code", "behavioral-modes"]:
-                skill_file = skills_src / skill_name / "SKILL.md"
-                if skill_file.exists():
-                    content = skill_file.read_text(encoding="utf-8")
-                    # Strip frontmatter using FrontmatterParser
-                    content = parser.strip(content)
-                    parts.append(content.strip())
-                    parts.append("")
+        for skill_name in ["clean-code", "behavioral-modes"]:
+            # _read_body's stat doubles as the existence check
+            try:
+                content = _read_body(skills_src / skill_name / "SKILL.md")
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            buf.write(f"\n{content.strip()}\n")
 
         # Add from AGENTS.md or ARCHITECTURE.md if present
         for candidate in ["AGENTS.md", ".agent/ARCHITECTURE.md"]:
             candidate_path = source_root / candidate
             if candidate_path.exists():
-                content = candidate_path.read_text(encoding="utf-8")
-                parts.append(content[:3000].strip())
-                parts.append("")
+                content = read_text_prefix(candidate_path, 3000)
+                buf.write(f"\n{content.strip()}\n")
                 break
 
         # Enforce max size for .windsurfrules (6000 chars is reasonable for root file)
-        output = "\n".join(parts)
+        output = buf.getvalue()
         if len(output) > 6000:
             output = output[:5950] + "\n\n... (see .windsurf/rules/ for full details)\n"
 
-        (dest_root / ".windsurfrules").write_text(output, encoding="utf-8")
+        write_output(dest_root / ".windsurfrules", output)
         return True
     except Exception as e:
         print(f"  Error creating .windsurfrules: {e}")
@@ -404,6 +465,9 @@ def convert_to_windsurf(source_root: Path, dest_root: Path, verbose: bool = True
     """
     stats = {"rules": 0, "workflows": 0, "errors": [], "warnings": []}
 
+    # Same-size edits within mtime granularity would otherwise hit stale bodies
+    _read_body_cached.cache_clear()
+
     agents_src = source_root / ".agent" / "agents"
     skills_src = source_root / ".agent" / "skills"
     workflows_src = source_root / ".agent" / "workflows"
@@ -411,48 +475,66 @@ def convert_to_windsurf(source_root: Path, dest_root: Path, verbose: bool = True
     rules_dest = dest_root / ".windsurf" / "rules"
     workflows_dest = dest_root / ".windsurf" / "workflows"
 
-    # Convert agents to rules
-    if agents_src.exists():
-        if verbose:
-            print("Converting agents to Windsurf rules...")
-
-        for agent_file in agents_src.glob("*.md"):
-            dest_file = rules_dest / agent_file.name
-            if convert_agent_to_windsurf_rule(agent_file, dest_file):
-                stats["rules"] += 1
-                if verbose:
-                    print(f"  ✓ {agent_file.name}")
-            else:
-                stats["errors"].append(f"rule:{agent_file.name}")
-
-    # Convert skills to rules
-    if skills_src.exists():
-        if verbose:
-            print("Converting skills to Windsurf rules...")
+    # Created once here; the per-file writers then skip mkdir entirely
+    if agents_src.exists() or skills_src.exists():
+        rules_dest.mkdir(parents=True, exist_ok=True)
+    if workflows_src.exists():
+        workflows_dest.mkdir(parents=True, exist_ok=True)
+
+    # Per-file conversions are I/O bound and write distinct files, so each
+    # section runs on a pool. Sections stay sequential (a skill rule may
+    # overwrite an agent rule of the same name) and results keep source order.
+    with ThreadPoolExecutor(max_workers=CONVERT_POOL_SIZE) as pool:
+        # Convert agents to rules
+        if agents_src.exists():
+            if verbose:
+                print("Converting agents to Windsurf rules...")
 
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
-                dest_file = rules_dest / f"{skill_dir.name}.md"
-                if convert_skill_to_windsurf_rule(skill_dir, dest_file):
+            agent_files = list(agents_src.glob("*.md"))
+            results = pool.map(
+                convert_agent_to_windsurf_rule, agent_files, [rules_dest / f.name for f in agent_files]
+            )
+            for agent_file, ok in zip(agent_files, results):
+                if ok:
+                    stats["rules"] += 1
+                    if verbose:
+                        print(f"  ✓ {agent_file.name}")
+                else:
+                    stats["errors"].append(f"rule:{agent_file.name}")
+
+        # Convert skills to rules
+        if skills_src.exists():
+            if verbose:
+                print("Converting skills to Windsurf rules...")
+
+            skill_dirs = [d for d in skills_src.iterdir() if d.is_dir()]
+            results = pool.map(
+                convert_skill_to_windsurf_rule, skill_dirs, [rules_dest / f"{d.name}.md" for d in skill_dirs]
+            )
+            for skill_dir, ok in zip(skill_dirs, results):
+                if ok:
                     stats["rules"] += 1
                     if verbose:
                         print(f"  ✓ {skill_dir.name}.md")
                 else:
                     stats["errors"].append(f"rule:{skill_dir.name}")
 
-    # Convert workflows
-    if workflows_src.exists():
-        if verbose:
-            print("Converting workflows to Windsurf format...")
-
-        for workflow_file in workflows_src.glob("*.md"):
-            dest_file = workflows_dest / workflow_file.name
-            if convert_workflow_to_windsurf(workflow_file, dest_file):
-                stats["workflows"] += 1
-                if verbose:
-                    print(f"  ✓ {workflow_file.name}")
-            else:
-                stats["errors"].append(f"workflow:{workflow_file.name}")
+        # Convert workflows
+        if workflows_src.exists():
+            if verbose:
+                print("Converting workflows to Windsurf format...")
+
+            workflow_files = list(workflows_src.glob("*.md"))
+            results = pool.map(
+                convert_workflow_to_windsurf, workflow_files, [workflows_dest / f.name for f in workflow_files]
+            )
+            for workflow_file, ok in zip(workflow_files, results):
+                if ok:
+                    stats["workflows"] += 1
+                    if verbose:
+                        print(f"  ✓ {workflow_file.name}")
+                else:
+                    stats["errors"].append(f"workflow:{workflow_file.name}")
 
     # Create legacy .windsurfrules
     if create_windsurfrules(dest_root, source_root):
@@ -5,12 +5,14 @@ Output: .github/agents/*.md, .github/skills/<skill>/SKILL.md,
 .github/prompts/*.prompt.md, .github/instructions/*.instructions.md
 """
 
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from agent_bridge.core.converter import BaseConverter, converter_registry
 from agent_bridge.core.types import CapturedFile, ConversionResult, IDEFormat
+from agent_bridge.utils.filesystem import scan_dir
 
 # Re-export cho tests va backward compatibility
 from agent_bridge.converters._copilot_impl import (
@@ -55,9 +57,10 @@ class CopilotConverter(BaseConverter):
         return install_mcp_for_ide(source_root, dest_root, "copilot")
 
     def clean(self, project_path: Path) -> bool:
-        github_dir = project_path / ".github"
-        if github_dir.exists():
-            shutil.rmtree(github_dir)
+        try:
+            shutil.rmtree(project_path / ".github")
+        except FileNotFoundError:
+            pass
         return True
 
     def reverse_convert(self, project_path: Path, agent_dir: Path, verbose: bool = True) -> List[CapturedFile]:
@@ -72,30 +75,28 @@ class CopilotConverter(BaseConverter):
 
     def build_bridge_meta_map(self, project_path: Path) -> Dict[str, str]:
         file_map: Dict[str, str] = {}
-        github_root = project_path / ".github"
-        if not github_root.exists():
-            return file_map
-
-        agents_dir = github_root / "agents"
-        if agents_dir.exists():
-            for f in agents_dir.glob("*.md"):
-                file_map[f".github/agents/{f.name}"] = f".agent/agents/{f.name}"
-
-        skills_dir = github_root / "skills"
-        if skills_dir.exists():
-            for d in skills_dir.iterdir():
-                if d.is_dir() and (d / "SKILL.md").exists():
-                    file_map[f".github/skills/{d.name}/SKILL.md"] = f".agent/skills/{d.name}/SKILL.md"
-
-        prompts_dir = github_root / "prompts"
-        if prompts_dir.exists():
-            for f in prompts_dir.glob("*.prompt.md"):
-                file_map[f".github/prompts/{f.name}"] = f".agent/workflows/{f.stem.replace('.prompt', '')}.md"
-
-        instructions_dir = github_root / "instructions"
-        if instructions_dir.exists():
-            for f in instructions_dir.glob("*.instructions.md"):
-                file_map[f".github/instructions/{f.name}"] = f".agent/rules/{f.stem.replace('.instructions', '')}.md"
+        # One scandir of .github/ answers every subdir existence check
+        subdirs = {e.name: e.path for e in scan_dir(project_path / ".github") if e.is_dir()}
+
+        if "agents" in subdirs:
+            for e in scan_dir(subdirs["agents"]):
+                if e.name.endswith(".md") and e.is_file():
+                    file_map[f".github/agents/{e.name}"] = f".agent/agents/{e.name.replace('.agent.md', '.md')}"
+
+        if "skills" in subdirs:
+            for e in scan_dir(subdirs["skills"]):
+                if e.is_dir() and os.path.exists(os.path.join(e.path, "SKILL.md")):
+                    file_map[f".github/skills/{e.name}/SKILL.md"] = f".agent/skills/{e.name}/SKILL.md"
+
+        if "prompts" in subdirs:
+            for e in scan_dir(subdirs["prompts"]):
+                if e.name.endswith(".prompt.md") and e.is_file():
+                    file_map[f".github/prompts/{e.name}"] = f".agent/workflows/{Path(e.name).stem.replace('.prompt', '')}.md"
+
+        if "instructions" in subdirs:
+            for e in scan_dir(subdirs["instructions"]):
+                if e.name.endswith(".instructions.md") and e.is_file():
+                    file_map[f".github/instructions/{e.name}"] = f".agent/rules/{Path(e.name).stem.replace('.instructions', '')}.md"
 
         return file_map
 
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from agent_bridge.core.converter import BaseConverter, converter_registry
+from agent_bridge.core.frontmatter import FrontmatterParser
 from agent_bridge.core.types import CapturedFile, ConversionResult, IDEFormat
 from agent_bridge.converters._cursor_impl import (
     apply_reverse_capture_cursor,
@@ -78,7 +79,8 @@ class CursorConverter(BaseConverter):
                 if f.name == "project-instructions.mdc":
                     continue
                 try:
-                    fm, _ = _parse_mdc_frontmatter(f.read_text(encoding="utf-8"))
+                    # Only the frontmatter is needed; skip reading the rule body
+                    fm, _ = _parse_mdc_frontmatter(FrontmatterParser.read_head(f))
                     always_apply = fm.get("alwaysApply", False)
                     globs = fm.get("globs")
                     # Check for empty globs (could be None, empty list [], or empty string "")
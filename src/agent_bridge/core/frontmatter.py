@@ -1,16 +1,112 @@
 """Shared frontmatter parsing and generation utilities."""
 
 import re
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 import yaml
 
-_RE_FRONTMATTER = re.compile(r"^---\n(.*?)\n---\n*", re.DOTALL)
+# libyaml C loader/emitter when available, pure-Python Safe* otherwise.
+# Import these instead of repeating the fallback in other modules.
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+# Frontmatter block that must end in "---\n"; group(1) is the YAML text and
+# .end() is where the body starts. Shared by converters that need the match.
+RE_FRONTMATTER_BLOCK = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
+
+# "key: value" where YAML would load value as a plain str: starts with a letter
+# (so never a number/date) and has no ':' or '#' (no nested mapping/comment).
+# Tabs (rejected by pure-Python PyYAML) and YAML line breaks are left to the loader.
+_RE_FLAT_LINE = re.compile(r"([A-Za-z_][\w-]*): +([A-Za-z][^:#\t\r\x85\u2028\u2029]*)")
+# Words the YAML 1.1 resolver turns into bool/None instead of str
+_YAML_RESERVED = frozenset(
+    w for base in ("yes", "no", "true", "false", "on", "off", "null") for w in (base, base.capitalize(), base.upper())
+)
+# Characters PyYAML's reader rejects; leave those blocks to it to raise
+_RE_YAML_NON_PRINTABLE = re.compile("[^\x09\x0A\x0D\x20-\x7E\x85\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010ffff]")
+
+
+def parse_flat_yaml(block: str) -> Optional[Dict[str, str]]:
+    """
+    Parse frontmatter made only of single-line ``key: text`` pairs without PyYAML.
+
+    Returns the same dict the YAML loader would, or None when any line needs
+    the real parser (nesting, lists, quotes, comments, non-str scalars).
+    """
+    if _RE_YAML_NON_PRINTABLE.search(block):
+        return None
+    result: Dict[str, str] = {}
+    for line in block.split("\n"):
+        if not line.strip():
+            continue
+        m = _RE_FLAT_LINE.fullmatch(line.rstrip("\r"))
+        if m is None:
+            return None
+        key, value = m.group(1), m.group(2).rstrip(" ")
+        if key in _YAML_RESERVED or value in _YAML_RESERVED:
+            return None
+        result[key] = value
+    return result or None
 
 
 class FrontmatterParser:
     """Parse and generate YAML/MDC frontmatter in markdown files."""
 
+    @staticmethod
+    def split(content: str) -> Tuple[Optional[str], str]:
+        """
+        Split content into the raw frontmatter block and the body.
+
+        Same boundaries as the ``^---\\n(.*?)\\n---\\n*`` regex, found with plain
+        string slicing instead of a DOTALL regex scan.
+
+        Returns:
+            (frontmatter_text or None, body_without_frontmatter)
+        """
+        if not content.startswith("---\n"):
+            return None, content
+        end = content.find("\n---", 4)
+        if end < 0:
+            return None, content
+        body_start = end + 4
+        while content.startswith("\n", body_start):
+            body_start += 1
+        return content[4:end], content[body_start:]
+
+    @staticmethod
+    def read_head(path: Path, chunk_size: int = 8192) -> str:
+        """
+        Read a file only as far as its frontmatter block.
+
+        Reads in chunks and stops at the closing ``\\n---``, so callers that
+        need just the metadata never read or decode the body. Newlines are
+        translated like ``Path.read_text``.
+
+        Returns:
+            "---\\n<yaml>\\n---\\n" (feed to split/extract), or "" when the
+            file has no frontmatter block.
+        """
+        with open(path, encoding="utf-8") as f:
+            head = f.read(chunk_size)
+            if not head.startswith("---\n"):
+                return ""
+            searched = 4
+            while True:
+                end = head.find("\n---", searched)
+                if end >= 0:
+                    return head[: end + 4] + "\n"
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return ""
+                # Marker may straddle the chunk boundary
+                searched = max(4, len(head) - 3)
+                head += chunk
+
     @staticmethod
     def extract(content: str) -> Tuple[Optional[Dict], str]:
         """
@@ -19,15 +115,17 @@ class FrontmatterParser:
         Returns:
             (metadata_dict or None, body_without_frontmatter)
         """
-        content = content.replace("\r\n", "\n")
-        match = _RE_FRONTMATTER.match(content)
-        if not match:
-            return None, content
+        block, body = FrontmatterParser.split(content.replace("\r\n", "\n"))
+        if block is None:
+            return None, body
+        flat = parse_flat_yaml(block)
+        if flat is not None:
+            return flat, body
         try:
-            metadata = yaml.safe_load(match.group(1))
-            return (metadata if isinstance(metadata, dict) else None), content[match.end():]
+            metadata = yaml.load(block, Loader=YamlLoader)
+            return (metadata if isinstance(metadata, dict) else None), body
         except yaml.YAMLError:
-            return None, content[match.end():]
+            return None, body
 
     @staticmethod
     def generate(metadata: Dict, body: str, style: str = "yaml") -> str:
@@ -49,13 +147,13 @@ class FrontmatterParser:
             lines.append("---")
             fm_str = "\n".join(lines)
         else:
-            fm_str = f"---\n{yaml.dump(metadata, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000).rstrip()}---"
+            fm_str = f"---\n{yaml.dump(metadata, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000).rstrip()}---"
         return f"{fm_str}\n\n{body.strip()}\n"
 
     @staticmethod
     def strip(content: str) -> str:
         """Remove frontmatter block from content, returning only the body."""
-        return _RE_FRONTMATTER.sub("", content.replace("\r\n", "\n"))
+        return FrontmatterParser.split(content.replace("\r\n", "\n"))[1]
 
     @staticmethod
     def strip_credit_line(content: str) -> str:
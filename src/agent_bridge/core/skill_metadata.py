@@ -5,8 +5,9 @@ Each skill can have IDE-specific activation/classification metadata.
 IDEs can query this registry or override with their own maps.
 """
 
-from typing import Dict, List, Optional
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 
 @dataclass
@@ -78,28 +79,39 @@ def get_skill_metadata(skill_name: str) -> Optional[SkillMetadata]:
     return SKILL_METADATA.get(skill_name)
 
 
-def get_cursor_config(skill_name: str) -> Optional[Dict[str, any]]:
-    """Get Cursor-specific config for a skill."""
-    metadata = get_skill_metadata(skill_name)
-    if not metadata or not metadata.cursor_mode:
-        return None
-
-    return {
+def _build_cursor_config(metadata: SkillMetadata) -> Mapping[str, Any]:
+    return MappingProxyType({
         "mode": metadata.cursor_mode,
         "globs": metadata.cursor_globs or "",
         "description": metadata.description,
         "alwaysApply": metadata.cursor_mode == "always-on",
-    }
+    })
 
 
-def get_windsurf_config(skill_name: str) -> Optional[Dict[str, any]]:
-    """Get Windsurf-specific config for a skill."""
-    metadata = get_skill_metadata(skill_name)
-    if not metadata or not metadata.windsurf_mode:
-        return None
-    
-    return {
+def _build_windsurf_config(metadata: SkillMetadata) -> Mapping[str, Any]:
+    return MappingProxyType({
         "mode": metadata.windsurf_mode,
         "globs": metadata.windsurf_globs,
         "description": metadata.description,
-    }
+    })
+
+
+# IDE configs built once from the registry; lookups in the per-skill convert
+# loops are a single dict.get instead of a fresh dict per call.
+# Read-only views, since every caller shares the same instance.
+_CURSOR_CONFIGS: Dict[str, Mapping[str, Any]] = {
+    name: _build_cursor_config(m) for name, m in SKILL_METADATA.items() if m.cursor_mode
+}
+_WINDSURF_CONFIGS: Dict[str, Mapping[str, Any]] = {
+    name: _build_windsurf_config(m) for name, m in SKILL_METADATA.items() if m.windsurf_mode
+}
+
+
+def get_cursor_config(skill_name: str) -> Optional[Mapping[str, Any]]:
+    """Get Cursor-specific config for a skill."""
+    return _CURSOR_CONFIGS.get(skill_name)
+
+
+def get_windsurf_config(skill_name: str) -> Optional[Mapping[str, Any]]:
+    """Get Windsurf-specific config for a skill."""
+    return _WINDSURF_CONFIGS.get(skill_name)
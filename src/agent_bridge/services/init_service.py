@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from agent_bridge.core.converter import converter_registry
+from agent_bridge.utils.filesystem import write_json
 from agent_bridge.vault import VaultManager
 from agent_bridge.vault.merger import MergeStrategy, merge_source_into_project
 
@@ -79,7 +80,6 @@ def run_init(
 
 def _write_bridge_meta(project_path: Path, format_names: List[str]) -> None:
     """Ghi .agent/.bridge-meta.json de track cac file da generate."""
-    import json
     from datetime import datetime, timezone
 
     agent_dir = project_path / ".agent"
@@ -97,7 +97,7 @@ def _write_bridge_meta(project_path: Path, format_names: List[str]) -> None:
         "generated_for": format_names,
         "file_map": file_map,
     }
-    (agent_dir / ".bridge-meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    write_json(agent_dir / ".bridge-meta.json", meta)
 
 
 def _fetch_vault(agent_dir: Path, overwrite: bool) -> None:
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from agent_bridge.core.types import SnapshotInfo
+from agent_bridge.utils.filesystem import write_json
 from agent_bridge.vault.manager import VAULTS_CONFIG_DIR
 
 SNAPSHOTS_DIR = VAULTS_CONFIG_DIR / "snapshots"
@@ -114,9 +115,7 @@ def save_snapshot(
             "contents": contents,
             "tags": tags,
         }
-        (tmp_dir / "manifest.json").write_text(
-            json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_json(tmp_dir / "manifest.json", manifest)
 
         # Atomic swap
         if snapshot_path.exists():
@@ -3,13 +3,17 @@ Business logic for 'agent-bridge status' command.
 Collects project state and returns structured data for display.
 """
 
+import functools
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from agent_bridge.vault import manager as vault_manager
 from agent_bridge.vault.manager import VaultManager
 from agent_bridge.core.converter import converter_registry
+from agent_bridge.utils.filesystem import read_json
 
 
 @dataclass
@@ -54,10 +58,16 @@ def collect_status(project_path: Path) -> ProjectStatus:
     """Main entry point. Collects all project status data."""
     agent_dir = project_path / ".agent"
     agent_dir_exists = agent_dir.exists()
+    # Single reference time so every freshness/staleness check agrees
+    now = datetime.now()
     
-    agent_counts = _count_agent_content(agent_dir) if agent_dir_exists else {}
-    vault_statuses = _get_vault_statuses()
-    ide_statuses = _get_ide_statuses(project_path, agent_dir)
+    # One pass over .agent/ yields both the content counts and newest mtime
+    if agent_dir_exists:
+        agent_counts, agent_newest = _scan_agent_dir(agent_dir)
+    else:
+        agent_counts, agent_newest = {}, None
+    vault_statuses = _get_vault_statuses(now)
+    ide_statuses = _get_ide_statuses(project_path, agent_newest)
     mcp_info = _get_mcp_info(agent_dir) if agent_dir_exists else None
     
     return ProjectStatus(
@@ -72,53 +82,102 @@ def collect_status(project_path: Path) -> ProjectStatus:
 
 def _count_agent_content(agent_dir: Path) -> Dict[str, int]:
     """Count agents/*.md, skills/*/ (dirs), workflows/*.md, rules/*.md"""
+    return {
+        "agents": _count_md(agent_dir / "agents"),
+        "skills": _count_subdirs(agent_dir / "skills"),
+        "workflows": _count_md(agent_dir / "workflows"),
+        "rules": _count_md(agent_dir / "rules"),
+    }
+
+
+def _count_md(directory: Path) -> int:
+    """Count *.md files directly under directory (one scandir, no per-entry stat)."""
+    try:
+        with os.scandir(directory) as it:
+            return sum(1 for e in it if e.name.endswith(".md") and e.is_file())
+    except OSError:
+        return 0
+
+
+def _count_subdirs(directory: Path) -> int:
+    """Count immediate subdirectories of directory."""
+    try:
+        with os.scandir(directory) as it:
+            return sum(1 for e in it if e.is_dir())
+    except OSError:
+        return 0
+
+
+def _scan_agent_dir(agent_dir: Path) -> Tuple[Dict[str, int], Optional[datetime]]:
+    """
+    Walk .agent/ once, collecting content counts and the newest file mtime.
+
+    Returns:
+        (counts, newest) where counts has agents/skills/workflows/rules keys
+        and newest is None if the tree has no files.
+    """
     counts = {"agents": 0, "skills": 0, "workflows": 0, "rules": 0}
-    
-    if not agent_dir.exists():
-        return counts
-    
-    agents_dir = agent_dir / "agents"
-    if agents_dir.exists():
-        counts["agents"] = len([f for f in agents_dir.glob("*.md") if f.is_file()])
-    
-    skills_dir = agent_dir / "skills"
-    if skills_dir.exists():
-        counts["skills"] = len([d for d in skills_dir.iterdir() if d.is_dir()])
-    
-    workflows_dir = agent_dir / "workflows"
-    if workflows_dir.exists():
-        counts["workflows"] = len([f for f in workflows_dir.glob("*.md") if f.is_file()])
-    
-    rules_dir = agent_dir / "rules"
-    if rules_dir.exists():
-        counts["rules"] = len([f for f in rules_dir.glob("*.md") if f.is_file()])
-    
-    return counts
+    newest_ns = 0
+    found = False
 
+    root = os.fspath(agent_dir)
+    # (path, counts key when path is a direct child like .agent/agents)
+    stack: List[Tuple[str, Optional[str]]] = [(root, None)]
+    while stack:
+        path, bucket = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if bucket == "skills":
+                            counts["skills"] += 1
+                        if not entry.is_symlink():
+                            child = entry.name if path == root and entry.name in counts else None
+                            stack.append((entry.path, child))
+                    elif entry.is_file():
+                        if bucket and bucket != "skills" and entry.name.endswith(".md"):
+                            counts[bucket] += 1
+                        mtime_ns = entry.stat().st_mtime_ns
+                        found = True
+                        if mtime_ns > newest_ns:
+                            newest_ns = mtime_ns
+                except OSError:
+                    continue
 
-def _get_vault_statuses() -> List[VaultStatus]:
-    """Get status of all registered vaults."""
-    vm = VaultManager()
+    return counts, (datetime.fromtimestamp(newest_ns / 1e9) if found else None)
+
+
+def _get_vault_statuses(now: Optional[datetime] = None) -> List[VaultStatus]:
+    """Get status of all registered vaults, relative to ``now`` (default: current time)."""
+    if now is None:
+        now = datetime.now()
+    vm = _get_vault_manager()
     statuses = []
     
     for vault in vm.vaults:
-        is_cached = vault.cache_path.exists() if not vault.is_local else True
+        # One stat() per path instead of exists() followed by stat()
+        cache_st = None if vault.is_local else _try_stat(vault.cache_path)
+        is_cached = True if vault.is_local else cache_st is not None
         last_synced = None
         
         if vault.is_local:
-            local_path = Path(vault.url).resolve()
-            if local_path.exists():
-                last_synced = datetime.fromtimestamp(local_path.stat().st_mtime)
+            local_st = _try_stat(Path(vault.url))
+            if local_st:
+                last_synced = datetime.fromtimestamp(local_st.st_mtime)
         elif vault.is_builtin:
             # Builtin is always "synced"
-            last_synced = datetime.now()
-        elif vault.cache_path.exists():
-            last_synced = datetime.fromtimestamp(vault.cache_path.stat().st_mtime)
+            last_synced = now
+        elif cache_st:
+            last_synced = datetime.fromtimestamp(cache_st.st_mtime)
         
-        freshness = _relative_time(last_synced) if last_synced else "never synced"
+        freshness = _relative_time(last_synced, now) if last_synced else "never synced"
         stale = False
         if last_synced:
-            age_hours = (datetime.now() - last_synced).total_seconds() / 3600
+            age_hours = (now - last_synced).total_seconds() / 3600
             stale = age_hours > 24
         
         source_type = "builtin" if vault.is_builtin else ("local" if vault.is_local else "git")
@@ -136,24 +195,47 @@ def _get_vault_statuses() -> List[VaultStatus]:
     return statuses
 
 
-def _get_ide_statuses(project_path: Path, agent_dir: Path) -> List[IDEStatus]:
-    """Check initialization status for all registered IDEs."""
+def _get_vault_manager() -> VaultManager:
+    """
+    VaultManager reused across status calls while vaults.json is unchanged.
+
+    Every VaultManager mutation rewrites vaults.json, so keying on its
+    path and (mtime, size) picks up vaults added/removed in the same process
+    (e.g. TUI) as well as a config path that moved (different HOME).
+    """
+    config_file = vault_manager.VAULTS_CONFIG_FILE
+    st = _try_stat(config_file)
+    stamp = (st.st_mtime_ns, st.st_size) if st else None
+    return _load_vault_manager(os.fspath(config_file), stamp)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_vault_manager(config_path: str, config_stamp: Optional[Tuple[int, int]]) -> VaultManager:
+    return VaultManager()
+
+
+def _get_ide_statuses(project_path: Path, agent_newest: Optional[datetime]) -> List[IDEStatus]:
+    """
+    Check initialization status for all registered IDEs.
+
+    Args:
+        project_path: Project root
+        agent_newest: Newest mtime in .agent/ (from _scan_agent_dir), None if absent
+    """
     statuses = []
     
-    # Get newest mtime in .agent/ tree
-    agent_newest = _get_newest_mtime(agent_dir) if agent_dir.exists() else None
-    
     for converter in converter_registry.all():
         fmt = converter.format_info  # Property, not method
         output_dir = project_path / fmt.output_dir
         
-        initialized = output_dir.exists() and any(output_dir.rglob("*"))
-        file_count = len(list(output_dir.rglob("*"))) if initialized else 0
+        # One walk gives both the file count and the newest mtime
+        file_count, ide_newest_ts = _walk_stats(output_dir)
+        initialized = file_count > 0
         
         is_stale = False
         if initialized and agent_newest:
-            ide_newest = _get_newest_mtime(output_dir)
-            if ide_newest and agent_newest > ide_newest:
+            ide_newest = datetime.fromtimestamp(ide_newest_ts)
+            if agent_newest > ide_newest:
                 is_stale = True
         
         statuses.append(IDEStatus(
@@ -170,47 +252,84 @@ def _get_ide_statuses(project_path: Path, agent_dir: Path) -> List[IDEStatus]:
 
 def _get_mcp_info(agent_dir: Path) -> Optional[MCPInfo]:
     """Load .agent/mcp_config.json and extract server info."""
-    import json
-    
     mcp_file = agent_dir / "mcp_config.json"
-    if not mcp_file.exists():
+    st = _try_stat(mcp_file)
+    if st is None:
         return None
     
+    server_names = _load_mcp_server_names(str(mcp_file), st.st_mtime_ns, st.st_size)
+    if server_names is None:
+        return None
+    return MCPInfo(
+        config_exists=True,
+        server_names=list(server_names),
+        server_count=len(server_names),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_mcp_server_names(path_str: str, mtime_ns: int, size: int) -> Optional[Tuple[str, ...]]:
+    """Server names from mcp_config.json, reparsed only when (mtime, size) changes."""
     try:
-        config = json.loads(mcp_file.read_text(encoding="utf-8"))
+        config = read_json(Path(path_str))
         servers = config.get("mcpServers", {})
-        server_names = list(servers.keys())
-        
-        return MCPInfo(
-            config_exists=True,
-            server_names=server_names,
-            server_count=len(server_names),
-        )
-    except (json.JSONDecodeError, KeyError):
+        return tuple(servers.keys())
+    except (OSError, ValueError, KeyError, AttributeError):
         return None
 
 
+def _try_stat(path: Path) -> Optional[os.stat_result]:
+    """os.stat() that returns None instead of raising when the path is missing."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _walk_stats(directory: Path) -> Tuple[int, float]:
+    """
+    Single os.scandir walk over a directory tree.
+
+    Returns:
+        (file_count, newest_mtime_timestamp); (0, 0.0) if missing or empty.
+        DirEntry caches readdir type info, so only files cost a stat() call.
+    """
+    count = 0
+    # Integer ns compare per file; converted to seconds once at the end
+    newest_ns = 0
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        count += 1
+                        mtime_ns = entry.stat().st_mtime_ns
+                        if mtime_ns > newest_ns:
+                            newest_ns = mtime_ns
+                except OSError:
+                    continue
+    return count, newest_ns / 1e9
+
+
 def _get_newest_mtime(directory: Path) -> Optional[datetime]:
     """Get the newest modification time in a directory tree."""
-    if not directory.exists():
-        return None
-    
-    newest = None
-    for item in directory.rglob("*"):
-        if item.is_file():
-            mtime = datetime.fromtimestamp(item.stat().st_mtime)
-            if newest is None or mtime > newest:
-                newest = mtime
-    
-    return newest
+    count, newest = _walk_stats(directory)
+    return datetime.fromtimestamp(newest) if count else None
 
 
-def _relative_time(dt: Optional[datetime]) -> str:
+def _relative_time(dt: Optional[datetime], now: Optional[datetime] = None) -> str:
     """Convert datetime to human-friendly string like '2h ago', '3d ago'."""
     if dt is None:
         return "never"
     
-    delta = datetime.now() - dt
+    delta = (now or datetime.now()) - dt
     seconds = delta.total_seconds()
     
     if seconds < 60:
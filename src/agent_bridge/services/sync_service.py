@@ -55,11 +55,12 @@ def run_update(target_dir: Path, verbose: bool = True) -> None:
         if verbose:
             print_error("All vault syncs failed")
             
-            # Analyze failure types
-            network_errors = [name for name, stats in sync_results.items() 
-                            if "network" in str(stats.get("status", "")).lower() or "timeout" in str(stats.get("status", "")).lower()]
-            auth_errors = [name for name, stats in sync_results.items() 
-                          if "auth" in str(stats.get("status", "")).lower() or "permission" in str(stats.get("status", "")).lower() or "publickey" in str(stats.get("status", "")).lower()]
+            # Analyze failure types (lowercase each status once)
+            statuses = {name: str(stats.get("status", "")).lower() for name, stats in sync_results.items()}
+            network_errors = [name for name, status in statuses.items()
+                              if "network" in status or "timeout" in status]
+            auth_errors = [name for name, status in statuses.items()
+                           if "auth" in status or "permission" in status or "publickey" in status]
             
             if network_errors:
                 print_info("Network issues detected. Check your internet connection.")
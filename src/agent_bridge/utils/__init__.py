@@ -6,12 +6,32 @@ existing ``from agent_bridge.utils import X`` imports continue to work.
 """
 
 # Sub-modules (importable as agent_bridge.utils.colors, etc.)
-from agent_bridge.utils import colors, display, filesystem, mcp  # noqa: F401
+from agent_bridge.utils import colors, content_cache, display, filesystem, mcp  # noqa: F401
 
 # Flat re-exports — keep every name that was public in the original utils.py
 from agent_bridge.utils.colors import Colors
+from agent_bridge.utils.content_cache import ContentHashCache, content_digest, convert_changed
 from agent_bridge.utils.display import print_error, print_header, print_info, print_success
-from agent_bridge.utils.filesystem import ensure_dir, safe_copy, safe_remove
+from agent_bridge.utils.filesystem import (
+    copy_tree,
+    decode_text,
+    dumps_json,
+    ensure_dir,
+    is_nonempty_dir,
+    is_within,
+    loads_json,
+    mirror_tree,
+    read_files_parallel,
+    read_json,
+    read_text_prefix,
+    reflink_copy_function,
+    safe_copy,
+    safe_remove,
+    scan_dir,
+    scan_md_files,
+    write_json,
+    write_output,
+)
 from agent_bridge.utils.mcp import (
     _transform_mcp_config,
     install_mcp_for_ide,
@@ -24,6 +44,7 @@ from agent_bridge.utils.mcp import (
 
 import json
 import logging
+import os
 import re
 import shutil
 from pathlib import Path
@@ -31,6 +52,8 @@ from typing import Any, Dict, Optional
 
 import yaml
 
+from agent_bridge.core.frontmatter import YamlDumper, YamlLoader
+
 logger = logging.getLogger("agent_bridge")
 
 
@@ -47,11 +70,15 @@ def ask_user(question: str, default: bool = True) -> bool:
             return False
 
 
+# Package-relative fallback; resolved once at import rather than per lookup
+_BUNDLED_AGENT_DIR = Path(__file__).resolve().parent.parent.parent / ".agent"
+
+
 def get_master_agent_dir() -> Path:
     xdg_path = Path.home() / ".config" / "agent-bridge" / "cache" / "antigravity-kit" / ".agent"
     if xdg_path.exists():
         return xdg_path
-    return Path(__file__).resolve().parent.parent.parent / ".agent"
+    return _BUNDLED_AGENT_DIR
 
 
 def confirm_overwrite(path: Path, default: bool = False) -> bool:
@@ -72,7 +99,7 @@ def validate_path_within_project(path: Path, project_root: Path = None) -> bool:
     try:
         resolved = path.resolve()
         project_resolved = project_root.resolve()
-        return str(resolved).startswith(str(project_resolved))
+        return is_within(resolved, project_resolved)
     except (OSError, ValueError):
         return False
 
@@ -95,11 +122,20 @@ _RE_H1 = re.compile(r"^#\s+(.+)$", re.MULTILINE)
 
 
 def strip_frontmatter(content: str) -> str:
-    return _RE_FRONTMATTER_STRIP.sub("", content)
+    # Most vault files carry no frontmatter; skip the regex pass entirely
+    if not content.startswith("---\n"):
+        return content
+    # Anchored match: sub() would retry the ^ at every later offset
+    m = _RE_FRONTMATTER_STRIP.match(content)
+    return content[m.end():] if m else content
 
 
 def resolve_source_root(source_dir: str) -> Optional[Path]:
-    root_path = Path(source_dir).resolve()
+    # Common case "--source .agent": lexical check, no resolve() lstat walk
+    candidate = Path(os.path.abspath(source_dir))
+    if candidate.name == ".agent":
+        return candidate.parent
+    root_path = candidate.resolve()
     if root_path.name == ".agent":
         return root_path.parent
     elif (root_path / ".agent").exists():
@@ -114,20 +150,23 @@ def resolve_source_root(source_dir: str) -> Optional[Path]:
 
 
 def extract_yaml_frontmatter(content: str) -> tuple[Optional[Dict], str]:
-    match = re.match(r"^---\n(.*?)\n---\n*", content, re.DOTALL)
-    if match:
+    from agent_bridge.core.frontmatter import FrontmatterParser, parse_flat_yaml
+
+    block, body = FrontmatterParser.split(content)
+    if block is not None:
+        flat = parse_flat_yaml(block)
+        if flat is not None:
+            return flat, body
         try:
-            frontmatter = yaml.safe_load(match.group(1))
-            body = content[match.end():]
-            return frontmatter, body
+            return yaml.load(block, Loader=YamlLoader), body
         except yaml.YAMLError:
             pass
     return None, content
 
 
 def add_yaml_frontmatter(content: str, frontmatter: Dict) -> str:
-    content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
-    fm_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    content_clean = strip_frontmatter(content)
+    fm_str = yaml.dump(frontmatter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000)
     return f"---\n{fm_str}---\n\n{content_clean.strip()}\n"
 
 
@@ -139,13 +178,15 @@ def truncate_content(content: str, max_length: int, suffix: str = "\n\n... (trun
 
 __all__ = [
     # sub-modules
-    "colors", "display", "filesystem", "mcp",
+    "colors", "content_cache", "display", "filesystem", "mcp",
     # colors
     "Colors",
+    # content_cache
+    "ContentHashCache", "content_digest", "convert_changed",
     # display
     "print_header", "print_success", "print_error", "print_info",
     # filesystem
-    "safe_copy", "safe_remove", "ensure_dir",
+    "safe_copy", "safe_remove", "copy_tree", "decode_text", "dumps_json", "ensure_dir", "is_nonempty_dir", "is_within", "loads_json", "mirror_tree", "read_files_parallel", "read_json", "read_text_prefix", "reflink_copy_function", "scan_dir", "scan_md_files", "write_json", "write_output",
     # mcp
     "load_mcp_config", "write_mcp_config", "install_mcp_for_ide", "_transform_mcp_config",
     # misc (kept here)
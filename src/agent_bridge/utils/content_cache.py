@@ -0,0 +1,163 @@
+"""Content-hash index used to skip rewriting unchanged generated files."""
+
+import hashlib
+import json
+import os
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from agent_bridge.utils.filesystem import read_files_parallel
+
+# Indexes live in the user config dir, never inside versioned IDE output dirs
+INDEX_DIR = Path.home() / ".config" / "agent-bridge" / "output-index"
+
+# Index files kept in INDEX_DIR; the least recently written beyond this are pruned
+MAX_INDEX_FILES = 64
+
+# Truthy convert_changed() result for outputs skipped because their source is unchanged
+UNCHANGED = "unchanged"
+
+
+def content_digest(*parts: bytes) -> str:
+    """Return a short blake2b hex digest over the given byte chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def index_path_for(dest_root: Path, name: str) -> Path:
+    """Index file for one IDE's outputs under ``dest_root`` (one per project and IDE)."""
+    root_key = content_digest(os.fsencode(os.path.abspath(dest_root)))
+    return INDEX_DIR / f"{root_key}-{name}.json"
+
+
+def _prune_index_dir(index_dir: Path, keep: int = MAX_INDEX_FILES) -> None:
+    """Delete all but the ``keep`` most recently written index files."""
+    try:
+        with os.scandir(index_dir) as it:
+            files = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    except OSError:
+        return
+    if len(files) <= keep:
+        return
+    files.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+    for entry in files[keep:]:
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _output_stamp(dest: Path) -> Tuple[int, int]:
+    st = os.stat(dest)
+    return st.st_size, st.st_mtime_ns
+
+
+class ContentHashCache:
+    """
+    Index of {output_key: [source_digest, output_size, output_mtime_ns]}.
+
+    Converters check ``is_fresh()`` before regenerating an output file and call
+    ``save()`` once at the end of the run. An output counts as fresh only if its
+    source digest matches and the file still has the size/mtime it was written
+    with, so hand-edited or damaged outputs are regenerated. The index is
+    discarded whenever the package version changes, since generated output may
+    differ between releases.
+    """
+
+    def __init__(self, index_path: Path):
+        from agent_bridge import __version__
+
+        self.index_path = index_path
+        self._version = __version__
+        self._entries: Dict[str, List] = {}
+        self._dirty = False
+
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self._version:
+            entries = data.get("outputs")
+            if isinstance(entries, dict):
+                self._entries = {
+                    str(k): v for k, v in entries.items() if isinstance(v, list) and len(v) == 3
+                }
+
+    def is_fresh(self, key: str, digest: str, dest: Path) -> bool:
+        """True if ``dest`` was generated from ``digest`` and is unmodified since."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != digest:
+            return False
+        try:
+            return list(_output_stamp(dest)) == entry[1:]
+        except OSError:
+            return False
+
+    def update(self, key: str, digest: str, dest: Path) -> None:
+        """Record that ``dest`` was just written from content with ``digest``."""
+        try:
+            entry = [digest, *_output_stamp(dest)]
+        except OSError:
+            return
+        if self._entries.get(key) != entry:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """
+        Write the index back if anything changed. Failures are non-fatal.
+
+        Creating a new index file also prunes INDEX_DIR to MAX_INDEX_FILES,
+        so projects that no longer exist do not accumulate indexes forever.
+        """
+        if not self._dirty:
+            return
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not self.index_path.exists()
+            data = {"version": self._version, "outputs": self._entries}
+            self.index_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+            self._dirty = False
+        except OSError:
+            return
+        if is_new:
+            _prune_index_dir(self.index_path.parent)
+
+
+def convert_changed(
+    pool: Executor,
+    hash_cache: ContentHashCache,
+    section: str,
+    convert: Callable[[Path, Path], bool],
+    sources: List[Path],
+    dests: List[Path],
+) -> List[Union[bool, str]]:
+    """
+    Run ``convert`` on the pool for sources whose content changed since the last run.
+
+    Returns one result per source, in order: UNCHANGED when the existing
+    output is still fresh, otherwise the converter's bool.
+    """
+    raw_contents = read_files_parallel(sources)
+    keys = [f"{section}/{d.name}" for d in dests]
+    digests: List[Optional[str]] = []
+    for source in sources:
+        raw = raw_contents[source]
+        digests.append(content_digest(raw) if raw is not None else None)
+    stale = [
+        i for i, (key, digest, dest) in enumerate(zip(keys, digests, dests))
+        if not (digest and hash_cache.is_fresh(key, digest, dest))
+    ]
+
+    results: List[Union[bool, str]] = [UNCHANGED] * len(sources)
+    converted = pool.map(convert, [sources[i] for i in stale], [dests[i] for i in stale])
+    for i, ok in zip(stale, converted):
+        results[i] = ok
+        digest = digests[i]
+        if ok and digest is not None:
+            hash_cache.update(keys[i], digest, dests[i])
+    return results
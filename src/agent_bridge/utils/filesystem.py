@@ -1,19 +1,156 @@
 """Filesystem utility helpers."""
 
+import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # optional: pip install agent-bridge[fast]
+    orjson = None
 
-def safe_copy(src: Path, dest: Path, overwrite: bool = True) -> bool:
-    """Safely copy file or directory."""
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# open()/read() latency dominates on cold caches; a small pool overlaps it
+READ_POOL_SIZE = 8
+
+# Worker threads for per-file conversion (read + transform + write) in converters
+CONVERT_POOL_SIZE = 8
+
+# Same flags/mode as open(path, "wb"); O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Linux FICLONE ioctl (cp --reflink): btrfs/XFS/bcachefs share extents copy-on-write
+_FICLONE = 0x40049409
+
+
+def copy_tree(src: Path, dest: Path, copy_function: Callable[[str, str], Any] = shutil.copy2) -> None:
+    """
+    Recursively copy src into dest (existing dirs are reused, like dirs_exist_ok).
+
+    Walks with os.scandir so directory checks come from the cached DirEntry type
+    instead of an extra stat per entry. Files go through ``copy_function``;
+    shutil's copy helpers use the kernel sendfile fast path on Linux.
+    Symlinks are followed, matching shutil.copytree's default.
+    """
+    stack = [(os.fspath(src), os.fspath(dest))]
+    while stack:
+        src_dir, dest_dir = stack.pop()
+        os.makedirs(dest_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dest_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                else:
+                    copy_function(entry.path, target)
+
+
+def reflink_copy_function(preserve_metadata: bool = False) -> Callable[[str, str], Any]:
+    """
+    copy_function for copy_tree that clones files instead of copying bytes.
+
+    Uses a reflink where the filesystem supports it: the clone shares data
+    blocks copy-on-write, so it costs no content I/O yet later edits to either
+    side stay independent (unlike a hardlink). After the first failed clone
+    (ext4, tmpfs, cross-device, non-Linux) the returned function falls back
+    to shutil.copy / shutil.copy2 for the rest of its use.
+    """
+    fallback = shutil.copy2 if preserve_metadata else shutil.copy
+    copy_meta = shutil.copystat if preserve_metadata else shutil.copymode
+    ioctl = getattr(fcntl, "ioctl", None)
+    supported = ioctl is not None
+
+    def copy(src: str, dst: str) -> Any:
+        nonlocal supported
+        if supported and ioctl is not None:
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                supported = False
+            else:
+                copy_meta(src, dst)
+                return dst
+        return fallback(src, dst)
+
+    return copy
+
+
+def mirror_tree(src: Path, dest: Path, prune: bool = True) -> int:
+    """
+    Make dest an exact copy of src, rewriting only files that changed.
+
+    A file is unchanged when size and st_mtime_ns match; changed files go
+    through shutil.copy2 so their mtime is carried over for the next
+    comparison. Entries missing from src are removed from dest unless
+    ``prune`` is False. Re-syncing an unchanged tree therefore writes nothing.
+
+    Returns:
+        Number of files copied.
+    """
+    copied = 0
+    stack = [(os.fspath(src), os.fspath(dest))]
+    while stack:
+        src_dir, dest_dir = stack.pop()
+        os.makedirs(dest_dir, exist_ok=True)
+        with os.scandir(dest_dir) as it:
+            stale = {e.name: e for e in it}
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dest_dir, entry.name)
+                existing = stale.pop(entry.name, None)
+                if entry.is_dir():
+                    if existing is not None and not existing.is_dir(follow_symlinks=False):
+                        os.unlink(target)
+                    stack.append((entry.path, target))
+                    continue
+                if existing is not None:
+                    if existing.is_dir(follow_symlinks=False):
+                        shutil.rmtree(target)
+                    elif existing.is_file(follow_symlinks=False):
+                        src_st = entry.stat()
+                        dest_st = existing.stat(follow_symlinks=False)
+                        if src_st.st_size == dest_st.st_size and src_st.st_mtime_ns == dest_st.st_mtime_ns:
+                            continue
+                    else:
+                        os.unlink(target)
+                shutil.copy2(entry.path, target)
+                copied += 1
+        if not prune:
+            continue
+        for entry in stale.values():
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    return copied
+
+
+def safe_copy(src: Path, dest: Path, overwrite: bool = True, preserve_metadata: bool = False) -> bool:
+    """
+    Safely copy file or directory.
+
+    Content and permission bits are copied; timestamps only with preserve_metadata.
+    """
+    copy_function = shutil.copy2 if preserve_metadata else shutil.copy
     try:
         if dest.exists() and not overwrite:
             return False
         dest.parent.mkdir(parents=True, exist_ok=True)
         if src.is_dir():
-            shutil.copytree(src, dest, dirs_exist_ok=True)
+            copy_tree(src, dest, copy_function=copy_function)
         else:
-            shutil.copy2(src, dest)
+            copy_function(src, dest)
         return True
     except Exception as e:
         print(f"  Error copying {src} to {dest}: {e}")
@@ -43,3 +180,140 @@ def ensure_dir(path: Path) -> bool:
     except Exception as e:
         print(f"  Error creating directory {path}: {e}")
         return False
+
+
+def is_nonempty_dir(path: Path) -> bool:
+    """True if path is a directory with at least one entry (reads one entry only)."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except OSError:
+        return False
+
+
+def scan_dir(directory: Path) -> List[os.DirEntry]:
+    """
+    List a directory once with os.scandir; [] if it is missing or unreadable.
+
+    DirEntry.is_dir()/is_file() answer from the cached d_type, so callers
+    avoid a stat() per child that Path.iterdir() + is_dir() would cost.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def scan_md_files(directory: Path) -> List[Path]:
+    """*.md files directly under directory (same set as glob("*.md") minus dirs)."""
+    return [Path(e.path) for e in scan_dir(directory) if e.name.endswith(".md") and e.is_file()]
+
+
+def is_within(path: Path, root: Path) -> bool:
+    """
+    True if path equals root or lies under it (both should already be resolved).
+
+    Compares path components, so a sibling sharing a string prefix
+    (/proj-other vs /proj) is not treated as inside.
+    """
+    if hasattr(path, "is_relative_to"):
+        return path.is_relative_to(root)
+    # Python 3.8: PurePath.is_relative_to is missing
+    try:
+        return os.path.commonpath([str(path), str(root)]) == str(root)
+    except ValueError:
+        return False
+
+
+def read_text_prefix(path: Path, limit: int, encoding: str = "utf-8") -> str:
+    """
+    Read at most ``limit`` characters from the start of a text file.
+
+    Decodes only the leading chunk instead of the whole file, for callers
+    that keep just a prefix.
+    """
+    with open(path, encoding=encoding) as f:
+        return f.read(limit)
+
+
+def _read_bytes_or_none(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def read_files_parallel(paths: Iterable[Path]) -> Dict[Path, Optional[bytes]]:
+    """
+    Read many small files concurrently.
+
+    Returns:
+        {path: raw bytes}, with None for files that could not be read.
+        Decoding is left to the caller.
+    """
+    paths = list(paths)
+    if len(paths) < 2:
+        return {p: _read_bytes_or_none(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=min(READ_POOL_SIZE, len(paths))) as pool:
+        return dict(zip(paths, pool.map(_read_bytes_or_none, paths)))
+
+
+def decode_text(raw: bytes, encoding: str = "utf-8") -> str:
+    """
+    Decode raw file bytes the way a text-mode read would.
+
+    Universal newlines: CRLF and lone CR become LF, so sources saved on
+    Windows parse the same as read_text() output.
+    """
+    return raw.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed). Raises ValueError like ``json.loads``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file. Raises OSError / ValueError like ``json.loads``."""
+    return loads_json(path.read_bytes())
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Encode ``obj`` as 2-space indented UTF-8 JSON (non-ASCII kept as-is).
+
+    Uses orjson when installed; raises ValueError/TypeError (orjson) or
+    UnicodeEncodeError (stdlib) on unencodable data, before anything is written.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """Write ``obj`` as 2-space indented UTF-8 JSON (non-ASCII kept as-is)."""
+    path.write_bytes(dumps_json(obj))
+
+
+def _write_fd(dest_path: Path, data: bytes) -> None:
+    # Raw fd write: no FileIO/BufferedWriter objects for a one-shot write
+    fd = os.open(dest_path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_output(dest_path: Path, text: str) -> None:
+    """Write ``text`` as UTF-8; the parent is only created if the write misses it."""
+    data = text.encode()
+    try:
+        _write_fd(dest_path, data)
+    except FileNotFoundError:
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_fd(dest_path, data)
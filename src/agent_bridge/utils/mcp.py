@@ -1,26 +1,47 @@
 """MCP configuration helpers."""
 
-import json
+import functools
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from agent_bridge.utils.filesystem import loads_json, write_json
+
 
 def load_mcp_config(source_root: Path) -> Optional[Dict[str, Any]]:
-    """Load MCP configuration from .agent/mcp_config.json."""
+    """
+    Load MCP configuration from .agent/mcp_config.json.
+
+    The file bytes are cached per (path, mtime, size), so installing for several
+    IDEs in one run reads the file once; each call parses a fresh dict.
+    """
     mcp_file = source_root / ".agent" / "mcp_config.json"
-    if mcp_file.exists():
-        try:
-            return json.loads(mcp_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return None
-    return None
+    try:
+        st = os.stat(mcp_file)
+    except OSError:
+        return None
+    data = _read_mcp_cached(os.fspath(mcp_file), st.st_mtime_ns, st.st_size)
+    if data is None:
+        return None
+    try:
+        return loads_json(data)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_mcp_cached(path_str: str, mtime_ns: int, size: int) -> Optional[bytes]:
+    try:
+        return Path(path_str).read_bytes()
+    except OSError:
+        return None
 
 
 def write_mcp_config(dest_path: Path, config: Dict[str, Any]) -> bool:
     """Write MCP configuration to destination."""
     try:
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_json(dest_path, config)
         return True
     except Exception as e:
         print(f"  Error writing MCP config: {e}")
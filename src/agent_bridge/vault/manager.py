@@ -3,11 +3,15 @@ VaultManager — registry + sync orchestration.
 Moved from vault.py with source abstraction integration.
 """
 
-import json
+import functools
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from agent_bridge.utils.filesystem import read_json, write_json
 
 from .sources import BuiltinSource, GitSource, LocalSource
 from .merger import merge_source_into_project, MergeStrategy, MERGE_SUBDIRS
@@ -15,6 +19,11 @@ from .merger import merge_source_into_project, MergeStrategy, MERGE_SUBDIRS
 VAULTS_CONFIG_DIR = Path.home() / ".config" / "agent-bridge"
 VAULTS_CONFIG_FILE = VAULTS_CONFIG_DIR / "vaults.json"
 VAULTS_CACHE_DIR = VAULTS_CONFIG_DIR / "cache"
+# Per-project record of vault/project subdir mtimes from the last merge
+MERGE_STATE_FILE = VAULTS_CONFIG_DIR / "merge_state.json"
+
+# Upper bound on concurrent vault syncs (each may be a git subprocess)
+SYNC_POOL_SIZE = 8
 
 DEFAULT_VAULT = {
     "name": "builtin-starter",
@@ -52,28 +61,76 @@ class Vault:
             return BuiltinSource()
         if self.is_local:
             return LocalSource(self.url)
-        return GitSource(self.url)
+        return GitSource(self.url, agent_subdir=self.agent_subdir)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_vault_entries(path_str: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], ...]:
+    """Parsed vaults.json entries, shared by every VaultManager while the file is unchanged."""
+    data = read_json(Path(path_str))
+    return tuple(data.get("vaults", []))
+
+
+def _dir_mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_merge_state() -> Dict[str, Any]:
+    try:
+        data = read_json(MERGE_STATE_FILE)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_merge_state(state: Dict[str, Any]) -> None:
+    # Write then rename so a crash never leaves a half-written state file
+    try:
+        MERGE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = MERGE_STATE_FILE.with_suffix(".json.tmp")
+        write_json(tmp, state)
+        os.replace(tmp, MERGE_STATE_FILE)
+    except OSError:
+        pass
+
+
+def _sync_vault(vault: Vault) -> Dict[str, Any]:
+    return vault.get_source().sync(vault.cache_path, verbose=False)
 
 
 class VaultManager:
     def __init__(self):
-        self._vaults: List[Vault] = []
-        self._load_config()
-
-    def _load_config(self) -> None:
-        if VAULTS_CONFIG_FILE.exists():
-            try:
-                data = json.loads(VAULTS_CONFIG_FILE.read_text(encoding="utf-8"))
-                self._vaults = [Vault(**v) for v in data.get("vaults", [])]
-            except (json.JSONDecodeError, TypeError, KeyError):
-                self._vaults = [Vault(**DEFAULT_VAULT)]
-        else:
-            self._vaults = [Vault(**DEFAULT_VAULT)]
+        # Config is read on first access, so commands that never touch vaults skip it
+        self._loaded: Optional[List[Vault]] = None
+
+    @property
+    def _vaults(self) -> List[Vault]:
+        if self._loaded is None:
+            self._loaded = self._load_config()
+        return self._loaded
+
+    @_vaults.setter
+    def _vaults(self, value: List[Vault]) -> None:
+        self._loaded = value
+
+    def _load_config(self) -> List[Vault]:
+        try:
+            st = os.stat(VAULTS_CONFIG_FILE)
+        except OSError:
+            return [Vault(**DEFAULT_VAULT)]
+        try:
+            entries = _read_vault_entries(str(VAULTS_CONFIG_FILE), st.st_mtime_ns, st.st_size)
+            return [Vault(**v) for v in entries]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return [Vault(**DEFAULT_VAULT)]
 
     def _save_config(self) -> None:
         VAULTS_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         data = {"vaults": [asdict(v) for v in self._vaults]}
-        VAULTS_CONFIG_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_json(VAULTS_CONFIG_FILE, data)
 
     @property
     def vaults(self) -> List[Vault]:
@@ -115,15 +172,29 @@ class VaultManager:
         targets = [self.get(name)] if name else self.enabled_vaults
         targets = [t for t in targets if t is not None]
 
-        for vault in targets:
+        if len(targets) <= 1:
+            for vault in targets:
+                if verbose:
+                    with SimpleSpinner(f"Syncing vault: {vault.name}"):
+                        results[vault.name] = _sync_vault(vault)
+                    print(f"  {Colors.GREEN}✓{Colors.ENDC} Synced: {vault.name}")
+                else:
+                    results[vault.name] = _sync_vault(vault)
+            return results
+
+        # Vault syncs are independent git/filesystem operations; overlap their latency.
+        # Workers never print, so output is emitted afterwards in priority order.
+        with ThreadPoolExecutor(max_workers=min(SYNC_POOL_SIZE, len(targets))) as pool:
             if verbose:
-                with SimpleSpinner(f"Syncing vault: {vault.name}"):
-                    source = vault.get_source()
-                    results[vault.name] = source.sync(vault.cache_path, verbose=False)
-                print(f"  {Colors.GREEN}✓{Colors.ENDC} Synced: {vault.name}")
+                with SimpleSpinner(f"Syncing {len(targets)} vaults"):
+                    synced = list(pool.map(_sync_vault, targets))
             else:
-                source = vault.get_source()
-                results[vault.name] = source.sync(vault.cache_path, verbose=False)
+                synced = list(pool.map(_sync_vault, targets))
+
+        for vault, result in zip(targets, synced):
+            results[vault.name] = result
+            if verbose:
+                print(f"  {Colors.GREEN}✓{Colors.ENDC} Synced: {vault.name}")
 
         return results
 
@@ -144,16 +215,51 @@ class VaultManager:
         return None
 
     def merge_to_project(self, project_agent_dir: Path, verbose: bool = True) -> Dict[str, int]:
+        """
+        Merge enabled vaults into project_agent_dir (project wins on conflicts).
+
+        PROJECT_WINS only ever adds missing names, so a subdir whose vault and
+        project directory mtimes both match the last merge has nothing to add
+        and is skipped without listing it.
+        """
         total: Dict[str, int] = {}
+        project_key = str(project_agent_dir.resolve())
+        state = _load_merge_state()
+        previous = state.get(project_key, {})
+        dst_before = {sub: _dir_mtime_ns(project_agent_dir / sub) for sub in MERGE_SUBDIRS}
+        src_seen: Dict[str, Dict[str, Optional[int]]] = {}
         for vault in self.enabled_vaults:
             source_root = self.get_vault_agent_dir(vault)
             if not source_root:
                 if verbose:
                     print(f"  Skip {vault.name}: not synced")
                 continue
-            counts = merge_source_into_project(source_root, project_agent_dir, MergeStrategy.PROJECT_WINS)
+            src_mtimes = {sub: _dir_mtime_ns(source_root / sub) for sub in MERGE_SUBDIRS}
+            prev = previous.get(vault.name, {})
+            unchanged = [
+                sub for sub in MERGE_SUBDIRS
+                if src_mtimes[sub] is not None
+                and dst_before[sub] is not None
+                and prev.get(sub) == [src_mtimes[sub], dst_before[sub]]
+            ]
+            counts = merge_source_into_project(
+                source_root, project_agent_dir, MergeStrategy.PROJECT_WINS, skip_subdirs=unchanged
+            )
+            src_seen[vault.name] = src_mtimes
             for key, val in counts.items():
                 total[key] = total.get(key, 0) + val
+
+        # Record post-merge project mtimes: every vault is compared against the final tree
+        dst_after = {sub: _dir_mtime_ns(project_agent_dir / sub) for sub in MERGE_SUBDIRS}
+        state[project_key] = {
+            name: {
+                sub: [mtimes[sub], dst_after[sub]]
+                for sub in MERGE_SUBDIRS
+                if mtimes[sub] is not None and dst_after[sub] is not None
+            }
+            for name, mtimes in src_seen.items()
+        }
+        _save_merge_state(state)
         if verbose:
             print(f"  Merged: {total.get('agents', 0)} agents, {total.get('skills', 0)} skills, {total.get('workflows', 0)} workflows")
         return total
@@ -3,10 +3,13 @@ Vault merge strategies.
 Previously scattered across cli.py (_fetch_vault_to_project, _merge_vault_to_project).
 """
 
+import os
 import shutil
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List
+
+from agent_bridge.utils.filesystem import copy_tree, is_within, reflink_copy_function
 
 MERGE_SUBDIRS = ["agents", "skills", "workflows", "rules"]
 
@@ -21,52 +24,72 @@ def merge_source_into_project(
     source_dir: Path,
     project_agent_dir: Path,
     strategy: MergeStrategy = MergeStrategy.PROJECT_WINS,
+    preserve_metadata: bool = False,
+    skip_subdirs: Iterable[str] = (),
 ) -> Dict[str, int]:
+    # Content + mode (skill scripts stay executable), timestamps only on request;
+    # reflinked where the filesystem allows, never hardlinked, since project
+    # files are edited in place and must not write through to the vault cache
+    copy_function = reflink_copy_function(preserve_metadata)
     counts: Dict[str, int] = {}
 
     if strategy == MergeStrategy.VAULT_ONLY:
         if project_agent_dir.exists():
             shutil.rmtree(project_agent_dir)
-        shutil.copytree(source_dir, project_agent_dir)
+        copy_tree(source_dir, project_agent_dir, copy_function=copy_function)
         for subdir in MERGE_SUBDIRS:
             sub = project_agent_dir / subdir
             if sub.exists():
-                counts[subdir] = sum(1 for _ in sub.iterdir())
+                counts[subdir] = len(os.listdir(sub))
         return counts
 
     project_agent_dir.mkdir(parents=True, exist_ok=True)
     project_agent_dir_resolved = project_agent_dir.resolve()
 
+    skip = set(skip_subdirs)
     for subdir in MERGE_SUBDIRS:
+        if subdir in skip:
+            counts[subdir] = 0
+            continue
         src = source_dir / subdir
         dst = project_agent_dir / subdir
         if not src.exists():
             continue
         dst.mkdir(parents=True, exist_ok=True)
-        merged = 0
-        for item in src.iterdir():
-            # Block symlinks from vaults
-            if item.is_symlink():
+        # Names are single path components, so only dst itself or an existing
+        # (possibly symlinked) entry in it can resolve outside the project
+        try:
+            if not is_within(dst.resolve(), project_agent_dir_resolved):
                 continue
-            dest_item = dst / item.name
-            # Block path traversal
-            try:
-                if not str(dest_item.resolve()).startswith(str(project_agent_dir_resolved)):
+        except (OSError, ValueError):
+            continue
+        # One listdir instead of an exists() syscall per vault item
+        existing = set(os.listdir(dst))
+        merged = 0
+        with os.scandir(src) as it:
+            for entry in it:
+                # Block symlinks from vaults
+                if entry.is_symlink():
                     continue
-            except (OSError, ValueError):
-                continue
-            if dest_item.exists() and strategy == MergeStrategy.PROJECT_WINS:
-                continue
-            if dest_item.exists() and strategy == MergeStrategy.VAULT_WINS:
-                if dest_item.is_dir():
-                    shutil.rmtree(dest_item)
-                else:
-                    dest_item.unlink()
-            if not dest_item.exists():
-                if item.is_dir():
-                    shutil.copytree(item, dest_item)
+                dest_item = dst / entry.name
+                if entry.name in existing:
+                    # Block path traversal through symlinks already in the project
+                    try:
+                        if not is_within(dest_item.resolve(), project_agent_dir_resolved):
+                            continue
+                    except (OSError, ValueError):
+                        continue
+                    if strategy == MergeStrategy.PROJECT_WINS:
+                        continue
+                    if dest_item.is_dir():
+                        shutil.rmtree(dest_item)
+                    else:
+                        dest_item.unlink()
+                if entry.is_dir():
+                    copy_tree(Path(entry.path), dest_item, copy_function=copy_function)
                 else:
-                    shutil.copy2(item, dest_item)
+                    copy_function(entry.path, os.fspath(dest_item))
+                existing.add(entry.name)
                 merged += 1
         counts[subdir] = merged
 
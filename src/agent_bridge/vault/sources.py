@@ -3,15 +3,26 @@ Vault source strategies (Strategy pattern).
 Each source knows how to sync/validate itself.
 """
 
+import os
 import re
 from abc import ABC, abstractmethod
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 import shutil
 import subprocess
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
+
+from agent_bridge.utils.filesystem import mirror_tree
 
 _SAFE_GIT_URL = re.compile(r"^(https?://|git@)[a-zA-Z0-9._\-/:%@]+$")
 
+# Directories a vault clone checks out: .agent/ layout plus the bare top-level layout
+SPARSE_PATHS = (".agent", "agents", "skills", "workflows", "rules")
+
+
+def _git_env() -> Dict[str, str]:
+    # Never block on a credential prompt; git output is captured, so nobody would see it
+    return {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
 
 class VaultSource(ABC):
     @abstractmethod
@@ -22,37 +33,79 @@ class VaultSource(ABC):
 
     @staticmethod
     def _count_content(agent_dir: Path) -> Dict[str, int]:
-        agents_dir = agent_dir / "agents"
-        skills_dir = agent_dir / "skills"
-        return {
-            "agents": len(list(agents_dir.glob("*.md"))) if agents_dir.exists() else 0,
-            "skills": sum(1 for d in skills_dir.iterdir() if d.is_dir()) if skills_dir.exists() else 0,
-        }
+        return VaultSource._scan_content(agent_dir) or {"agents": 0, "skills": 0}
+
+    @staticmethod
+    def _scan_content(agent_dir: Path) -> Optional[Dict[str, int]]:
+        """
+        Count agents/*.md and skills/*/ with scandir (DirEntry types, no per-entry stat).
+
+        Returns None if agent_dir has neither an agents/ nor a skills/ entry.
+        """
+        try:
+            with os.scandir(agent_dir) as it:
+                present = {e.name: e for e in it if e.name in ("agents", "skills")}
+        except OSError:
+            return None
+        if not present:
+            return None
+
+        counts = {"agents": 0, "skills": 0}
+        for name, entry in present.items():
+            try:
+                with os.scandir(entry.path) as it:
+                    if name == "agents":
+                        counts["agents"] = sum(1 for e in it if e.name.endswith(".md") and e.is_file())
+                    else:
+                        counts["skills"] = sum(1 for e in it if e.is_dir())
+            except OSError:
+                continue
+        return counts
+
+
+def _sparse_paths(agent_subdir: str) -> Optional[Tuple[str, ...]]:
+    """
+    Cone directories for a vault whose content lives under ``agent_subdir``.
+
+    Adds the subdir's top-level component to SPARSE_PATHS; None (full
+    checkout) when the subdir points outside the repo.
+    """
+    path = PurePosixPath(agent_subdir.replace("\\", "/"))
+    if path.is_absolute() or ".." in path.parts:
+        return None
+    if not path.parts or path.parts[0] in SPARSE_PATHS:
+        return SPARSE_PATHS
+    return (*SPARSE_PATHS, path.parts[0])
 
 
 class GitSource(VaultSource):
-    def __init__(self, url: str):
+    def __init__(self, url: str, agent_subdir: str = ".agent"):
         if not _SAFE_GIT_URL.match(url):
             raise ValueError(f"Unsafe git URL: {url!r}")
         if url.startswith("-"):
             raise ValueError(f"URL cannot start with '-': {url!r}")
         self.url = url
+        self.agent_subdir = agent_subdir
 
     def sync(self, cache_dir: Path, verbose: bool = True) -> Dict[str, Any]:
         stats: Dict[str, Any] = {"status": "ok", "agents": 0, "skills": 0}
         try:
-            if cache_dir.exists() and (cache_dir / ".git").exists():
-                subprocess.run(["git", "-C", str(cache_dir), "pull", "--ff-only"], check=True, capture_output=True)
+            if (cache_dir / ".git").exists():
+                # Shallow mirror: fetch only the new tip and move to it. pull --ff-only
+                # on a --depth 1 clone can fail or deepen history across the boundary.
+                repo = str(cache_dir)
+                subprocess.run(["git", "-C", repo, "fetch", "--depth", "1", "origin", "HEAD"], check=True, capture_output=True, env=_git_env())
+                subprocess.run(["git", "-C", repo, "reset", "--hard", "FETCH_HEAD"], check=True, capture_output=True, env=_git_env())
             else:
                 cache_dir.parent.mkdir(parents=True, exist_ok=True)
                 if cache_dir.exists():
                     shutil.rmtree(cache_dir)
-                subprocess.run(["git", "clone", "--depth", "1", "--", self.url, str(cache_dir)], check=True, capture_output=True)
+                self._sparse_clone(str(cache_dir))
 
-            for subdir_name in [".agent", "."]:
-                agent_dir = cache_dir / subdir_name
-                if (agent_dir / "agents").exists() or (agent_dir / "skills").exists():
-                    stats.update(self._count_content(agent_dir))
+            for subdir_name in dict.fromkeys([self.agent_subdir, ".agent", "."]):
+                counts = self._scan_content(cache_dir / subdir_name)
+                if counts is not None:
+                    stats.update(counts)
                     break
         except subprocess.CalledProcessError as e:
             stats["status"] = f"error: {e.stderr.decode().strip()}"
@@ -60,6 +113,28 @@ class GitSource(VaultSource):
             stats["status"] = f"error: {e}"
         return stats
 
+    def _sparse_clone(self, repo: str) -> None:
+        # Partial (blob:none) + sparse clone: only blobs under the vault content
+        # dirs (including the vault's agent_subdir) are downloaded at checkout,
+        # not docs/images elsewhere in the repo. Cone mode also keeps top-level
+        # files, and the settings persist, so later fetch + reset stay sparse.
+        subprocess.run(
+            ["git", "clone", "--depth", "1", "--filter=blob:none", "--no-checkout", "--", self.url, repo],
+            check=True, capture_output=True, env=_git_env(),
+        )
+        sparse_paths = _sparse_paths(self.agent_subdir)
+        if sparse_paths is not None:
+            try:
+                subprocess.run(
+                    ["git", "-C", repo, "sparse-checkout", "set", "--cone", *sparse_paths],
+                    check=True, capture_output=True, env=_git_env(),
+                )
+            except subprocess.CalledProcessError:
+                # Older git has no `sparse-checkout set --cone`; a full shallow
+                # checkout still works, it just fetches every blob
+                pass
+        subprocess.run(["git", "-C", repo, "checkout"], check=True, capture_output=True, env=_git_env())
+
     def validate(self) -> bool:
         try:
             result = subprocess.run(["git", "ls-remote", "--exit-code", "--", self.url], capture_output=True, timeout=15)
@@ -101,9 +176,8 @@ class BuiltinSource(VaultSource):
             return stats
         try:
             cache_dir.parent.mkdir(parents=True, exist_ok=True)
-            if cache_dir.exists():
-                shutil.rmtree(cache_dir)
-            shutil.copytree(self.source_dir, cache_dir)
+            # Re-sync of an unchanged package copy writes nothing
+            mirror_tree(self.source_dir, cache_dir)
             agent_dir = cache_dir / ".agent" if (cache_dir / ".agent").exists() else cache_dir
             stats.update(self._count_content(agent_dir))
         except Exception as e:
@@ -1,11 +1,35 @@
 """Shared fixtures for tests."""
 
 import re
+import shutil
 
 import pytest
 from pathlib import Path
 import json
 
+from agent_bridge.utils import content_cache
+from agent_bridge.utils.filesystem import copy_tree
+
+
+def pytest_configure(config):
+    # Register converters once per process (each xdist worker runs this too)
+    from agent_bridge import converters  # noqa: F401
+
+
+@pytest.fixture(scope="session", autouse=True)
+def output_index_dir(tmp_path_factory):
+    """
+    Redirect converter hash indexes away from ~/.config for the whole session.
+
+    Session-scoped so it is active before session fixtures that convert
+    (cursor_converted, kiro_converted); index files are keyed by dest_root,
+    so tests never share entries.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        index_dir = tmp_path_factory.mktemp("output-index")
+        mp.setattr(content_cache, "INDEX_DIR", index_dir)
+        yield index_dir
+
 
 def strip_and_normalize(content: str) -> str:
     """
@@ -18,10 +42,9 @@ def strip_and_normalize(content: str) -> str:
     return content.strip()
 
 
-@pytest.fixture
-def tmp_project(tmp_path):
-    """Create a minimal project with .agent/ structure."""
-    agent_dir = tmp_path / ".agent"
+def build_agent_project(root: Path) -> Path:
+    """Populate root with the minimal .agent/ structure used by tmp_project."""
+    agent_dir = root / ".agent"
     (agent_dir / "agents").mkdir(parents=True)
     (agent_dir / "skills").mkdir(parents=True)
     (agent_dir / "workflows").mkdir(parents=True)
@@ -61,9 +84,50 @@ def tmp_project(tmp_path):
     }
     (agent_dir / "mcp_config.json").write_text(json.dumps(mcp_config, indent=2))
 
+    return root
+
+
+@pytest.fixture(scope="session")
+def prototype_project(tmp_path_factory):
+    """The canonical .agent/ tree, built once per session; cloned by tmp_project, read-only otherwise."""
+    return build_agent_project(tmp_path_factory.mktemp("prototype"))
+
+
+@pytest.fixture
+def tmp_project(tmp_path, prototype_project):
+    """Create a minimal project with .agent/ structure."""
+    # Real copies, not hardlinks: many tests rewrite source files in place
+    copy_tree(prototype_project / ".agent", tmp_path / ".agent", copy_function=shutil.copy)
     return tmp_path
 
 
+def _converted_project(tmp_path_factory, converter_cls):
+    root = build_agent_project(tmp_path_factory.mktemp(converter_cls.__name__))
+    result = converter_cls().convert(root, root, verbose=False)
+    return root, result
+
+
+@pytest.fixture(scope="session")
+def cursor_converted(tmp_path_factory):
+    """
+    (project_root, ConversionResult) for one Cursor conversion of tmp_project's tree.
+
+    Shared by every test in the session: read the outputs, never modify them.
+    Tests that edit sources or re-convert should use tmp_project instead.
+    """
+    from agent_bridge.converters.cursor import CursorConverter
+
+    return _converted_project(tmp_path_factory, CursorConverter)
+
+
+@pytest.fixture(scope="session")
+def kiro_converted(tmp_path_factory):
+    """(project_root, ConversionResult) for one shared Kiro conversion; read-only like cursor_converted."""
+    from agent_bridge.converters.kiro import KiroConverter
+
+    return _converted_project(tmp_path_factory, KiroConverter)
+
+
 @pytest.fixture
 def tmp_project_with_ide_outputs(tmp_project):
     """Create a project with .agent/ AND generated IDE outputs (Cursor, Kiro, Copilot)."""
@@ -0,0 +1,13 @@
+"""Plain helper functions shared by tests."""
+
+from pathlib import Path
+
+import pytest
+
+
+def read_or_fail(path: Path) -> str:
+    """Read a generated text file, failing the test if it is missing (no separate exists() check)."""
+    try:
+        return path.read_text()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        pytest.fail(f"expected file {path}")
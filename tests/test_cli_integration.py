@@ -118,6 +118,25 @@ def test_cli_clean_all(tmp_project, monkeypatch):
     assert not (tmp_project / ".windsurf").exists()
 
 
+def test_cli_clean_preview_marks_only_empty_dirs(tmp_project, monkeypatch, capsys):
+    """Test clean preview lists empty IDE dirs separately and keeps files on cancel."""
+    (tmp_project / ".cursor").mkdir()
+    (tmp_project / ".kiro" / "agents").mkdir(parents=True)
+    (tmp_project / ".kiro" / "agents" / "a.json").write_text("{}")
+
+    monkeypatch.chdir(tmp_project)
+    monkeypatch.setattr(sys, "argv", ["agent-bridge", "clean", "--cursor", "--kiro"])
+
+    from agent_bridge.cli import _main
+    with patch("questionary.confirm", return_value=Mock(ask=Mock(return_value=False))):
+        _main()
+
+    out = capsys.readouterr().out
+    assert ".cursor/ (empty dir)" in out
+    assert ".kiro/ (empty dir)" not in out
+    assert (tmp_project / ".kiro" / "agents" / "a.json").exists()
+
+
 def test_cli_status(tmp_project, monkeypatch, capsys):
     """Test `agent-bridge status` displays project info."""
     monkeypatch.chdir(tmp_project)
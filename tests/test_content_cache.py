@@ -0,0 +1,124 @@
+"""Tests for the converter content-hash index."""
+
+import json
+import os
+
+import pytest
+
+from agent_bridge.converters.copilot import CopilotConverter
+from agent_bridge.converters.kiro import KiroConverter
+from agent_bridge.converters.opencode import OpenCodeConverter
+from agent_bridge.utils import content_cache
+from agent_bridge.utils.content_cache import ContentHashCache, content_digest, index_path_for
+
+
+def _write_output(path, text="generated"):
+    path.write_text(text)
+    return path
+
+
+def test_index_path_is_per_root_and_ide(tmp_path, output_index_dir):
+    """Verify indexes live in INDEX_DIR, keyed by dest_root and IDE name."""
+    path = index_path_for(tmp_path, "kiro")
+
+    assert path.parent == output_index_dir
+    assert path.name.endswith("-kiro.json")
+    assert index_path_for(tmp_path, "opencode") != path
+    assert index_path_for(tmp_path / "other", "kiro") != path
+
+
+def test_fresh_only_for_same_digest_and_untouched_output(tmp_path):
+    """Verify is_fresh needs a matching digest and an unmodified output file."""
+    cache = ContentHashCache(tmp_path / "index.json")
+    dest = _write_output(tmp_path / "out.md")
+    digest = content_digest(b"source")
+
+    assert not cache.is_fresh("agents/out.md", digest, dest)
+
+    cache.update("agents/out.md", digest, dest)
+    assert cache.is_fresh("agents/out.md", digest, dest)
+    assert not cache.is_fresh("agents/out.md", content_digest(b"edited source"), dest)
+
+    dest.write_text("HAND EDIT")
+    assert not cache.is_fresh("agents/out.md", digest, dest)
+
+    dest.unlink()
+    assert not cache.is_fresh("agents/out.md", digest, dest)
+
+
+def test_save_roundtrip_and_version_mismatch(tmp_path):
+    """Verify saved entries reload, and an index from another version is discarded."""
+    index = tmp_path / "idx" / "index.json"
+    dest = _write_output(tmp_path / "out.md")
+    digest = content_digest(b"source")
+
+    cache = ContentHashCache(index)
+    cache.update("agents/out.md", digest, dest)
+    cache.save()
+
+    assert ContentHashCache(index).is_fresh("agents/out.md", digest, dest)
+
+    data = json.loads(index.read_text())
+    data["version"] = "0.0.0-other"
+    index.write_text(json.dumps(data))
+
+    assert not ContentHashCache(index).is_fresh("agents/out.md", digest, dest)
+
+
+def test_save_without_changes_writes_nothing(tmp_path):
+    """Verify save() is a no-op when no entry changed."""
+    index = tmp_path / "index.json"
+
+    ContentHashCache(index).save()
+
+    assert not index.exists()
+
+
+def test_new_index_prunes_oldest_files(tmp_path):
+    """Verify creating an index keeps only the most recently written index files."""
+    index_dir = tmp_path / "output-index"
+    index_dir.mkdir()
+    for i in range(content_cache.MAX_INDEX_FILES):
+        old = index_dir / f"old-{i}.json"
+        old.write_text("{}")
+        os.utime(old, ns=(i, i))
+
+    dest = _write_output(tmp_path / "out.md")
+    cache = ContentHashCache(index_dir / "new.json")
+    cache.update("agents/out.md", content_digest(b"source"), dest)
+    cache.save()
+
+    names = {p.name for p in index_dir.iterdir()}
+    assert len(names) == content_cache.MAX_INDEX_FILES
+    assert "new.json" in names
+    assert "old-0.json" not in names
+
+
+@pytest.mark.parametrize(
+    "converter_cls, output",
+    [
+        (KiroConverter, ".kiro/agents/orchestrator.json"),
+        (OpenCodeConverter, ".opencode/agents/orchestrator.md"),
+        (CopilotConverter, ".github/agents/orchestrator.agent.md"),
+    ],
+)
+def test_converter_skips_unchanged_and_restores_edited_output(tmp_project, converter_cls, output):
+    """Verify a re-convert leaves unchanged outputs alone but regenerates hand-edited ones."""
+    converter = converter_cls()
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    out_file = tmp_project / output
+    written = out_file.stat().st_ctime_ns
+    generated = out_file.read_text()
+
+    result = converter.convert(tmp_project, tmp_project, verbose=False)
+
+    assert result.agents == 2
+    assert out_file.stat().st_ctime_ns == written
+
+    out_file.write_text("HAND EDIT")
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    assert out_file.read_text() == generated
+    ide_dir = tmp_project / output.split("/", 1)[0]
+    assert not list(ide_dir.rglob(".agent-bridge*"))
@@ -101,3 +101,82 @@ def test_copilot_truncation(tmp_project):
     # Should be truncated (allow small overhead for frontmatter)
     assert len(content) < 35000
     assert "(truncated)" in content or len(content) <= 31000  # Allow frontmatter overhead
+
+
+def test_pooled_conversion_reports_in_source_order(tmp_project, capsys):
+    """Verify pooled agent conversion writes every file and reports in listing order."""
+    from agent_bridge.converters._copilot_impl import convert_to_copilot
+    from agent_bridge.utils import scan_md_files
+
+    agents_dir = tmp_project / ".agent" / "agents"
+    for i in range(20):
+        (agents_dir / f"agent-{i:02d}.md").write_text(f"# Agent {i}\n\nBody {i}\n")
+
+    stats = convert_to_copilot(tmp_project, tmp_project, verbose=True)
+
+    assert stats["agents"] == 22
+    assert stats["errors"] == []
+    expected = [f"  {p.name}" for p in scan_md_files(agents_dir)]
+    out_lines = capsys.readouterr().out.splitlines()
+    start = out_lines.index("Converting agents to Copilot format...") + 1
+    assert out_lines[start:start + len(expected)] == expected
+    for p in scan_md_files(agents_dir):
+        assert (tmp_project / ".github" / "agents" / p.name.replace(".md", ".agent.md")).exists()
+
+
+def test_changed_agent_source_regenerated(tmp_project):
+    """Verify an edited agent source is converted again despite the cache."""
+    converter = CopilotConverter()
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    (tmp_project / ".agent" / "agents" / "orchestrator.md").write_text(
+        "# Orchestrator\n\nYou are the updated orchestrator.\n"
+    )
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    out = (tmp_project / ".github" / "agents" / "orchestrator.agent.md").read_text(encoding="utf-8")
+    assert "updated orchestrator" in out
+
+
+@pytest.mark.parametrize("metadata", [{}, {"name": "Lead: QA", "description": "Tiếng Việt 'q' \"dq\" #tag " * 30}])
+def test_agent_frontmatter_matches_python_emitter(metadata):
+    """Verify the libyaml emitter yields the same frontmatter as the pure-Python yaml.dump."""
+    import yaml
+
+    from agent_bridge.converters._copilot_impl import generate_copilot_frontmatter
+    from agent_bridge.core.agent_registry import AGENT_ROLES
+
+    for slug in AGENT_ROLES:
+        out = generate_copilot_frontmatter(slug, metadata)
+        expected = yaml.dump(
+            yaml.safe_load(out), default_flow_style=False, allow_unicode=True, sort_keys=False, width=1000
+        )
+        assert out == expected, slug
+
+
+def test_bridge_meta_map_covers_all_sections(tmp_project):
+    """Verify build_bridge_meta_map maps every generated .github file back to .agent/."""
+    converter = CopilotConverter()
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    file_map = converter.build_bridge_meta_map(tmp_project)
+
+    assert file_map[".github/agents/orchestrator.agent.md"] == ".agent/agents/orchestrator.md"
+    assert file_map[".github/skills/clean-code/SKILL.md"] == ".agent/skills/clean-code/SKILL.md"
+    assert file_map[".github/prompts/plan.prompt.md"] == ".agent/workflows/plan.md"
+    assert file_map[".github/instructions/global.instructions.md"] == ".agent/rules/global.md"
+    assert not any("agent-bridge-cache" in key for key in file_map)
+    assert CopilotConverter().build_bridge_meta_map(tmp_project / "missing") == {}
+
+
+def test_extract_metadata_dedupes_skill_mentions():
+    """Verify skills mentioned repeatedly are listed once, in first-seen order."""
+    from agent_bridge.converters._copilot_impl import extract_agent_metadata
+
+    content = (
+        "---\nskills: clean-code\n---\n# Dev\n\nSkills: [clean-code, testing-patterns]\n"
+        "Uses the `testing-patterns` skill and `clean-code` skill.\n"
+    )
+    meta = extract_agent_metadata(content, "dev.md")
+
+    assert meta["skills"] == ["clean-code", "testing-patterns"]
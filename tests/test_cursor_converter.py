@@ -4,15 +4,12 @@ import pytest
 import yaml
 from pathlib import Path
 from agent_bridge.converters.cursor import CursorConverter
+from tests.helpers import read_or_fail
 
 
-def test_convert_agent_creates_md(tmp_project):
+def test_convert_agent_creates_md(cursor_converted):
     """Verify .cursor/agents/ files created."""
-    converter = CursorConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+    dest_root, result = cursor_converted
     
     assert result.ok is True
     
@@ -20,19 +17,13 @@ def test_convert_agent_creates_md(tmp_project):
     assert agent_file.exists()
 
 
-def test_convert_skill_to_mdc_rule(tmp_project):
+def test_convert_skill_to_mdc_rule(cursor_converted):
     """For 'clean-code' skill, verify .mdc file with correct frontmatter."""
-    converter = CursorConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+    dest_root, result = cursor_converted
     
     # clean-code should become an MDC rule
     mdc_file = dest_root / ".cursor" / "rules" / "clean-code.mdc"
-    assert mdc_file.exists()
-    
-    content = mdc_file.read_text()
+    content = read_or_fail(mdc_file)
     assert content.startswith("---\n")
     
     # Parse YAML part to verify validity
@@ -60,13 +51,9 @@ def test_convert_skill_to_cursor_skill(tmp_project):
     assert skill_file.exists()
 
 
-def test_mdc_frontmatter_format(tmp_project):
+def test_mdc_frontmatter_format(cursor_converted):
     """Verify description, globs, alwaysApply fields."""
-    converter = CursorConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+    dest_root, result = cursor_converted
     
     mdc_file = dest_root / ".cursor" / "rules" / "clean-code.mdc"
     content = mdc_file.read_text()
@@ -108,15 +95,43 @@ def test_special_characters_in_globs(tmp_project):
             pytest.fail(f"Invalid YAML generated for MDC Rule with globs: {e}")
 
 
-def test_convert_to_cursor_full(tmp_project):
-    """End-to-end with tmp_project."""
-    converter = CursorConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+def test_convert_to_cursor_full(cursor_converted):
+    """End-to-end on the shared converted project."""
+    dest_root, result = cursor_converted
     
     assert result.ok is True
     assert result.agents == 2
     assert result.skills == 1
     assert result.workflows == 1
+
+
+def test_project_instructions_joins_sources(tmp_path):
+    """Verify AGENTS.md and ARCHITECTURE.md are combined with a separator."""
+    from agent_bridge.converters._cursor_impl import CREDIT_LINE, create_project_instructions
+
+    (tmp_path / ".agent").mkdir()
+    (tmp_path / "AGENTS.md").write_text("# Agents\nÂ guide", encoding="utf-8")
+    (tmp_path / ".agent" / "ARCHITECTURE.md").write_text("# Arch", encoding="utf-8")
+
+    assert create_project_instructions(tmp_path, tmp_path) is True
+
+    out = (tmp_path / ".cursor" / "rules" / "project-instructions.mdc").read_text(encoding="utf-8")
+    assert out.startswith("---\n")
+    assert out.endswith("# Agents\nÂ guide\n\n---\n\n# Arch" + CREDIT_LINE)
+
+
+def test_skill_ide_configs_are_shared_and_read_only():
+    """Verify registry IDE configs are built once and cannot be mutated by callers."""
+    from agent_bridge.core.skill_metadata import get_cursor_config, get_windsurf_config
+
+    config = get_cursor_config("python-patterns")
+    assert config is get_cursor_config("python-patterns")
+    assert config["globs"] == ["**/*.py"]
+    assert config["alwaysApply"] is False
+    with pytest.raises(TypeError):
+        config["mode"] = "always-on"
+
+    assert get_cursor_config("clean-code")["alwaysApply"] is True
+    assert get_windsurf_config("clean-code")["mode"] == "always"
+    assert get_cursor_config("no-such-skill") is None
+    assert get_windsurf_config("no-such-skill") is None
@@ -1,10 +1,10 @@
 """Tests for _write_bridge_meta delegation to converters."""
 
-import json
 import pytest
 from pathlib import Path
 
 from agent_bridge.services.init_service import _write_bridge_meta
+from agent_bridge.utils.filesystem import read_json
 
 
 def test_write_bridge_meta_cursor(tmp_path):
@@ -17,7 +17,7 @@ def test_write_bridge_meta_cursor(tmp_path):
 
     _write_bridge_meta(tmp_path, ["cursor"])
 
-    meta = json.loads((agent_dir / ".bridge-meta.json").read_text())
+    meta = read_json(agent_dir / ".bridge-meta.json")
     assert ".cursor/agents/orchestrator.md" in meta["file_map"]
     assert meta["file_map"][".cursor/agents/orchestrator.md"] == ".agent/agents/orchestrator.md"
     assert "generated_at" in meta
@@ -34,7 +34,7 @@ def test_write_bridge_meta_kiro(tmp_path):
 
     _write_bridge_meta(tmp_path, ["kiro"])
 
-    meta = json.loads((agent_dir / ".bridge-meta.json").read_text())
+    meta = read_json(agent_dir / ".bridge-meta.json")
     assert ".kiro/agents/orchestrator.json" in meta["file_map"]
 
 
@@ -49,7 +49,7 @@ def test_write_bridge_meta_multiple_ides(tmp_path):
 
     _write_bridge_meta(tmp_path, ["cursor", "kiro"])
 
-    meta = json.loads((agent_dir / ".bridge-meta.json").read_text())
+    meta = read_json(agent_dir / ".bridge-meta.json")
     assert ".cursor/agents/test.md" in meta["file_map"]
     assert ".kiro/agents/test.json" in meta["file_map"]
 
@@ -67,5 +67,5 @@ def test_write_bridge_meta_unknown_ide(tmp_path):
 
     _write_bridge_meta(tmp_path, ["nonexistent-ide"])
 
-    meta = json.loads((agent_dir / ".bridge-meta.json").read_text())
+    meta = read_json(agent_dir / ".bridge-meta.json")
     assert meta["file_map"] == {}
@@ -1,18 +1,15 @@
 """Tests for Kiro converter."""
 
 import pytest
-import json
 from pathlib import Path
 from agent_bridge.converters.kiro import KiroConverter
+from agent_bridge.utils.filesystem import read_json
+from tests.helpers import read_or_fail
 
 
-def test_convert_agent_creates_json(tmp_project):
+def test_convert_agent_creates_json(kiro_converted):
     """Verify .kiro/agents/*.json created."""
-    converter = KiroConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+    dest_root, result = kiro_converted
     
     assert result.ok is True
     
@@ -20,16 +17,12 @@ def test_convert_agent_creates_json(tmp_project):
     assert agent_file.exists()
 
 
-def test_agent_json_has_required_fields(tmp_project):
+def test_agent_json_has_required_fields(kiro_converted):
     """Verify name, description, prompt, tools, allowedTools."""
-    converter = KiroConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+    dest_root, result = kiro_converted
     
     agent_file = dest_root / ".kiro" / "agents" / "orchestrator.json"
-    config = json.loads(agent_file.read_text())
+    config = read_json(agent_file)
     
     assert "name" in config
     assert "description" in config
@@ -38,47 +31,98 @@ def test_agent_json_has_required_fields(tmp_project):
     assert "allowedTools" in config
 
 
-def test_convert_skill_copies_directory(tmp_project):
+def test_convert_skill_copies_directory(kiro_converted):
     """Verify full skill dir copied."""
-    converter = KiroConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+    dest_root, result = kiro_converted
     
     skill_file = dest_root / ".kiro" / "skills" / "clean-code" / "SKILL.md"
-    assert skill_file.exists()
-    
-    content = skill_file.read_text()
+    content = read_or_fail(skill_file)
     assert "Clean Code" in content
 
 
-def test_convert_workflow_to_prompt(tmp_project):
+def test_convert_workflow_to_prompt(kiro_converted):
     """Verify .kiro/prompts/ files with frontmatter."""
-    converter = KiroConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+    dest_root, result = kiro_converted
     
     # Workflows go to both steering/ and prompts/
     prompt_file = dest_root / ".kiro" / "prompts" / "plan.md"
-    assert prompt_file.exists()
-    
-    content = prompt_file.read_text()
+    content = read_or_fail(prompt_file)
     assert "---\n" in content  # Has frontmatter
 
 
-def test_convert_to_kiro_full(tmp_project):
-    """End-to-end with tmp_project."""
-    converter = KiroConverter()
-    source_root = tmp_project
-    dest_root = tmp_project
-    
-    result = converter.convert(source_root, dest_root, verbose=False)
+def test_convert_to_kiro_full(kiro_converted):
+    """End-to-end on the shared converted project."""
+    dest_root, result = kiro_converted
     
     assert result.ok is True
     assert result.agents == 2
     assert result.skills == 1
     # Kiro converts workflows to both prompts/ and steering/, so count may be 2
     assert result.workflows >= 1
+
+
+def test_changed_agent_json_rewritten(tmp_project):
+    """Verify edited agent source invalidates the content hash."""
+    converter = KiroConverter()
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    (tmp_project / ".agent" / "agents" / "orchestrator.md").write_text(
+        "# Orchestrator\n\nYou are the updated orchestrator.\n"
+    )
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    config = read_json(tmp_project / ".kiro" / "agents" / "orchestrator.json")
+    assert "updated orchestrator" in config["prompt"]
+
+
+def test_agent_json_mcp_tools_deduplicated_in_order():
+    """Verify repeated MCP server names add each @server tool and trust pattern once."""
+    from agent_bridge.converters._kiro_impl import generate_kiro_agent_json
+
+    data = generate_kiro_agent_json("orchestrator", {}, ["github", "fs", "github"])
+
+    assert data["tools"][-2:] == ["@github", "@fs"]
+    assert data["tools"].count("@github") == 1
+    assert data["allowedTools"][-2:] == ["@github/*", "@fs/*"]
+    assert len(data["allowedTools"]) == len(set(data["allowedTools"]))
+
+
+def test_unchanged_skill_files_not_recopied(tmp_project):
+    """Verify skill pass-through skips files already in sync and keeps extra dest files."""
+    converter = KiroConverter()
+    converter.convert(tmp_project, tmp_project, verbose=False)
+
+    skill_dir = tmp_project / ".kiro" / "skills" / "clean-code"
+    dest = skill_dir / "SKILL.md"
+    ctime = dest.stat().st_ctime_ns
+    (skill_dir / "notes.md").write_text("local notes")
+
+    result = converter.convert(tmp_project, tmp_project, verbose=False)
+
+    assert result.skills == 1
+    assert dest.stat().st_ctime_ns == ctime
+    assert (skill_dir / "notes.md").read_text() == "local notes"
+
+    (tmp_project / ".agent" / "skills" / "clean-code" / "SKILL.md").write_text("# Clean Code v2\n")
+    converter.convert(tmp_project, tmp_project, verbose=False)
+    assert dest.read_text() == "# Clean Code v2\n"
+
+
+@pytest.mark.parametrize(
+    "header",
+    ["description: Plan a feature", "description: 'Plan a feature'\ntags: [a]"],
+)
+def test_workflow_prompt_description_and_args(tmp_path, header):
+    """Verify prompt keeps the workflow description (flat or full YAML) and maps $ARGUMENTS."""
+    from agent_bridge.converters._kiro_impl import convert_workflow_to_prompt
+
+    source = tmp_path / "plan.md"
+    source.write_text(f"---\n{header}\n---\n\n# Plan\n\nUse $ARGUMENTS here\n")
+    dest = tmp_path / "out" / "plan.md"
+
+    assert convert_workflow_to_prompt(source, dest) is True
+
+    content = read_or_fail(dest)
+    assert "description: Plan a feature\n" in content
+    assert "name: args" in content
+    assert content.endswith("# Plan\n\nUse {{args}} here\n")
@@ -3,64 +3,26 @@
 import pytest
 import json
 from pathlib import Path
-from agent_bridge.utils import _transform_mcp_config, install_mcp_for_ide
+from agent_bridge.utils import _transform_mcp_config, install_mcp_for_ide, read_json
 
 
-def test_copilot_mcp_uses_servers_key():
-    """Verify output has 'servers' not 'mcpServers'."""
-    config = {
-        "mcpServers": {
-            "github": {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-github"]}
-        }
-    }
-    
-    result = _transform_mcp_config(config, "copilot")
-    
-    assert "servers" in result
-    assert "mcpServers" not in result
-    assert "github" in result["servers"]
-
-
-def test_cursor_mcp_uses_mcpservers_key():
-    """Verify output keeps 'mcpServers'."""
-    config = {
-        "mcpServers": {
-            "github": {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-github"]}
-        }
-    }
-    
-    result = _transform_mcp_config(config, "cursor")
-    
-    assert "mcpServers" in result
-    assert "github" in result["mcpServers"]
-
-
-def test_kiro_mcp_uses_mcpservers_key():
-    """Verify Kiro keeps 'mcpServers'."""
-    config = {
-        "mcpServers": {
-            "github": {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-github"]}
-        }
+GITHUB_MCP_CONFIG = {
+    "mcpServers": {
+        "github": {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-github"]}
     }
-    
-    result = _transform_mcp_config(config, "kiro")
-    
-    assert "mcpServers" in result
-    assert "github" in result["mcpServers"]
+}
 
 
-def test_windsurf_mcp_uses_mcpservers_key():
-    """Verify Windsurf keeps 'mcpServers'."""
-    config = {
-        "mcpServers": {
-            "github": {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-github"]}
-        }
-    }
+@pytest.mark.parametrize(
+    "ide,expected_key",
+    [("copilot", "servers"), ("cursor", "mcpServers"), ("kiro", "mcpServers"), ("windsurf", "mcpServers")],
+)
+def test_mcp_uses_ide_servers_key(ide, expected_key):
+    """Verify each IDE gets its servers key ('servers' for Copilot, 'mcpServers' otherwise) and only that key."""
+    result = _transform_mcp_config(GITHUB_MCP_CONFIG, ide)
     
-    result = _transform_mcp_config(config, "windsurf")
-    
-    assert "mcpServers" in result
-    assert "github" in result["mcpServers"]
+    assert set(result) == {expected_key}
+    assert "github" in result[expected_key]
 
 
 def test_transform_preserves_server_content():
@@ -105,7 +67,7 @@ def test_install_mcp_copilot_writes_correct_format(tmp_project):
     vscode_mcp = dest_root / ".vscode" / "mcp.json"
     assert vscode_mcp.exists()
     
-    config = json.loads(vscode_mcp.read_text())
+    config = read_json(vscode_mcp)
     assert "servers" in config
     assert "mcpServers" not in config
     assert "github" in config["servers"]
@@ -124,6 +86,21 @@ def test_install_mcp_cursor_writes_correct_format(tmp_project):
     cursor_mcp = dest_root / ".cursor" / "mcp.json"
     assert cursor_mcp.exists()
     
-    config = json.loads(cursor_mcp.read_text())
+    config = read_json(cursor_mcp)
     assert "mcpServers" in config
     assert "github" in config["mcpServers"]
+
+
+def test_load_mcp_config_copies_and_reloads_on_change(tmp_project):
+    """Repeated loads return independent copies; edits on disk are picked up."""
+    from agent_bridge.utils import load_mcp_config
+
+    first = load_mcp_config(tmp_project)
+    first["mcpServers"].clear()
+    assert list(load_mcp_config(tmp_project)["mcpServers"]) == ["github", "filesystem"]
+
+    mcp_file = tmp_project / ".agent" / "mcp_config.json"
+    mcp_file.write_text(json.dumps({"mcpServers": {"only": {"command": "x"}}}))
+
+    reloaded = load_mcp_config(tmp_project)
+    assert list(reloaded["mcpServers"]) == ["only"]
@@ -5,8 +5,16 @@ from pathlib import Path
 from agent_bridge.vault.merger import merge_source_into_project, MergeStrategy
 
 
-def test_vault_only_replaces_all(tmp_path):
-    """Verify PROJECT_WINS doesn't apply in VAULT_ONLY mode."""
+@pytest.mark.parametrize(
+    "strategy,expected",
+    [
+        (MergeStrategy.VAULT_ONLY, "source content"),
+        (MergeStrategy.PROJECT_WINS, "dest content"),
+        (MergeStrategy.VAULT_WINS, "source content"),
+    ],
+)
+def test_conflicting_file_resolved_by_strategy(tmp_path, strategy, expected):
+    """Create the same file in source and dest; VAULT_ONLY/VAULT_WINS take source, PROJECT_WINS keeps dest."""
     source = tmp_path / "source" / ".agent"
     dest = tmp_path / "dest" / ".agent"
     
@@ -18,54 +26,10 @@ def test_vault_only_replaces_all(tmp_path):
     (dest / "agents").mkdir(parents=True)
     (dest / "agents" / "test.md").write_text("dest content")
     
-    # Merge with VAULT_ONLY
-    counts = merge_source_into_project(source, dest, MergeStrategy.VAULT_ONLY)
+    merge_source_into_project(source, dest, strategy)
     
-    # Should overwrite
     content = (dest / "agents" / "test.md").read_text()
-    assert content == "source content"
-
-
-def test_project_wins_keeps_existing(tmp_path):
-    """Create file in both source and dest, verify dest unchanged."""
-    source = tmp_path / "source" / ".agent"
-    dest = tmp_path / "dest" / ".agent"
-    
-    # Create source
-    (source / "agents").mkdir(parents=True)
-    (source / "agents" / "test.md").write_text("source content")
-    
-    # Create dest with existing file
-    (dest / "agents").mkdir(parents=True)
-    (dest / "agents" / "test.md").write_text("dest content")
-    
-    # Merge with PROJECT_WINS
-    counts = merge_source_into_project(source, dest, MergeStrategy.PROJECT_WINS)
-    
-    # Should keep dest
-    content = (dest / "agents" / "test.md").read_text()
-    assert content == "dest content"
-
-
-def test_vault_wins_overwrites(tmp_path):
-    """Create file in both, verify source wins."""
-    source = tmp_path / "source" / ".agent"
-    dest = tmp_path / "dest" / ".agent"
-    
-    # Create source
-    (source / "agents").mkdir(parents=True)
-    (source / "agents" / "test.md").write_text("source content")
-    
-    # Create dest with existing file
-    (dest / "agents").mkdir(parents=True)
-    (dest / "agents" / "test.md").write_text("dest content")
-    
-    # Merge with VAULT_WINS
-    counts = merge_source_into_project(source, dest, MergeStrategy.VAULT_WINS)
-    
-    # Should overwrite with source
-    content = (dest / "agents" / "test.md").read_text()
-    assert content == "source content"
+    assert content == expected
 
 
 def test_merge_creates_missing_dirs(tmp_path):
@@ -105,3 +69,53 @@ def test_merge_counts_correct(tmp_path):
     assert counts["agents"] == 2
     assert counts["skills"] == 1
     assert counts["workflows"] == 1
+
+
+def test_merge_keeps_executable_bit(tmp_path):
+    """Skill scripts stay executable even though timestamps are not copied."""
+    import os
+    import stat
+
+    source = tmp_path / "source" / ".agent"
+    dest = tmp_path / "dest" / ".agent"
+    script = source / "skills" / "demo" / "scripts" / "run.sh"
+    script.parent.mkdir(parents=True)
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+    os.utime(script, (1_000_000, 1_000_000))
+
+    merge_source_into_project(source, dest, MergeStrategy.PROJECT_WINS)
+
+    copied = dest / "skills" / "demo" / "scripts" / "run.sh"
+    assert copied.stat().st_mode & stat.S_IXUSR
+    assert copied.stat().st_mtime != 1_000_000
+
+
+def test_merge_reflink_fallback_tried_once(tmp_path, monkeypatch):
+    """Without reflink support the clone is attempted once, then plain copies are used."""
+    from agent_bridge.utils import filesystem
+
+    if filesystem.fcntl is None:
+        pytest.skip("no fcntl on this platform")
+
+    calls = []
+
+    def fake_ioctl(fd, request, arg):
+        calls.append(request)
+        raise OSError(95, "Operation not supported")
+
+    monkeypatch.setattr(filesystem.fcntl, "ioctl", fake_ioctl)
+
+    source = tmp_path / "source" / ".agent"
+    dest = tmp_path / "dest" / ".agent"
+    (source / "agents").mkdir(parents=True)
+    (source / "agents" / "a.md").write_text("A")
+    (source / "skills" / "demo").mkdir(parents=True)
+    (source / "skills" / "demo" / "SKILL.md").write_text("S")
+
+    merge_source_into_project(source, dest, MergeStrategy.PROJECT_WINS)
+
+    assert calls == [filesystem._FICLONE]
+    assert (dest / "agents" / "a.md").read_text() == "A"
+    assert (dest / "skills" / "demo" / "SKILL.md").read_text() == "S"
+    assert not (dest / "agents" / "a.md").samefile(source / "agents" / "a.md")
@@ -4,6 +4,7 @@ import json
 import pytest
 from pathlib import Path
 from agent_bridge.converters.opencode import OpenCodeConverter
+from agent_bridge.utils.filesystem import read_json
 
 
 def test_convert_agent_creates_md(tmp_project):
@@ -74,7 +75,7 @@ def test_opencode_json_created(tmp_project):
     config_file = dest_root / ".opencode" / "opencode.json"
     assert config_file.exists()
     
-    config = json.loads(config_file.read_text())
+    config = read_json(config_file)
     assert "$schema" in config
     assert "instructions" in config
     assert "default_agent" in config
@@ -120,7 +121,7 @@ def test_mcp_installation(tmp_project):
     
     # Check opencode.json has MCP embedded
     config_file = dest_root / ".opencode" / "opencode.json"
-    config = json.loads(config_file.read_text())
+    config = read_json(config_file)
     assert "mcp" in config or "mcpServers" in config
 
 
@@ -138,3 +139,45 @@ def test_clean_removes_opencode_dir(tmp_project):
     result = converter.clean(dest_root)
     assert result is True
     assert not (dest_root / ".opencode").exists()
+
+
+def test_workflow_conversion_uses_preread_bytes(tmp_path):
+    """Verify pre-read raw bytes are used instead of re-reading the source."""
+    from agent_bridge.converters._opencode_impl import convert_workflow_to_command
+
+    src = tmp_path / "missing.md"  # never read when raw bytes are supplied
+    dest = tmp_path / "out" / "plan.md"
+    raw = b"---\ndescription: x\n---\n> Plan the work\n\nBody\n"
+
+    assert convert_workflow_to_command(src, dest, raw=raw)
+    out = dest.read_text(encoding="utf-8")
+    assert "Plan the work" in out
+    assert "Body" in out
+
+
+def test_crlf_agent_frontmatter_replaced(tmp_project):
+    """Verify a CRLF agent source keeps one frontmatter block and LF endings."""
+    src = tmp_project / ".agent" / "agents" / "frontend-specialist.md"
+    src.write_bytes(b"---\r\ndescription: Custom desc\r\n---\r\n\r\n# Frontend Specialist\r\n")
+
+    OpenCodeConverter().convert(tmp_project, tmp_project, verbose=False)
+
+    out = (tmp_project / ".opencode" / "agents" / "frontend-specialist.md").read_bytes()
+    assert b"\r" not in out
+    assert out.count(b"---\n") == 2
+    assert b"Custom desc" not in out
+    assert out.endswith(b"---\n\n# Frontend Specialist\n")
+
+
+def test_crlf_workflow_frontmatter_replaced(tmp_project):
+    """Verify a CRLF workflow source keeps one frontmatter block and LF endings."""
+    src = tmp_project / ".agent" / "workflows" / "plan.md"
+    src.write_bytes(b"---\r\ntitle: Old plan\r\n---\r\n\r\n# Plan\r\n\r\n> Plan the work\r\n")
+
+    OpenCodeConverter().convert(tmp_project, tmp_project, verbose=False)
+
+    out = (tmp_project / ".opencode" / "commands" / "plan.md").read_bytes()
+    assert b"\r" not in out
+    assert out.count(b"---\n") == 2
+    assert b"Old plan" not in out
+    assert b"description: Plan the work\n" in out
@@ -1,6 +1,7 @@
 """Tests for vault sources (GitSource, LocalSource, BuiltinSource)."""
 
 import pytest
+import shutil
 import subprocess
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -39,9 +40,46 @@ def test_git_source_clone_new_repo(mock_run, tmp_path):
     assert mock_run.called
 
 
+@patch('subprocess.run')
+def test_git_source_clone_is_partial_and_sparse(mock_run, tmp_path):
+    """Verify a fresh clone skips blobs and checks out only vault content dirs."""
+    from agent_bridge.vault.sources import SPARSE_PATHS
+
+    mock_run.return_value = Mock(returncode=0, stderr=b"")
+    url = "https://github.com/test/repo.git"
+    cache_dir = tmp_path / "cache"
+
+    GitSource(url).sync(cache_dir, verbose=False)
+
+    repo = str(cache_dir)
+    commands = [call.args[0] for call in mock_run.call_args_list]
+    assert commands == [
+        ["git", "clone", "--depth", "1", "--filter=blob:none", "--no-checkout", "--", url, repo],
+        ["git", "-C", repo, "sparse-checkout", "set", "--cone", *SPARSE_PATHS],
+        ["git", "-C", repo, "checkout"],
+    ]
+
+
+@patch('subprocess.run')
+def test_git_source_clone_falls_back_to_full_checkout(mock_run, tmp_path):
+    """Verify a git without `sparse-checkout set --cone` still gets a full shallow checkout."""
+    def run(cmd, **kwargs):
+        if "sparse-checkout" in cmd:
+            raise subprocess.CalledProcessError(129, cmd, stderr=b"unknown option `cone'")
+        return Mock(returncode=0, stderr=b"")
+
+    mock_run.side_effect = run
+    cache_dir = tmp_path / "cache"
+
+    result = GitSource("https://github.com/test/repo.git").sync(cache_dir, verbose=False)
+
+    assert result["status"] == "ok"
+    assert mock_run.call_args_list[-1].args[0] == ["git", "-C", str(cache_dir), "checkout"]
+
+
 @patch('subprocess.run')
 def test_git_source_pull_existing_repo(mock_run, tmp_path):
-    """Verify GitSource pulls existing repository."""
+    """Verify GitSource updates an existing clone with a shallow fetch + reset."""
     mock_run.return_value = Mock(returncode=0, stderr=b"")
     
     source = GitSource("https://github.com/test/repo.git")
@@ -53,8 +91,11 @@ def test_git_source_pull_existing_repo(mock_run, tmp_path):
     
     result = source.sync(cache_dir, verbose=False)
     
-    # Should call git pull, not clone
-    assert any("pull" in str(call) for call in mock_run.call_args_list)
+    # Should fetch + reset the existing clone, not clone again
+    commands = [call.args[0] for call in mock_run.call_args_list]
+    assert ["git", "-C", str(cache_dir), "fetch", "--depth", "1", "origin", "HEAD"] in commands
+    assert ["git", "-C", str(cache_dir), "reset", "--hard", "FETCH_HEAD"] in commands
+    assert not any("clone" in cmd for cmd in commands)
 
 
 @patch('subprocess.run')
@@ -116,3 +157,31 @@ def test_builtin_source_validate():
     source = BuiltinSource()
     # Should always be valid if package is installed correctly
     assert source.validate() in [True, False]  # Depends on package structure
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_git_source_sparse_clone_keeps_nested_agent_subdir(tmp_path):
+    """Verify a vault with a custom agent_subdir gets that subdir in its sparse checkout."""
+    from agent_bridge.vault.manager import Vault
+
+    origin = tmp_path / "origin"
+    (origin / "kit" / ".agent" / "agents").mkdir(parents=True)
+    (origin / "kit" / ".agent" / "agents" / "a.md").write_text("# A")
+    (origin / "docs").mkdir()
+    (origin / "docs" / "big.md").write_text("docs")
+    git = ["git", "-C", str(origin), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run(["git", "init", "-q", str(origin)], check=True)
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+
+    vault = Vault(name="kit", url="https://example.com/kit.git", agent_subdir="kit/.agent")
+    source = vault.get_source()
+    source.url = origin.as_uri()  # file:// URLs are rejected by the constructor
+    cache_dir = tmp_path / "cache"
+
+    result = source.sync(cache_dir, verbose=False)
+
+    assert result["status"] == "ok"
+    assert result["agents"] == 1
+    assert (cache_dir / "kit" / ".agent" / "agents" / "a.md").exists()
+    assert not (cache_dir / "docs").exists()
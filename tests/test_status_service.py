@@ -4,9 +4,6 @@ import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
 
-# Import converters to trigger registration
-from agent_bridge import converters  # noqa: F401
-
 from agent_bridge.services.status_service import (
     collect_status,
     _count_agent_content,
@@ -16,11 +13,17 @@ from agent_bridge.services.status_service import (
 )
 
 
-def test_collect_status_with_full_project(tmp_project):
+@pytest.fixture(scope="module")
+def status_result(prototype_project):
+    """One collect_status() of the unmodified prototype project, shared by read-only tests."""
+    return collect_status(prototype_project)
+
+
+def test_collect_status_with_full_project(status_result, prototype_project):
     """Verify counts are correct with full project."""
-    status = collect_status(tmp_project)
+    status = status_result
     
-    assert status.project_path == tmp_project
+    assert status.project_path == prototype_project
     assert status.agent_dir_exists is True
     assert status.agent_counts["agents"] == 2
     assert status.agent_counts["skills"] == 1
@@ -39,9 +42,9 @@ def test_collect_status_empty_project(tmp_path):
     assert status.mcp_info is None
 
 
-def test_count_agent_content(tmp_project):
+def test_count_agent_content(prototype_project):
     """Verify correct counting of agents, skills, workflows, rules."""
-    agent_dir = tmp_project / ".agent"
+    agent_dir = prototype_project / ".agent"
     counts = _count_agent_content(agent_dir)
     
     assert counts["agents"] == 2
@@ -82,10 +85,24 @@ def test_ide_status_initialized(tmp_project):
     assert cursor_status.file_count > 0
 
 
-def test_ide_status_not_initialized(tmp_project):
-    """Verify initialized=False when dir doesn't exist."""
+def test_ide_status_counts_files_only(tmp_project):
+    """Verify file_count counts files in nested dirs, not the dirs themselves."""
+    rules_dir = tmp_project / ".cursor" / "rules"
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "a.mdc").write_text("a")
+    (rules_dir / "b.mdc").write_text("b")
+    (tmp_project / ".cursor" / "empty").mkdir()
+
     status = collect_status(tmp_project)
-    cursor_status = next((s for s in status.ide_statuses if s.name == "cursor"), None)
+    cursor_status = next(s for s in status.ide_statuses if s.name == "cursor")
+
+    assert cursor_status.initialized is True
+    assert cursor_status.file_count == 2
+
+
+def test_ide_status_not_initialized(status_result):
+    """Verify initialized=False when dir doesn't exist."""
+    cursor_status = next((s for s in status_result.ide_statuses if s.name == "cursor"), None)
     
     assert cursor_status is not None
     assert cursor_status.initialized is False
@@ -94,20 +111,22 @@ def test_ide_status_not_initialized(tmp_project):
 
 def test_ide_staleness(tmp_project):
     """Verify stale=True when .agent/ files are newer than IDE files."""
+    import os
     import time
     
+    now = time.time()
+
     # Create old .cursor/ file
     cursor_dir = tmp_project / ".cursor"
     cursor_dir.mkdir()
     old_file = cursor_dir / "old.md"
     old_file.write_text("old")
-    
-    # Wait a bit
-    time.sleep(0.1)
+    os.utime(old_file, (now - 10, now - 10))
     
     # Touch .agent/ file to make it newer
     agent_file = tmp_project / ".agent" / "agents" / "new.md"
     agent_file.write_text("new")
+    os.utime(agent_file, (now + 10, now + 10))
     
     status = collect_status(tmp_project)
     cursor_status = next((s for s in status.ide_statuses if s.name == "cursor"), None)
@@ -116,9 +135,9 @@ def test_ide_staleness(tmp_project):
     assert cursor_status.is_stale is True
 
 
-def test_mcp_info_exists(tmp_project):
+def test_mcp_info_exists(prototype_project):
     """Verify server names extracted correctly."""
-    agent_dir = tmp_project / ".agent"
+    agent_dir = prototype_project / ".agent"
     mcp_info = _get_mcp_info(agent_dir)
     
     assert mcp_info is not None
@@ -138,6 +157,24 @@ def test_mcp_info_missing(tmp_path):
     assert mcp_info is None
 
 
+def test_mcp_info_reparsed_after_edit(tmp_project):
+    """Verify cached server names follow edits to mcp_config.json."""
+    import json
+    import os
+
+    mcp_file = tmp_project / ".agent" / "mcp_config.json"
+    assert _get_mcp_info(mcp_file.parent).server_count == 2
+
+    mcp_file.write_text(json.dumps({"mcpServers": {"only": {"command": "x"}}}))
+    st = mcp_file.stat()
+    os.utime(mcp_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    mcp_info = _get_mcp_info(mcp_file.parent)
+    assert mcp_info.server_names == ["only"]
+    mcp_info.server_names.append("mutated")
+    assert _get_mcp_info(mcp_file.parent).server_names == ["only"]
+
+
 def test_relative_time():
     """Test human-readable time function with various deltas."""
     now = datetime.now()
@@ -161,22 +198,32 @@ def test_relative_time():
     assert _relative_time(None) == "never"
 
 
+def test_relative_time_uses_given_now():
+    """Explicit reference time is used instead of the wall clock."""
+    ref = datetime(2024, 1, 10, 12, 0, 0)
+
+    assert _relative_time(ref - timedelta(hours=3), ref) == "3h ago"
+    assert _relative_time(ref, ref) == "just now"
+
+
 def test_get_newest_mtime(tmp_project):
     """Verify newest mtime is found correctly."""
+    import os
     import time
     
     agent_dir = tmp_project / ".agent"
+    now = time.time()
     
     # Create old file
     old_file = agent_dir / "old.txt"
     old_file.write_text("old")
+    os.utime(old_file, (now - 10, now - 10))
     old_mtime = datetime.fromtimestamp(old_file.stat().st_mtime)
     
-    time.sleep(0.1)
-    
-    # Create new file
+    # Create new file, newer than everything tmp_project wrote
     new_file = agent_dir / "new.txt"
     new_file.write_text("new")
+    os.utime(new_file, (now + 10, now + 10))
     new_mtime = datetime.fromtimestamp(new_file.stat().st_mtime)
     
     newest = _get_newest_mtime(agent_dir)
@@ -184,3 +231,31 @@ def test_get_newest_mtime(tmp_project):
     assert newest is not None
     assert newest >= new_mtime
     assert newest >= old_mtime
+
+
+def test_vault_manager_reloaded_when_config_changes(tmp_path, monkeypatch):
+    """VaultManager is reused until vaults.json changes on disk or moves."""
+    import os
+
+    from agent_bridge.services import status_service
+    from agent_bridge.vault import manager
+
+    config = tmp_path / "vaults.json"
+    monkeypatch.setattr(manager, "VAULTS_CONFIG_FILE", config)
+    status_service._load_vault_manager.cache_clear()
+
+    first = status_service._get_vault_manager()
+    assert status_service._get_vault_manager() is first
+
+    config.write_text('{"vaults": []}', encoding="utf-8")
+    second = status_service._get_vault_manager()
+    assert second is not first
+    assert second.vaults == []
+
+    moved = tmp_path / "other" / "vaults.json"
+    moved.parent.mkdir()
+    moved.write_text('{"vaults": []}', encoding="utf-8")
+    os.utime(moved, ns=(config.stat().st_atime_ns, config.stat().st_mtime_ns))
+    monkeypatch.setattr(manager, "VAULTS_CONFIG_FILE", moved)
+    assert status_service._get_vault_manager() is not second
+    status_service._load_vault_manager.cache_clear()
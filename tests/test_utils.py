@@ -36,6 +36,19 @@ def test_strip_frontmatter_no_frontmatter():
     result = strip_frontmatter(content)
     
     assert result == content
+    # Fast path hands back the same object, no copy
+    assert result is content
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["---\na: 1\n---\n\n\nBody", "---\na: 1\nno close\n", "---\n\n---\nBody\n---\nb: 2\n---\n"],
+)
+def test_strip_frontmatter_matches_regex_sub(content):
+    """Anchored match + slice removes exactly what the regex substitution did."""
+    import re
+
+    assert strip_frontmatter(content) == re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
 
 
 def test_extract_yaml_frontmatter():
@@ -111,3 +124,259 @@ def test_validate_path_within_project_no_project_root(tmp_path):
     # This should not raise
     result = validate_path_within_project(test_file)
     assert isinstance(result, bool)
+
+
+def test_validate_path_within_project_sibling_prefix(tmp_path):
+    """A sibling dir sharing the root's name prefix is not inside the project."""
+    project = tmp_path / "proj"
+    project.mkdir()
+
+    assert validate_path_within_project(tmp_path / "proj-evil" / "x", project) is False
+    assert validate_path_within_project(project / "x", project) is True
+
+
+def test_read_files_parallel(tmp_path):
+    """Verify bytes returned per path, None for unreadable files."""
+    from agent_bridge.utils import read_files_parallel
+
+    files = []
+    for i in range(5):
+        f = tmp_path / f"f{i}.md"
+        f.write_bytes(f"content {i}".encode())
+        files.append(f)
+    missing = tmp_path / "missing.md"
+
+    result = read_files_parallel(files + [missing])
+
+    assert result[files[3]] == b"content 3"
+    assert result[missing] is None
+
+
+def test_opencode_mcp_source_sees_agent_dir_created_later(tmp_path):
+    """The MCP source lookup is not memoized, so a later-created .agent/ is picked up."""
+    from agent_bridge.converters._opencode_impl import _resolve_mcp_src
+
+    assert _resolve_mcp_src(tmp_path) != tmp_path
+    (tmp_path / ".agent").mkdir()
+    assert _resolve_mcp_src(tmp_path) == tmp_path
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "---\na: 1\n---\n\nBody\n",
+        "---\na: 1\n---Body",
+        "---\n\n---\nBody",
+        "---\n---\nBody",
+        "---\na: 1\nno close\n",
+        "No frontmatter\n---\na: 1\n---\n",
+        "---\na: 1\n---\n---\nb: 2\n---\nBody",
+    ],
+)
+def test_frontmatter_split_matches_regex(content):
+    import re
+
+    from agent_bridge.core.frontmatter import FrontmatterParser
+
+    match = re.match(r"^---\n(.*?)\n---\n*", content, re.DOTALL)
+    expected = (match.group(1), content[match.end():]) if match else (None, content)
+    assert FrontmatterParser.split(content) == expected
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        "name: test\ndescription: test desc",
+        "name: a, b [c] {d} 'e' \"f\"  \ntrigger: model_decision\n\nx-y_z: Mixed Case",
+        "name: Tab\there",
+        "name: x\nname: y",
+        "enabled: yes",
+        "On: x",
+        "count: 3",
+        "version: 1.0",
+        "date: 2024-01-01",
+        "tools: [a, b]",
+        "description: Use when: reviewing",
+        "name: x # comment",
+        "name: 'quoted'",
+        "name: ~",
+        "empty:",
+        "nested:\n  key: value",
+        "- item",
+        "# only comment",
+        "",
+    ],
+)
+def test_parse_flat_yaml_matches_safe_load(block):
+    """The flat key: value fast path agrees with the YAML loader or defers to it."""
+    import yaml
+
+    from agent_bridge.core.frontmatter import FrontmatterParser, YamlLoader, parse_flat_yaml
+
+    try:
+        expected = yaml.load(block, Loader=YamlLoader)
+    except yaml.YAMLError:
+        expected = None
+    flat = parse_flat_yaml(block)
+    if flat is not None:
+        assert flat == expected
+    metadata, _ = FrontmatterParser.extract(f"---\n{block}\n---\nBody")
+    assert metadata == (expected if isinstance(expected, dict) else None)
+
+
+@pytest.mark.parametrize("chunk_size", [5, 8192])
+def test_frontmatter_read_head_stops_at_block(tmp_path, chunk_size):
+    """read_head yields the same frontmatter as a full read, for any chunk size."""
+    from agent_bridge.core.frontmatter import FrontmatterParser
+
+    path = tmp_path / "rule.mdc"
+    content = "---\r\ndescription: Tiếng Việt\r\nglobs: '*.py'\r\n---\r\n\n" + "body\n" * 5000
+    path.write_bytes(content.encode("utf-8"))
+    head = FrontmatterParser.read_head(path, chunk_size=chunk_size)
+
+    assert head == "---\ndescription: Tiếng Việt\nglobs: '*.py'\n---\n"
+    assert FrontmatterParser.extract(head)[0] == FrontmatterParser.extract(path.read_text(encoding="utf-8"))[0]
+
+    path.write_text("No frontmatter\n---\na: 1\n---\n", encoding="utf-8")
+    assert FrontmatterParser.read_head(path, chunk_size=chunk_size) == ""
+    path.write_text("---\na: 1\nno close\n", encoding="utf-8")
+    assert FrontmatterParser.read_head(path, chunk_size=chunk_size) == ""
+
+
+def test_read_write_json_roundtrip(tmp_path):
+    from agent_bridge.utils import read_json, write_json
+
+    path = tmp_path / "config.json"
+    data = {"name": "Tiếng Việt", "servers": {"a": {"args": ["-y", 1]}}}
+    write_json(path, data)
+
+    assert read_json(path) == data
+    assert "Tiếng Việt" in path.read_text(encoding="utf-8")
+
+
+def test_is_nonempty_dir(tmp_path):
+    from agent_bridge.utils import is_nonempty_dir
+
+    assert is_nonempty_dir(tmp_path / "missing") is False
+    assert is_nonempty_dir(tmp_path) is False
+    (tmp_path / "sub").mkdir()
+    assert is_nonempty_dir(tmp_path) is True
+    (tmp_path / "f.txt").write_text("x")
+    assert is_nonempty_dir(tmp_path / "f.txt") is False
+
+
+def test_copy_tree_nested(tmp_path):
+    from agent_bridge.utils import copy_tree
+
+    src = tmp_path / "src"
+    (src / "a" / "b").mkdir(parents=True)
+    (src / "top.md").write_text("top")
+    (src / "a" / "b" / "deep.md").write_text("deep")
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    (dest / "keep.md").write_text("keep")
+
+    copy_tree(src, dest)
+
+    assert (dest / "top.md").read_text() == "top"
+    assert (dest / "a" / "b" / "deep.md").read_text() == "deep"
+    assert (dest / "keep.md").exists()
+
+
+def test_resolve_source_root_agent_dir_and_parent(tmp_path, monkeypatch):
+    """Both '.agent' and its parent resolve to the project root."""
+    from agent_bridge.utils import resolve_source_root
+
+    (tmp_path / ".agent").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    assert resolve_source_root(".agent") == tmp_path.resolve()
+    assert resolve_source_root(str(tmp_path)) == tmp_path.resolve()
+
+
+def test_read_text_prefix(tmp_path):
+    """Returns the first N characters (not bytes), whole file if shorter."""
+    from agent_bridge.utils import read_text_prefix
+
+    f = tmp_path / "a.md"
+    f.write_text("Tiếng Việt " * 10, encoding="utf-8")
+
+    assert read_text_prefix(f, 5) == "Tiếng"
+    assert read_text_prefix(f, 10_000) == "Tiếng Việt " * 10
+
+
+def test_scan_md_files(tmp_path):
+    """Only *.md files are listed; missing dirs give an empty list."""
+    from agent_bridge.utils import scan_dir, scan_md_files
+
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "dir.md").mkdir()
+
+    assert [p.name for p in scan_md_files(tmp_path)] == ["a.md"]
+    assert scan_md_files(tmp_path / "missing") == []
+    assert scan_dir(tmp_path / "missing") == []
+
+
+def test_mirror_tree_copies_only_changes(tmp_path):
+    """Second mirror of an unchanged tree copies nothing; stale entries are removed."""
+    from agent_bridge.utils import mirror_tree
+
+    src = tmp_path / "src"
+    (src / "skills" / "a").mkdir(parents=True)
+    (src / "agents.md").write_text("one")
+    (src / "skills" / "a" / "SKILL.md").write_text("skill")
+    dest = tmp_path / "dest"
+    (dest / "old").mkdir(parents=True)
+    (dest / "stale.md").write_text("x")
+
+    assert mirror_tree(src, dest) == 2
+    assert not (dest / "old").exists()
+    assert not (dest / "stale.md").exists()
+    assert (dest / "skills" / "a" / "SKILL.md").read_text() == "skill"
+
+    assert mirror_tree(src, dest) == 0
+
+    (src / "agents.md").write_text("changed")
+    assert mirror_tree(src, dest) == 1
+    assert (dest / "agents.md").read_text() == "changed"
+
+
+def test_dumps_json_matches_indented_stdlib_layout():
+    """dumps_json output parses back and keeps the indent=2 / non-ASCII layout."""
+    import json
+
+    from agent_bridge.utils import dumps_json
+
+    data = {"name": "Tiếng Việt", "tools": ["read", "@github"], "nested": {"empty": []}}
+    out = dumps_json(data)
+
+    assert isinstance(out, bytes)
+    assert json.loads(out) == data
+    assert out.decode("utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_validate_path_within_project_relative_root_follows_cwd(tmp_path, monkeypatch):
+    """A relative project root is resolved against the current cwd on every call."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert validate_path_within_project(first / "a.md", Path("."))
+    monkeypatch.chdir(second)
+    assert not validate_path_within_project(first / "a.md", Path("."))
+    assert validate_path_within_project(second / "a.md", Path("."))
+
+
+def test_write_output_creates_missing_parent(tmp_path):
+    """write_output writes UTF-8 and creates the parent directory only when needed."""
+    from agent_bridge.utils import write_output
+
+    dest = tmp_path / "a" / "b" / "rule.md"
+    write_output(dest, "Tiếng Việt\n")
+    assert dest.read_bytes() == "Tiếng Việt\n".encode()
+
+    write_output(dest, "short")
+    assert dest.read_text(encoding="utf-8") == "short"
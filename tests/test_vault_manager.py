@@ -0,0 +1,80 @@
+"""Tests for VaultManager config loading, sync and merge."""
+
+import json
+from pathlib import Path
+
+from agent_bridge.vault import manager
+from agent_bridge.vault.manager import VaultManager
+
+
+def _use_config(monkeypatch, tmp_path: Path) -> Path:
+    config = tmp_path / "vaults.json"
+    monkeypatch.setattr(manager, "VAULTS_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(manager, "VAULTS_CONFIG_FILE", config)
+    monkeypatch.setattr(manager, "MERGE_STATE_FILE", tmp_path / "merge_state.json")
+    return config
+
+
+def test_config_not_read_until_first_access(tmp_path, monkeypatch):
+    """Constructing a VaultManager does no config I/O."""
+    config = _use_config(monkeypatch, tmp_path)
+    config.write_text("{not json", encoding="utf-8")
+
+    vm = VaultManager()
+    assert vm._loaded is None
+
+    # Invalid config falls back to the builtin default on first access
+    assert [v.name for v in vm.vaults] == ["builtin-starter"]
+
+
+def test_add_is_visible_to_new_managers(tmp_path, monkeypatch):
+    """Parsed config is shared but refreshed when vaults.json changes."""
+    config = _use_config(monkeypatch, tmp_path)
+    config.write_text(json.dumps({"vaults": [{"name": "a", "url": "/tmp/a"}]}), encoding="utf-8")
+
+    first = VaultManager()
+    assert [v.name for v in first.vaults] == ["a"]
+
+    first.add("b", "/tmp/b")
+
+    assert sorted(v.name for v in VaultManager().vaults) == ["a", "b"]
+
+
+def test_sync_multiple_vaults_keeps_priority_order(tmp_path, monkeypatch):
+    """Parallel sync returns one result per vault, in priority order."""
+    config = _use_config(monkeypatch, tmp_path)
+    vaults = [{"name": n, "url": f"/tmp/{n}", "priority": p} for n, p in [("c", 30), ("a", 10), ("b", 20)]]
+    config.write_text(json.dumps({"vaults": vaults}), encoding="utf-8")
+    monkeypatch.setattr(manager, "_sync_vault", lambda v: {"status": "ok", "vault": v.name})
+
+    results = VaultManager().sync(verbose=False)
+
+    assert list(results) == ["a", "b", "c"]
+    assert all(r["vault"] == name for name, r in results.items())
+
+
+def test_merge_skips_unchanged_subdirs(tmp_path, monkeypatch):
+    """A repeat merge with no vault/project changes lists nothing; a deleted file comes back."""
+    vault_dir = tmp_path / "vault" / ".agent"
+    (vault_dir / "agents").mkdir(parents=True)
+    (vault_dir / "agents" / "a.md").write_text("a")
+    config = _use_config(monkeypatch, tmp_path)
+    config.write_text(json.dumps({"vaults": [{"name": "v", "url": str(tmp_path / "vault")}]}), encoding="utf-8")
+    project = tmp_path / "project" / ".agent"
+
+    assert VaultManager().merge_to_project(project, verbose=False)["agents"] == 1
+
+    listed = []
+    real_merge = manager.merge_source_into_project
+
+    def spy(src, dst, strategy, skip_subdirs=()):
+        listed.append(sorted(set(manager.MERGE_SUBDIRS) - set(skip_subdirs)))
+        return real_merge(src, dst, strategy, skip_subdirs=skip_subdirs)
+
+    monkeypatch.setattr(manager, "merge_source_into_project", spy)
+    VaultManager().merge_to_project(project, verbose=False)
+    assert "agents" not in listed[-1]
+
+    (project / "agents" / "a.md").unlink()
+    assert VaultManager().merge_to_project(project, verbose=False)["agents"] == 1
+    assert (project / "agents" / "a.md").read_text() == "a"
@@ -60,6 +60,23 @@ def test_truncation_for_long_content(tmp_project):
     assert "(truncated to fit Windsurf rule limit)" in content
 
 
+def test_truncated_skill_stops_merging_extra_files(tmp_path):
+    """Extra .md files past the rule limit are not read or appended."""
+    from agent_bridge.converters._windsurf_impl import convert_skill_to_windsurf_rule
+
+    skill_dir = tmp_path / "big-skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text("# Big\n\n" + "x" * 15000, encoding="utf-8")
+    (skill_dir / "extra.md").write_text("EXTRA", encoding="utf-8")
+    dest = tmp_path / "out" / "big-skill.md"
+
+    assert convert_skill_to_windsurf_rule(skill_dir, dest) is True
+
+    content = dest.read_text(encoding="utf-8")
+    assert len(content) == 12000
+    assert "EXTRA" not in content
+
+
 def test_legacy_windsurfrules_created(tmp_project):
     """Verify .windsurfrules root file is created."""
     converter = WindsurfConverter()
@@ -72,6 +89,21 @@ def test_legacy_windsurfrules_created(tmp_project):
     assert legacy_file.exists()
 
 
+def test_legacy_windsurfrules_layout(tmp_path):
+    """Title, then each section separated by one blank line, single trailing newline."""
+    from agent_bridge.converters._windsurf_impl import create_windsurfrules
+
+    skill = tmp_path / ".agent" / "skills" / "clean-code"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: clean-code\n---\n\nKeep it clean.\n", encoding="utf-8")
+    (tmp_path / "AGENTS.md").write_text("Agents overview\n", encoding="utf-8")
+
+    assert create_windsurfrules(tmp_path, tmp_path) is True
+
+    output = (tmp_path / ".windsurfrules").read_text(encoding="utf-8")
+    assert output == "# Project Rules for Windsurf\n\nKeep it clean.\n\nAgents overview\n"
+
+
 def test_convert_to_windsurf_full(tmp_project):
     """End-to-end with tmp_project."""
     converter = WindsurfConverter()
@@ -101,3 +133,116 @@ def test_clean_removes_windsurf_dir(tmp_project):
     assert result is True
     assert not (dest_root / ".windsurf").exists()
     assert not (dest_root / ".windsurfrules").exists()
+
+
+def test_skill_rule_reflects_edited_source(tmp_path):
+    """Cached skill bodies are refreshed when the source file changes."""
+    from agent_bridge.converters._windsurf_impl import convert_skill_to_windsurf_rule
+
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    dest = tmp_path / "out" / "my-skill.md"
+
+    skill_md.write_text("---\nname: my-skill\n---\n\nFirst version\n", encoding="utf-8")
+    assert convert_skill_to_windsurf_rule(skill_dir, dest) is True
+    assert "First version" in dest.read_text(encoding="utf-8")
+
+    skill_md.write_text("---\nname: my-skill\n---\n\nSecond, longer version\n", encoding="utf-8")
+    assert convert_skill_to_windsurf_rule(skill_dir, dest) is True
+    content = dest.read_text(encoding="utf-8")
+    assert "Second, longer version" in content
+    assert "First version" not in content
+
+
+def test_workflow_steps_numbered_and_header_fallback(tmp_path):
+    """Numbered steps win; '## Step N:' headers are the fallback."""
+    from agent_bridge.converters._windsurf_impl import convert_workflow_to_windsurf
+
+    numbered = tmp_path / "deploy.md"
+    numbered.write_text("# Deploy\n\n1. Build\n2. Ship\n", encoding="utf-8")
+    headers = tmp_path / "review.md"
+    headers.write_text("# Review\n\n## Step 1: Read diff\n\n## Step 2: Comment\n", encoding="utf-8")
+
+    assert convert_workflow_to_windsurf(numbered, tmp_path / "out" / "deploy.md")
+    assert convert_workflow_to_windsurf(headers, tmp_path / "out" / "review.md")
+
+    assert "## Steps\n\n1. Build\n2. Ship\n" in (tmp_path / "out" / "deploy.md").read_text(encoding="utf-8")
+    assert "## Steps\n\n1. Read diff\n2. Comment\n" in (tmp_path / "out" / "review.md").read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "# Title\n\nBody\n",
+        "# Title",
+        "#  Spaced title\n\n\nBody",
+        "#\n\nNext line\nBody",
+        "## Sub heading\nBody",
+        "#NoSpace\nBody",
+        "Body only\n# Late heading\n",
+        "# \t ",
+        "#",
+        "",
+    ],
+)
+def test_strip_leading_h1_matches_regex(text):
+    """String-based H1 strip gives the same result as the original regex."""
+    from agent_bridge.converters._windsurf_impl import _RE_H1, _strip_leading_h1
+
+    assert _strip_leading_h1(text) == _RE_H1.sub("", text)
+
+
+@pytest.mark.parametrize("body_len", [0, 100, 11000, 11999, 12000, 20000])
+@pytest.mark.parametrize("header_len", [10, 11990, 13000])
+def test_build_windsurf_output_matches_truncate(header_len, body_len):
+    """Pre-slicing the body gives the same result as truncating the full output."""
+    from agent_bridge.converters._windsurf_impl import _build_windsurf_output, _truncate_windsurf_output
+
+    header, body = "h" * header_len, "b" * body_len
+
+    assert _build_windsurf_output(header, body) == _truncate_windsurf_output(f"{header}{body}\n")
+
+
+def test_rule_header_model_mode():
+    """Model-decision header layout (fast path) is unchanged."""
+    from agent_bridge.converters._windsurf_impl import generate_windsurf_rule_header
+
+    header = generate_windsurf_rule_header("Backend Specialist", "model", "Backend tasks", [])
+
+    assert header == "# Backend Specialist\n\n**Activation:** Model Decision\n**Description:** Backend tasks\n\n---\n"
+
+
+def test_windsurfrules_reuses_converted_skill_body(tmp_project, monkeypatch):
+    """Always-on SKILL.md is read once per run, shared by rules and .windsurfrules."""
+    from agent_bridge.converters import _windsurf_impl
+
+    reads = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    _windsurf_impl.convert_to_windsurf(tmp_project, tmp_project, verbose=False)
+
+    clean_code = tmp_project / ".agent" / "skills" / "clean-code" / "SKILL.md"
+    assert reads.count(clean_code) == 1
+
+
+def test_same_size_source_edit_picked_up_on_next_run(tmp_project):
+    """A same-size edit that keeps the old mtime is not served from an earlier run."""
+    import os
+
+    from agent_bridge.converters import _windsurf_impl
+
+    skill_file = tmp_project / ".agent" / "skills" / "clean-code" / "SKILL.md"
+    _windsurf_impl.convert_to_windsurf(tmp_project, tmp_project, verbose=False)
+
+    st = skill_file.stat()
+    skill_file.write_text(skill_file.read_text().replace("small", "SMALL"))
+    os.utime(skill_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    _windsurf_impl.convert_to_windsurf(tmp_project, tmp_project, verbose=False)
+
+    assert "Keep functions SMALL" in (tmp_project / ".windsurfrules").read_text(encoding="utf-8")